@@ -0,0 +1,62 @@
+"""add task query indexes
+
+Revision ID: 3f9c1a7d2b10
+Revises:
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c1a7d2b10'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# status는 Enum 이름('TODO' | 'DOING' | 'DONE')으로 저장됨
+OPEN_TASKS = sa.text("status != 'DONE'")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY는 트랜잭션 밖에서만 가능 → 운영 중에도 쓰기 잠금 없이 생성
+    with op.get_context().autocommit_block():
+        # 목록 조회 / 커서 페이지네이션: WHERE user_id [AND status] ORDER BY status, order, created_at, id
+        op.create_index(
+            "ix_tasks_user_status_order",
+            "tasks",
+            ["user_id", "status", "order", "created_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # 오늘 할 일 / 마감 지난 개수: WHERE user_id AND status != DONE AND due_date ...
+        op.create_index(
+            "ix_tasks_user_due_open",
+            "tasks",
+            ["user_id", "due_date"],
+            postgresql_where=OPEN_TASKS,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+    # daily_notes는 unique_user_date (user_id, date)가 월/범위 조회 인덱스 역할을 함
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tasks_user_due_open",
+            table_name="tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_tasks_user_status_order",
+            table_name="tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,63 @@
+"""add task search vector
+
+Revision ID: 8b2e4c6a1d37
+Revises: 3f9c1a7d2b10
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2e4c6a1d37'
+down_revision: Union[str, Sequence[str], None] = '3f9c1a7d2b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # tsvector / GIN 은 PostgreSQL 전용 (그 외 DB는 ILIKE 검색으로 동작)
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    # GENERATED 컬럼 → INSERT/UPDATE 시 DB가 자동으로 갱신 (트리거 불필요)
+    # 'simple' 설정: 형태소 분석 없이 토큰화 → 한글 토큰도 그대로 색인
+    op.execute(
+        """
+        ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector(
+                'simple'::regconfig,
+                coalesce(title, '') || ' ' || coalesce(description, '')
+            )
+        ) STORED
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_search_vector",
+            "tasks",
+            ["search_vector"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tasks_search_vector",
+            table_name="tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("tasks", "search_vector")
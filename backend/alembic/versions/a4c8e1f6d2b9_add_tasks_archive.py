@@ -0,0 +1,112 @@
+"""add tasks archive
+
+Revision ID: a4c8e1f6d2b9
+Revises: f3a9d2e5b7c4
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c8e1f6d2b9'
+down_revision: Union[str, Sequence[str], None] = 'f3a9d2e5b7c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# tasks 와 같은 Enum 타입 재사용 (이미 있음)
+TASK_STATUS = postgresql.ENUM("TODO", "DOING", "DONE", name="taskstatus", create_type=False)
+TASK_PRIORITY = postgresql.ENUM("HIGH", "MEDIUM", "LOW", name="taskpriority", create_type=False)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    is_postgresql = op.get_context().dialect.name == "postgresql"
+    status_type = TASK_STATUS if is_postgresql else sa.Enum("TODO", "DOING", "DONE", name="taskstatus")
+    priority_type = TASK_PRIORITY if is_postgresql else sa.Enum("HIGH", "MEDIUM", "LOW", name="taskpriority")
+
+    op.create_table(
+        "tasks_archive",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("project_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("title", sa.String(length=255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("status", status_type, nullable=False),
+        sa.Column("priority", priority_type, nullable=False),
+        sa.Column("due_date", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("order", sa.BigInteger(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "archived_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+        if_not_exists=True,
+    )
+    # 새 테이블이라 CONCURRENTLY 불필요
+    op.create_index(
+        "ix_tasks_archive_user_status_order",
+        "tasks_archive",
+        ["user_id", "status", "order", "created_at", "id"],
+        if_not_exists=True,
+    )
+    op.create_index("ix_tasks_archive_project", "tasks_archive", ["project_id"], if_not_exists=True)
+
+    # 보관 대상 찾기: WHERE status = DONE AND completed_at < 기준 ORDER BY completed_at
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_done_completed",
+            "tasks",
+            ["completed_at"],
+            postgresql_where=sa.text("status = 'DONE'"),
+            sqlite_where=sa.text("status = 'DONE'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # 보관된 프로젝트의 태스크 찾기: WHERE project_id IN (SELECT id FROM projects WHERE archived IS TRUE)
+        op.create_index(
+            "ix_projects_archived",
+            "projects",
+            ["id"],
+            postgresql_where=sa.text("archived IS TRUE"),
+            sqlite_where=sa.text("archived IS 1"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 보관된 태스크를 먼저 tasks 로 되돌림 (그대로 지우면 유실)
+    # → 프로젝트 개수는 이후 repair_project_counts.py 로 재계산
+    op.execute(
+        'INSERT INTO tasks (id, user_id, project_id, title, description, status, priority, '
+        'due_date, completed_at, "order", created_at, updated_at) '
+        'SELECT id, user_id, project_id, title, description, status, priority, '
+        'due_date, completed_at, "order", created_at, CURRENT_TIMESTAMP FROM tasks_archive'
+    )
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_projects_archived",
+            table_name="projects",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_tasks_done_completed",
+            table_name="tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_table("tasks_archive", if_exists=True)
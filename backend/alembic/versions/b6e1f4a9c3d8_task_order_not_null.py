@@ -0,0 +1,57 @@
+"""task order not null
+
+Revision ID: b6e1f4a9c3d8
+Revises: c9d4e2a7f1b3
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e1f4a9c3d8'
+down_revision: Union[str, Sequence[str], None] = 'c9d4e2a7f1b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# app.services.task_service.ORDER_GAP 과 같은 값
+ORDER_GAP = 1 << 16
+
+# 커서 정렬 키 (status, order, created_at, id) 를 쓰는 테이블
+TABLES = ["tasks", "tasks_archive"]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        # order 가 NULL 이면 (a, b) > (x, NULL) 비교가 NULL → 커서 페이지에서 행이 빠짐
+        # PostgreSQL 정렬(NULL 이 마지막)과 같게 (유저, 상태) 그룹의 맨 뒤로 채움
+        op.execute(
+            f"""
+            UPDATE {table} SET "order" = COALESCE((
+                SELECT MAX(t."order") FROM {table} AS t
+                WHERE t.user_id = {table}.user_id AND t.status = {table}.status
+            ), 0) + {ORDER_GAP}
+            WHERE "order" IS NULL
+            """
+        )
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                "order",
+                existing_type=sa.BigInteger(),
+                nullable=False,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(TABLES):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                "order",
+                existing_type=sa.BigInteger(),
+                nullable=True,
+            )
@@ -0,0 +1,73 @@
+"""task order bigint gap ranking
+
+Revision ID: c4d7e9f0a2b5
+Revises: 8b2e4c6a1d37
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d7e9f0a2b5'
+down_revision: Union[str, Sequence[str], None] = '8b2e4c6a1d37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# app.services.task_service.ORDER_GAP 과 같은 값
+ORDER_GAP = 1 << 16
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 간격 기반 순서 → 정수 범위 확장
+    with op.batch_alter_table("tasks") as batch_op:
+        batch_op.alter_column(
+            "order",
+            existing_type=sa.Integer(),
+            type_=sa.BigInteger(),
+            existing_nullable=True,
+        )
+
+    # 기존 순서(order, created_at, id)를 유지한 채 (유저, 상태)별로 간격을 두고 다시 매김
+    op.execute(
+        f"""
+        UPDATE tasks SET "order" = ranked.new_order
+        FROM (
+            SELECT id, row_number() OVER (
+                PARTITION BY user_id, status
+                ORDER BY "order", created_at, id
+            ) * {ORDER_GAP} AS new_order
+            FROM tasks
+        ) AS ranked
+        WHERE tasks.id = ranked.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Integer 범위로 되돌리기 위해 1, 2, 3 ... 으로 다시 매김
+    op.execute(
+        """
+        UPDATE tasks SET "order" = ranked.new_order
+        FROM (
+            SELECT id, row_number() OVER (
+                PARTITION BY user_id, status
+                ORDER BY "order", created_at, id
+            ) AS new_order
+            FROM tasks
+        ) AS ranked
+        WHERE tasks.id = ranked.id
+        """
+    )
+    with op.batch_alter_table("tasks") as batch_op:
+        batch_op.alter_column(
+            "order",
+            existing_type=sa.BigInteger(),
+            type_=sa.Integer(),
+            existing_nullable=True,
+        )
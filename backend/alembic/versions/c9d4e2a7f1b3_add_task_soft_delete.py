@@ -0,0 +1,99 @@
+"""add task soft delete
+
+Revision ID: c9d4e2a7f1b3
+Revises: a4c8e1f6d2b9
+Create Date: 2026-10-18 23:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9d4e2a7f1b3'
+down_revision: Union[str, Sequence[str], None] = 'a4c8e1f6d2b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 조회용 인덱스: (이름, 컬럼, 기존 조건, 삭제된 태스크를 뺀 조건)
+LIVE_INDEXES = [
+    (
+        "ix_tasks_user_status_order",
+        ["user_id", "status", "order", "created_at", "id"],
+        None,
+        "deleted_at IS NULL",
+    ),
+    ("ix_tasks_user_due_open", ["user_id", "due_date"], "status != 'DONE'", "status != 'DONE' AND deleted_at IS NULL"),
+    ("ix_tasks_user_updated", ["user_id", "updated_at", "id"], None, "deleted_at IS NULL"),
+    ("ix_tasks_done_completed", ["completed_at"], "status = 'DONE'", "status = 'DONE' AND deleted_at IS NULL"),
+]
+
+
+def _replace_index(name: str, columns: list, where: Union[str, None]) -> None:
+    """
+    인덱스 조건 변경 (autocommit_block 안에서)
+    - PostgreSQL: 새 인덱스를 CONCURRENTLY 로 만든 뒤 기존 것과 교체 → 인덱스 없는 순간이 없음
+    - SQLite: 삭제 후 다시 생성
+    """
+    where_clause = sa.text(where) if where else None
+    if op.get_context().dialect.name != "postgresql":
+        op.drop_index(name, table_name="tasks", if_exists=True)
+        op.create_index(name, "tasks", columns, sqlite_where=where_clause)
+        return
+    op.create_index(
+        f"{name}_new",
+        "tasks",
+        columns,
+        postgresql_where=where_clause,
+        postgresql_concurrently=True,
+        if_not_exists=True,
+    )
+    op.drop_index(name, table_name="tasks", postgresql_concurrently=True, if_exists=True)
+    op.execute(f"ALTER INDEX {name}_new RENAME TO {name}")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # NULL 허용 + 기본값 없음 → 테이블 다시 쓰기 없이 컬럼만 추가
+    op.add_column("tasks", sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True))
+
+    with op.get_context().autocommit_block():
+        for name, columns, _, where in LIVE_INDEXES:
+            _replace_index(name, columns, where)
+        # 완전 삭제 대상 찾기: WHERE deleted_at < 기준 ORDER BY deleted_at (삭제된 태스크만 담음)
+        op.create_index(
+            "ix_tasks_deleted",
+            "tasks",
+            ["deleted_at"],
+            postgresql_where=sa.text("deleted_at IS NOT NULL"),
+            sqlite_where=sa.text("deleted_at IS NOT NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # 오래된 삭제 기록 정리 (삭제할 때마다 하던 정리를 purge_tasks.py 로 옮김)
+        op.create_index(
+            "ix_task_tombstones_deleted",
+            "task_tombstones",
+            ["deleted_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 삭제 대기 중인 태스크는 완전 삭제 (컬럼이 없어지면 다시 보이게 되므로, 삭제 기록은 이미 있음)
+    op.execute("DELETE FROM tasks WHERE deleted_at IS NOT NULL")
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_task_tombstones_deleted",
+            table_name="task_tombstones",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index("ix_tasks_deleted", table_name="tasks", postgresql_concurrently=True, if_exists=True)
+        for name, columns, where, _ in LIVE_INDEXES:
+            _replace_index(name, columns, where)
+    op.drop_column("tasks", "deleted_at")
@@ -0,0 +1,84 @@
+"""add task sync tombstones
+
+Revision ID: d5a8f1b3c6e9
+Revises: c4d7e9f0a2b5
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a8f1b3c6e9'
+down_revision: Union[str, Sequence[str], None] = 'c4d7e9f0a2b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 델타 동기화 워터마크: 생성 시에도 updated_at 채움 (기존 행은 created_at으로)
+    op.execute("UPDATE tasks SET updated_at = COALESCE(created_at, CURRENT_TIMESTAMP) WHERE updated_at IS NULL")
+    with op.batch_alter_table("tasks") as batch_op:
+        batch_op.alter_column(
+            "updated_at",
+            existing_type=sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            existing_nullable=True,
+        )
+
+    # 삭제된 태스크 id (tombstone)
+    op.create_table(
+        "task_tombstones",
+        sa.Column("task_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "deleted_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("task_id"),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_task_tombstones_user_deleted",
+        "task_tombstones",
+        ["user_id", "deleted_at", "task_id"],
+        if_not_exists=True,
+    )
+
+    # 변경분 조회: WHERE user_id AND (updated_at, id) > 워터마크 ORDER BY updated_at, id
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_user_updated",
+            "tasks",
+            ["user_id", "updated_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tasks_user_updated",
+            table_name="tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_index("ix_task_tombstones_user_deleted", table_name="task_tombstones", if_exists=True)
+    op.drop_table("task_tombstones", if_exists=True)
+    with op.batch_alter_table("tasks") as batch_op:
+        batch_op.alter_column(
+            "updated_at",
+            existing_type=sa.DateTime(timezone=True),
+            server_default=None,
+            existing_nullable=True,
+        )
@@ -0,0 +1,57 @@
+"""add daily note patches
+
+Revision ID: e7b2c4d6f8a1
+Revises: d5a8f1b3c6e9
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b2c4d6f8a1'
+down_revision: Union[str, Sequence[str], None] = 'd5a8f1b3c6e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 부분 수정용 revision / 본문 길이 (기존 노트는 revision 0 = content 그대로)
+    with op.batch_alter_table("daily_notes") as batch_op:
+        batch_op.add_column(sa.Column("revision", sa.Integer(), server_default="0", nullable=False))
+        batch_op.add_column(sa.Column("content_revision", sa.Integer(), server_default="0", nullable=False))
+        batch_op.add_column(sa.Column("content_length", sa.Integer(), server_default="0", nullable=False))
+    # char_length / length 모두 바이트가 아닌 글자 수
+    length = "char_length" if op.get_context().dialect.name == "postgresql" else "length"
+    op.execute(f"UPDATE daily_notes SET content_length = {length}(content) WHERE content IS NOT NULL")
+
+    op.create_table(
+        "daily_note_patches",
+        sa.Column("note_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("revision", sa.Integer(), nullable=False),
+        sa.Column("ops", sa.JSON(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(["note_id"], ["daily_notes.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("note_id", "revision"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 합치지 않은 패치가 있으면 유실됨 → 먼저 모든 노트를 compaction 하세요
+    op.drop_table("daily_note_patches", if_exists=True)
+    with op.batch_alter_table("daily_notes") as batch_op:
+        batch_op.drop_column("content_length")
+        batch_op.drop_column("content_revision")
+        batch_op.drop_column("revision")
@@ -0,0 +1,74 @@
+"""add task project link and counts
+
+Revision ID: f3a9d2e5b7c4
+Revises: e7b2c4d6f8a1
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a9d2e5b7c4'
+down_revision: Union[str, Sequence[str], None] = 'e7b2c4d6f8a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 새 컬럼은 모두 NULL → FK 검증이 즉시 끝남
+    with op.batch_alter_table("tasks") as batch_op:
+        batch_op.add_column(sa.Column("project_id", postgresql.UUID(as_uuid=True), nullable=True))
+        batch_op.create_foreign_key(
+            "fk_tasks_project_id_projects", "projects", ["project_id"], ["id"], ondelete="SET NULL"
+        )
+    # 기존 태스크는 프로젝트가 없으므로 개수 0 그대로
+    with op.batch_alter_table("projects") as batch_op:
+        batch_op.add_column(sa.Column("open_count", sa.Integer(), server_default="0", nullable=False))
+        batch_op.add_column(sa.Column("done_count", sa.Integer(), server_default="0", nullable=False))
+
+    with op.get_context().autocommit_block():
+        # 프로젝트별 목록: WHERE project_id [AND status] ORDER BY status, order, created_at, id
+        op.create_index(
+            "ix_tasks_project_status_order",
+            "tasks",
+            ["project_id", "status", "order", "created_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # 사이드바 프로젝트 목록: WHERE user_id ORDER BY created_at
+        op.create_index(
+            "ix_projects_user_created",
+            "projects",
+            ["user_id", "created_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_projects_user_created",
+            table_name="projects",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_tasks_project_status_order",
+            table_name="tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    with op.batch_alter_table("projects") as batch_op:
+        batch_op.drop_column("done_count")
+        batch_op.drop_column("open_count")
+    with op.batch_alter_table("tasks") as batch_op:
+        batch_op.drop_constraint("fk_tasks_project_id_projects", type_="foreignkey")
+        batch_op.drop_column("project_id")
@@ -13,4 +13,22 @@ try:
     from app.api import task
     api_router.include_router(task.router)
 except Exception:
-    pass
\ No newline at end of file
+    pass
+
+try:
+    from app.api import events
+    api_router.include_router(events.router)
+except Exception:
+    pass
+
+try:
+    from app.api import daily_note
+    api_router.include_router(daily_note.router)
+except Exception:
+    pass
+
+try:
+    from app.api import project
+    api_router.include_router(project.router)
+except Exception:
+    pass
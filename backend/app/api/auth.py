@@ -8,27 +8,30 @@
 from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
-from app.core.database import get_db
 from app.core.config import settings
-from app.core.security import create_access_token
+from app.core.security import (
+    PASSWORD_MAX_BYTES,
+    create_access_token,
+    password_hasher,
+    password_needs_rehash,
+)
 from app.core.exceptions import (
     UserAlreadyExistsException,
     InvalidCredentialsException,
 )
-from app.schemas.user import UserCreate, UserResponse, Token
+from app.schemas.users import UserCreate, UserResponse, Token
 from app.services.user_service import UserService
-from app.api.deps import get_current_user, CurrentUser
+from app.api.deps import get_current_user, CurrentUser, DB
 
 router = APIRouter(prefix="/auth", tags=["인증"])
 
 
 @router.post("/signup", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def signup(
+async def signup(
     user_in: UserCreate,
-    db: Session = Depends(get_db)
+    db: DB
 ):
     """
     회원가입
@@ -37,22 +40,25 @@ def signup(
     
     - **email**: 이메일 (고유값)
     - **username**: 유저명 (고유값)
-    - **password**: 비밀번호 (최소 8자)
+    - **password**: 비밀번호 (최소 8자, 최대 72바이트)
     - **full_name**: 전체 이름 (선택)
     """
     # 1. 이메일 중복 체크
-    existing_user = UserService.get_by_email(db, user_in.email)
+    existing_user = await db.run(UserService.get_by_email, user_in.email)
     if existing_user:
         raise UserAlreadyExistsException("이미 사용 중인 이메일입니다")
 
     # 2. 유저명 중복 체크
-    existing_username = UserService.get_by_username(db, user_in.username)
+    existing_username = await db.run(UserService.get_by_username, user_in.username)
     if existing_username:
         raise UserAlreadyExistsException("이미 사용 중인 유저명입니다")
     
-    # 3. 유저 생성
+    # 3. 유저 생성 (해싱은 전용 워커 풀에서, 포화 시 503)
+    # 해싱을 기다리는 동안 DB 연결을 풀에 반환 → 로그인이 몰려도 다른 API의 연결을 막지 않음
+    await db.release()
+    hashed_password = await password_hasher.hash(user_in.password)
     try:
-        user = UserService.create(db, user_in)
+        user = await db.run(UserService.create, user_in, hashed_password)
         return user
     except IntegrityError:
         raise HTTPException(
@@ -62,8 +68,8 @@ def signup(
 
 
 @router.post("/login", response_model=Token)
-def login(
-    db: Session = Depends(get_db),
+async def login(
+    db: DB,
     form_data: OAuth2PasswordRequestForm = Depends()
 ):
     """
@@ -73,7 +79,7 @@ def login(
     
     **OAuth2PasswordRequestForm 필드:**
     - username: 이메일을 입력하세요 (OAuth2 스펙상 필드명이 username)
-    - password: 비밀번호
+    - password: 비밀번호 (최대 72바이트)
     
     **응답:**
     - access_token: JWT 토큰
@@ -87,15 +93,26 @@ def login(
     ```
     """
     # 1. 인증 (이메일 + 비밀번호 검증)
-    user = UserService.authenticate(
-        db,
-        email=form_data.username,  # OAuth2 스펙상 username 필드 사용
-        password=form_data.password
+    # bcrypt 한도를 넘는 비밀번호는 어떤 해시와도 맞을 수 없음 → 조회 / 해싱 없이 바로 거절
+    if len(form_data.password.encode("utf-8")) > PASSWORD_MAX_BYTES:
+        raise InvalidCredentialsException()
+
+    user = await db.run(
+        UserService.get_by_email,
+        form_data.username  # OAuth2 스펙상 username 필드 사용
     )
     
-    if not user:
+    # 비밀번호 검증은 전용 워커 풀에서 (포화 시 503)
+    # 기다리는 동안 DB 연결은 풀에 반환 (재해싱 UPDATE 때만 다시 가져옴)
+    await db.release()
+    if not user or not await password_hasher.verify(form_data.password, user.hashed_password):
         raise InvalidCredentialsException()
     
+    # 해싱 cost(BCRYPT_ROUNDS)가 바뀌었으면 새 cost로 재해싱
+    if password_needs_rehash(user.hashed_password):
+        new_hash = await password_hasher.hash(form_data.password)
+        await db.run(UserService.update_password_hash, user, new_hash)
+    
     # 2. JWT 토큰 생성
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
@@ -111,7 +128,7 @@ def login(
 
 
 @router.get("/me", response_model=UserResponse)
-def get_me(current_user: CurrentUser):
+async def get_me(current_user: CurrentUser):
     """
     내 정보 조회
     
@@ -123,7 +140,7 @@ def get_me(current_user: CurrentUser):
 
 
 @router.post("/test-token", response_model=UserResponse)
-def test_token(current_user: CurrentUser):
+async def test_token(current_user: CurrentUser):
     """
     토큰 테스트
     
@@ -0,0 +1,210 @@
+# backend/app/api/daily_note.py
+"""
+일일 노트 API
+"""
+from datetime import date, timedelta
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, BackgroundTasks, Header, Query
+
+from app.api.deps import CurrentUser, DB
+from app.core.cache import note_cache
+from app.core.config import settings
+from app.core.database import open_session_runner
+from app.core.exceptions import DailyNoteNotFoundException, InvalidDateRangeException
+from app.core.serializers import dumps
+from app.schemas.common import MessageResponse
+from app.schemas.daily_note import (
+    DailyNotePatch,
+    DailyNotePatchResponse,
+    DailyNoteResponse,
+    DailyNoteSummary,
+    DailyNoteUpsert,
+)
+from app.services.daily_note_service import (
+    NOTE_RESPONSE_COLUMNS,
+    NOTE_SUMMARY_COLUMNS,
+    DailyNoteService,
+)
+
+router = APIRouter(prefix="/daily-notes", tags=["일일 노트"])
+
+IfNoneMatch = Header(None, description="이전 응답의 ETag (같으면 304 Not Modified)")
+
+
+async def _compact_in_background(note_id: UUID) -> None:
+    """응답 후 쌓인 패치를 본문에 합침 (읽을 때 적용할 패치가 계속 늘지 않도록, 핸들러와 같은 세션 방식)"""
+    async with open_session_runner() as db:
+        await db.run(DailyNoteService.compact, note_id)
+
+
+def _month_range(month: str) -> tuple:
+    """'2026-10' → (2026-10-01, 2026-10-31)"""
+    try:
+        year, month_number = (int(part) for part in month.split("-"))
+        start = date(year, month_number, 1)
+    except ValueError:
+        raise InvalidDateRangeException("month 는 YYYY-MM 형식이어야 합니다")
+    next_month = date(year + month_number // 12, month_number % 12 + 1, 1)
+    return start, next_month - timedelta(days=1)
+
+
+@router.get(
+    "",
+    response_model=List[DailyNoteResponse] | List[DailyNoteSummary],
+    summary="기간별 일일 노트 조회"
+)
+async def get_daily_notes(
+    current_user: CurrentUser,
+    db: DB,
+    month: Optional[str] = Query(None, description="조회할 달 (YYYY-MM) - start/end 대신 사용"),
+    start: Optional[date] = Query(None, description="시작 날짜 (포함)"),
+    end: Optional[date] = Query(None, description="끝 날짜 (포함)"),
+    summary: bool = Query(False, description="true면 date, mood 만 (본문 제외)"),
+    if_none_match: Optional[str] = IfNoneMatch
+):
+    """
+    기간 안의 일일 노트를 날짜순으로 조회합니다 (노트가 있는 날만).
+
+    **기간:**
+    - month: 한 달 (예: `2026-10`)
+    - 또는 start ~ end (최대 DAILY_NOTE_RANGE_MAX_DAYS 일)
+
+    **요약 모드:**
+    - summary=true: `date`, `mood` 만 반환 (마크다운 본문을 읽지 않음 → 캘린더 표시용)
+
+    **Note:**
+    - 쿼리 1번 (user_id, date 유니크 인덱스 범위 스캔)
+    - `If-None-Match` 지원 (변경 없으면 304)
+
+    **예시:**
+    - `/api/daily-notes?month=2026-10&summary=true` - 캘린더
+    - `/api/daily-notes?start=2026-10-01&end=2026-10-07` - 한 주 (본문 포함)
+    """
+    if month:
+        start, end = _month_range(month)
+    elif start is None or end is None:
+        raise InvalidDateRangeException("month 또는 start, end 를 지정해주세요")
+    if start > end:
+        raise InvalidDateRangeException("start 가 end 보다 늦습니다")
+    if (end - start).days + 1 > settings.DAILY_NOTE_RANGE_MAX_DAYS:
+        raise InvalidDateRangeException(f"최대 {settings.DAILY_NOTE_RANGE_MAX_DAYS}일까지 조회할 수 있습니다")
+
+    columns = NOTE_SUMMARY_COLUMNS if summary else NOTE_RESPONSE_COLUMNS
+
+    async def build():
+        notes = await db.run(DailyNoteService.get_range, current_user.id, start, end, columns=columns)
+        return dumps(notes)
+
+    params = {"start": start, "end": end, "summary": summary}
+    return await note_cache.respond(current_user.id, "range", params, build, if_none_match)
+
+
+@router.get(
+    "/{note_date}",
+    response_model=DailyNoteResponse,
+    summary="일일 노트 조회"
+)
+async def get_daily_note(
+    note_date: date,
+    current_user: CurrentUser,
+    db: DB
+):
+    """
+    특정 날짜의 노트를 조회합니다.
+
+    **예시:**
+    - `/api/daily-notes/2026-10-18`
+    """
+    note = await db.run(DailyNoteService.get_by_date, current_user.id, note_date)
+    if note is None:
+        raise DailyNoteNotFoundException()
+    return note
+
+
+@router.put(
+    "/{note_date}",
+    response_model=DailyNoteResponse,
+    summary="일일 노트 저장"
+)
+async def upsert_daily_note(
+    note_date: date,
+    note_in: DailyNoteUpsert,
+    current_user: CurrentUser,
+    db: DB
+):
+    """
+    날짜별 노트를 저장합니다 (없으면 생성, 있으면 수정).
+
+    - **content**: 마크다운 내용
+    - **mood**: great, good, okay, bad
+
+    **Note:**
+    - 보내지 않은 필드는 기존 값을 유지합니다 (null을 보내면 비움)
+    - 같은 요청을 다시 보내도 결과가 같습니다 (재시도 안전)
+    """
+    note = await db.run(DailyNoteService.upsert, current_user.id, note_date, note_in)
+    await note_cache.invalidate(current_user.id)
+    return note
+
+
+@router.patch(
+    "/{note_date}",
+    response_model=DailyNotePatchResponse,
+    summary="일일 노트 부분 수정"
+)
+async def patch_daily_note(
+    note_date: date,
+    patch_in: DailyNotePatch,
+    current_user: CurrentUser,
+    db: DB,
+    background_tasks: BackgroundTasks
+):
+    """
+    본문 전체 대신 바뀐 부분만 보내 저장합니다 (큰 노트의 자동 저장용).
+
+    - **base_revision**: 수정을 만든 기준 본문의 revision (조회/저장 응답의 `revision`, 새 노트는 0)
+    - **ops**: `{pos, delete, insert}` 목록 - pos 위치에서 delete 글자를 지우고 insert 를 넣음
+      (유니코드 문자 단위, 앞의 수정이 적용된 본문 기준으로 차례대로)
+
+    **동시 수정:**
+    - base_revision 이 현재 revision 과 다르면 409 (`X-Note-Revision` 헤더에 현재 revision)
+      → 노트를 다시 받아 로컬 변경을 다시 적용한 뒤 저장
+
+    **Note:**
+    - 서버는 본문을 읽거나 다시 쓰지 않고 변경분만 기록합니다
+    - 응답의 content_length 가 로컬 본문 길이와 다르면 노트를 다시 받아주세요
+
+    **예시:**
+    ```json
+    {"base_revision": 12, "ops": [{"pos": 1042, "delete": 3, "insert": "완료"}]}
+    ```
+    """
+    result = await db.run(
+        DailyNoteService.patch, current_user.id, note_date, patch_in.base_revision, patch_in.ops
+    )
+    await note_cache.invalidate(current_user.id)
+    if result["pending_patches"] >= settings.DAILY_NOTE_COMPACT_PATCHES:
+        background_tasks.add_task(_compact_in_background, result["id"])
+    return result
+
+
+@router.delete(
+    "/{note_date}",
+    response_model=MessageResponse,
+    summary="일일 노트 삭제"
+)
+async def delete_daily_note(
+    note_date: date,
+    current_user: CurrentUser,
+    db: DB
+):
+    """
+    특정 날짜의 노트를 삭제합니다.
+    """
+    deleted = await db.run(DailyNoteService.delete, current_user.id, note_date)
+    if not deleted:
+        raise DailyNoteNotFoundException()
+    await note_cache.invalidate(current_user.id)
+    return MessageResponse(message="노트가 삭제되었습니다")
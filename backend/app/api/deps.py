@@ -0,0 +1,78 @@
+# backend/app/api/deps.py
+"""
+API 공통 의존성
+- DB 세션 (동기/비동기 모드 공통)
+- 현재 로그인 유저 조회 (토큰 검증 / 유저 조회 결과 캐시)
+"""
+import time
+from typing import Annotated, Optional
+from uuid import UUID
+
+from fastapi import Depends, Query
+from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionRunner, get_session_runner
+from app.core.exceptions import CredentialsException, InactiveUserException
+from app.core.security import decode_access_token_cached
+from app.models.users import User
+from app.services.user_service import UserService
+
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
+oauth2_scheme_optional = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
+
+# 핸들러에서 `await db.run(Service.method, ...)` 로 사용
+DB = Annotated[SessionRunner, Depends(get_session_runner)]
+
+
+async def get_current_user(
+    db: DB,
+    token: str = Depends(oauth2_scheme),
+) -> User:
+    """
+    Bearer 토큰 → 유저
+    - 토큰이 유효하지 않거나 유저가 없으면 401
+    - 비활성 유저면 403
+    - 캐시에 스냅샷이 있으면 DB 조회 없이 반환
+    """
+    payload = decode_access_token_cached(token)
+    if payload is None or payload.get("sub") is None:
+        raise CredentialsException()
+
+    try:
+        user_id = UUID(payload["sub"])
+    except ValueError:
+        raise CredentialsException()
+
+    user = UserService.get_cached(user_id)
+    if user is None:
+        user = await db.run(UserService.get_by_id, user_id)
+        if user is None:
+            raise CredentialsException()
+        # 세션에서 분리 → 핸들러의 커밋 후 current_user 접근 시 다시 조회(SELECT users)하지 않음
+        await db.run(Session.expunge, user)
+        # 토큰 만료 이후까지 보관하지 않음
+        UserService.cache_snapshot(user, ttl=payload.get("exp", 0) - time.time())
+    if not user.is_active:
+        raise InactiveUserException()
+    return user
+
+
+CurrentUser = Annotated[User, Depends(get_current_user)]
+
+
+async def get_stream_user(
+    db: DB,
+    token: Optional[str] = Depends(oauth2_scheme_optional),
+    access_token: Optional[str] = Query(None, description="Bearer 토큰 (EventSource는 헤더를 못 보냄)"),
+) -> User:
+    """
+    스트림(SSE) 전용 - Authorization 헤더 또는 ?access_token= 으로 인증
+    유저 확인 후 DB 연결을 바로 반환 (연결이 열려 있는 동안 풀을 점유하지 않음)
+    """
+    user = await get_current_user(db, token or access_token or "")
+    await db.release()
+    return user
+
+
+StreamUser = Annotated[User, Depends(get_stream_user)]
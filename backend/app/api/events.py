@@ -0,0 +1,61 @@
+# backend/app/api/events.py
+"""
+실시간 이벤트 API (Server-Sent Events)
+"""
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+
+from app.api.deps import StreamUser
+from app.core.config import settings
+from app.core.events import event_broker, format_sse
+
+router = APIRouter(prefix="/events", tags=["실시간 이벤트"])
+
+
+@router.get(
+    "",
+    summary="태스크 변경 이벤트 스트림",
+    response_class=StreamingResponse,
+)
+async def stream_events(current_user: StreamUser):
+    """
+    내 태스크 변경을 실시간으로 받습니다 (text/event-stream).
+
+    **이벤트:**
+    - ready: 연결됨 (이 시점부터의 변경을 받음)
+    - task.created / task.updated / task.status / task.completed / task.moved / task.restored: `task` 포함
+    - task.deleted: `id` 포함
+    - tasks.bulk / tasks.reordered: 여러 태스크 변경 → 목록 다시 조회
+    - tasks.archived (보관 작업) / tasks.restored (프로젝트 보관 해제): `/api/tasks/changes` 로 동기화
+    - projects.repaired (개수 재계산): 프로젝트 목록 다시 조회
+    - project.created / project.updated: `project` 포함, project.deleted: `id` 포함
+    - resync: 이벤트가 너무 밀려서 일부를 버림 → `/api/tasks/changes` 로 동기화
+
+    **인증:**
+    - EventSource는 헤더를 못 붙이므로 `?access_token=...` 도 허용
+
+    **Note:**
+    - 이벤트가 없으면 EVENTS_HEARTBEAT_SECONDS 마다 주석(`: ping`)을 보내 연결 유지
+    - 재연결 시 놓친 변경은 `/api/tasks/changes` 로 받으세요
+
+    **예시:**
+    ```
+    const source = new EventSource(`/api/events?access_token=${token}`);
+    source.addEventListener("task.updated", (e) => console.log(JSON.parse(e.data)));
+    ```
+    """
+    async def stream():
+        async with event_broker.subscribe(current_user.id) as subscription:
+            yield "retry: 3000\n" + format_sse("ready", {})
+            while True:
+                message = await subscription.get(settings.EVENTS_HEARTBEAT_SECONDS)
+                yield message if message is not None else ": ping\n\n"
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # nginx 버퍼링 끄기
+        },
+    )
@@ -0,0 +1,177 @@
+# backend/app/api/project.py
+"""
+프로젝트 관련 API
+"""
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Header, Query, status
+
+from app.api.deps import CurrentUser, DB
+from app.core.cache import task_cache
+from app.core.events import event_broker
+from app.core.exceptions import ProjectNotFoundException
+from app.core.serializers import dumps
+from app.schemas.common import MessageResponse
+from app.schemas.project import ProjectCreate, ProjectResponse, ProjectUpdate
+from app.services.archive_service import TaskArchiveService
+from app.services.project_service import ProjectService
+
+router = APIRouter(prefix="/projects", tags=["프로젝트"])
+
+IfNoneMatch = Header(None, description="이전 응답의 ETag (같으면 304 Not Modified)")
+
+
+async def _notify(user_id: UUID, event_type: str, project=None, **data) -> None:
+    """
+    쓰기 후 처리: 캐시 무효화 + 실시간 이벤트 발행
+    (프로젝트 목록은 태스크 개수를 담고 있어 태스크 캐시와 함께 무효화)
+    """
+    await task_cache.invalidate(user_id)
+    if project is not None:
+        data["project"] = ProjectResponse.model_validate(project).model_dump(mode="json")
+    await event_broker.publish(user_id, event_type, data)
+
+
+@router.post(
+    "",
+    response_model=ProjectResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="프로젝트 생성"
+)
+async def create_project(
+    project_in: ProjectCreate,
+    current_user: CurrentUser,
+    db: DB
+):
+    """
+    새로운 프로젝트를 생성합니다.
+
+    - **name**: 프로젝트 이름 (필수)
+    - **description**: 설명 (선택)
+    - **color**: HEX 색상 (기본값: #6366f1)
+    """
+    project = await db.run(ProjectService.create, project_in, current_user.id)
+    await _notify(current_user.id, "project.created", project)
+    return project
+
+
+@router.get(
+    "",
+    response_model=List[ProjectResponse],
+    summary="프로젝트 목록 조회"
+)
+async def get_projects(
+    current_user: CurrentUser,
+    db: DB,
+    include_archived: bool = Query(False, description="보관된 프로젝트도 포함"),
+    if_none_match: Optional[str] = IfNoneMatch
+):
+    """
+    프로젝트 목록을 만든 순서대로 조회합니다 (사이드바용).
+
+    **포함 정보:**
+    - open_count: 미완료(todo + doing) 태스크 수
+    - done_count: 완료 태스크 수
+
+    **Note:**
+    - 개수는 프로젝트에 저장된 값이라 태스크를 세지 않습니다 (쿼리 1번)
+    - `If-None-Match` 지원 (변경 없으면 304)
+    """
+    async def build():
+        projects = await db.run(ProjectService.get_multi, current_user.id, include_archived=include_archived)
+        return dumps([ProjectResponse.model_validate(project).model_dump() for project in projects])
+
+    params = {"include_archived": include_archived}
+    return await task_cache.respond(current_user.id, "projects", params, build, if_none_match)
+
+
+@router.get(
+    "/{project_id}",
+    response_model=ProjectResponse,
+    summary="프로젝트 조회"
+)
+async def get_project(
+    project_id: UUID,
+    current_user: CurrentUser,
+    db: DB
+):
+    """
+    특정 프로젝트를 조회합니다.
+
+    **Note:**
+    - 프로젝트의 태스크는 `/api/tasks?project_id=...`, 통계는 `/api/tasks/stats?project_id=...`
+    """
+    project = await db.run(ProjectService.get_by_id, project_id, current_user.id)
+    if project is None:
+        raise ProjectNotFoundException()
+    return project
+
+
+@router.put(
+    "/{project_id}",
+    response_model=ProjectResponse,
+    summary="프로젝트 수정"
+)
+async def update_project(
+    project_id: UUID,
+    project_update: ProjectUpdate,
+    current_user: CurrentUser,
+    db: DB
+):
+    """
+    프로젝트를 수정합니다.
+
+    **수정 가능한 필드:**
+    - name, description, color
+    - archived: 보관 (목록에서 기본으로 숨김)
+
+    **보관:**
+    - archived=true: 프로젝트의 태스크는 다음 보관 작업 때 보관 테이블로 옮겨집니다
+    - archived=false: 보관된 태스크를 바로 되돌립니다 (완료 후 보관 기간이 지난 태스크 제외)
+
+    **Note:**
+    - 보내지 않은 필드는 변경되지 않습니다 (Partial Update)
+    """
+    project = await db.run(ProjectService.get_by_id, project_id, current_user.id)
+    if project is None:
+        raise ProjectNotFoundException()
+
+    if project.archived and project_update.archived is False:
+        # 태스크 먼저 복원 → 중간에 실패해도 프로젝트가 보관 상태면 다음 보관 작업이 다시 정리
+        restored = await db.run(TaskArchiveService.restore_project, current_user.id, project_id)
+        project = await db.run(ProjectService.get_by_id, project_id, current_user.id)
+    else:
+        restored = 0
+
+    updated_project = await db.run(ProjectService.update, project, project_update)
+    await _notify(current_user.id, "project.updated", updated_project)
+    if restored:
+        # 되돌린 태스크는 /api/tasks/changes 에 changed 로 나옴
+        await event_broker.publish(current_user.id, "tasks.restored", {"project_id": str(project_id), "count": restored})
+    return updated_project
+
+
+@router.delete(
+    "/{project_id}",
+    response_model=MessageResponse,
+    summary="프로젝트 삭제"
+)
+async def delete_project(
+    project_id: UUID,
+    current_user: CurrentUser,
+    db: DB
+):
+    """
+    프로젝트를 삭제합니다.
+
+    **Note:**
+    - 태스크는 삭제되지 않고 프로젝트 연결만 해제됩니다 (project_id → null)
+    """
+    project = await db.run(ProjectService.get_by_id, project_id, current_user.id)
+    if project is None:
+        raise ProjectNotFoundException()
+
+    await db.run(ProjectService.delete, project)
+    await _notify(current_user.id, "project.deleted", id=str(project_id))
+    return MessageResponse(message="프로젝트가 삭제되었습니다")
@@ -2,20 +2,54 @@
 """
 Task 관련 API
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, BackgroundTasks, Header, HTTPException, status, Query
+from fastapi import status as http_status  # status 쿼리 파라미터와 이름 충돌 방지
+from datetime import datetime, timezone
 from typing import Optional, List
 from uuid import UUID
 
-from app.core.database import get_db
-from app.api.deps import CurrentUser
-from app.schemas.task import TaskCreate, TaskUpdate, TaskResponse
+from app.api.deps import CurrentUser, DB
+from app.core.cache import task_cache
+from app.core.database import open_session_runner
+from app.core.events import event_broker
+from app.core.serializers import dumps, rows_to_dicts
+from app.schemas.task import (
+    TaskCreate,
+    TaskUpdate,
+    TaskResponse,
+    TaskStatsResponse,
+    TaskChangesResponse,
+    TaskBulkRequest,
+    TaskBulkResponse,
+    TaskMove,
+)
 from app.schemas.common import PaginatedResponse, PaginationParams, MessageResponse
-from app.services.task_service import TaskService
+from app.services.archive_service import TaskArchiveService
+from app.services.task_service import TaskService, projection_columns
 from app.models.task import TaskStatus, TaskPriority
 
 router = APIRouter(prefix="/tasks", tags=["태스크"])
 
+# 조회 API 공통: 이전 응답의 ETag → 바뀐 게 없으면 304 (본문 없음)
+IfNoneMatch = Header(None, description="이전 응답의 ETag (같으면 304 Not Modified)")
+# 목록 API 공통: 필요한 필드만 조회/응답
+Fields = Query(None, description="응답에 포함할 필드 (쉼표로 구분, 예: title,status,priority - id는 항상 포함)")
+
+
+async def _rebalance_in_background(user_id: UUID, task_status: TaskStatus) -> None:
+    """응답 후 상태 컬럼 order 재정렬 (다음 이동들이 1행 수정으로 끝나도록, 핸들러와 같은 세션 방식)"""
+    async with open_session_runner() as db:
+        await db.run(TaskService.rebalance, user_id, task_status)
+    await _notify(user_id, "tasks.reordered", status=task_status.value)
+
+
+async def _notify(user_id: UUID, event_type: str, task=None, **data) -> None:
+    """쓰기 후 처리: 캐시 무효화 + 실시간 이벤트 발행 (다른 탭/기기)"""
+    await task_cache.invalidate(user_id)
+    if task is not None:
+        data["task"] = TaskResponse.model_validate(task).model_dump(mode="json")
+    await event_broker.publish(user_id, event_type, data)
+
 
 @router.post(
     "",
@@ -23,10 +57,10 @@ router = APIRouter(prefix="/tasks", tags=["태스크"])
     status_code=status.HTTP_201_CREATED,
     summary="태스크 생성"
 )
-def create_task(
+async def create_task(
     task_in: TaskCreate,
     current_user: CurrentUser,
-    db: Session = Depends(get_db)
+    db: DB
 ):
     """
     새로운 태스크를 생성합니다.
@@ -36,24 +70,79 @@ def create_task(
     - **status**: 상태 (기본값: todo)
     - **priority**: 우선순위 (기본값: medium)
     - **due_date**: 마감일 (선택)
+    - **project_id**: 프로젝트 (선택, 프로젝트의 태스크 개수에 반영)
     """
-    task = TaskService.create(db, task_in, current_user.id)
+    task = await db.run(TaskService.create, task_in, current_user.id)
+    await _notify(current_user.id, "task.created", task)
     return task
 
 
+@router.post(
+    "/bulk",
+    response_model=TaskBulkResponse,
+    summary="태스크 일괄 처리"
+)
+async def bulk_tasks(
+    bulk_in: TaskBulkRequest,
+    current_user: CurrentUser,
+    db: DB
+):
+    """
+    여러 태스크 작업을 한 번에 처리합니다 (최대 500건, 트랜잭션 1번).
+    
+    **작업 종류 (op):**
+    - create: `task` 로 생성
+    - update: `id` 태스크를 `changes` 로 수정 (Partial Update)
+    - status: `id` 태스크의 상태를 `status` 로 변경
+    - complete: `id` 태스크 완료 처리
+    - delete: `id` 태스크 삭제 (Soft Delete - `/restore` 로 되돌릴 수 있음)
+    
+    **Note:**
+    - 작업마다 결과(ok/error)를 반환합니다 (없는 태스크는 해당 작업만 실패)
+    - 적용 순서: create → update → status/complete → delete
+    
+    **예시:**
+    ```
+    {"operations": [
+        {"op": "complete", "id": "..."},
+        {"op": "delete", "id": "..."},
+        {"op": "create", "task": {"title": "새 태스크"}}
+    ]}
+    ```
+    """
+    results = await db.run(TaskService.bulk, current_user.id, bulk_in.operations)
+    await _notify(
+        current_user.id,
+        "tasks.bulk",
+        ids=[str(result["id"]) for result in results if result["ok"]]
+    )
+    
+    succeeded = sum(1 for result in results if result["ok"])
+    return TaskBulkResponse(
+        results=results,
+        succeeded=succeeded,
+        failed=len(results) - succeeded
+    )
+
+
 @router.get(
     "",
     response_model=PaginatedResponse[TaskResponse],
     summary="태스크 목록 조회"
 )
-def get_tasks(
+async def get_tasks(
     current_user: CurrentUser,
-    db: Session = Depends(get_db),
+    db: DB,
     skip: int = Query(0, ge=0, description="건너뛸 개수"),
     limit: int = Query(20, ge=1, le=100, description="가져올 최대 개수"),
     status: Optional[TaskStatus] = Query(None, description="상태 필터"),
     priority: Optional[TaskPriority] = Query(None, description="우선순위 필터"),
-    search: Optional[str] = Query(None, description="검색어 (제목/설명)")
+    search: Optional[str] = Query(None, description="검색어 (제목/설명)"),
+    project_id: Optional[UUID] = Query(None, description="프로젝트 필터"),
+    include_archived: bool = Query(False, description="보관된 태스크도 포함"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
+    fields: Optional[str] = Fields,
+    if_none_match: Optional[str] = IfNoneMatch
 ):
     """
     태스크 목록을 조회합니다.
@@ -61,7 +150,11 @@ def get_tasks(
     **필터링:**
     - status: todo, doing, done 중 하나
     - priority: high, medium, low 중 하나
+    - project_id: 해당 프로젝트의 태스크만
     - search: 제목이나 설명에서 검색
+      - 공백으로 나눈 각 단어의 접두어 매칭 (예: "회의" → "회의록", "회의를")
+      - 관련도 높은 순으로 정렬 (커서 모드에서는 기본 정렬 유지)
+      - 관련도 순일 때는 `next_cursor` 가 없음 → 다음 페이지는 skip 으로
     
     **정렬:**
     - 완료되지 않은 태스크가 먼저
@@ -70,37 +163,81 @@ def get_tasks(
     **페이지네이션:**
     - skip: 건너뛸 개수 (0부터 시작)
     - limit: 가져올 최대 개수 (기본 20, 최대 100)
+    - cursor: 응답의 `next_cursor`를 그대로 전달 (커서 모드, skip 무시)
+      - 깊은 페이지에서도 OFFSET 스캔 없이 일정한 속도
+      - `total` 은 null (전체 개수는 커서 없는 첫 페이지 응답에서)
     
     **예시:**
     - `/api/tasks?skip=0&limit=20` - 첫 페이지
     - `/api/tasks?skip=20&limit=20` - 두 번째 페이지
+    - `/api/tasks?cursor={next_cursor}&limit=20` - 커서로 다음 페이지
     - `/api/tasks?status=todo&priority=high` - 미완료 + 높은 우선순위
     - `/api/tasks?search=회의` - "회의"가 포함된 태스크
-    """
-    # 태스크 목록
-    tasks = TaskService.get_multi(
-        db=db,
-        user_id=current_user.id,
-        skip=skip,
-        limit=limit,
-        status=status,
-        priority=priority,
-        search=search
-    )
     
-    # 전체 개수 (필터 적용된)
-    total = TaskService.get_count(
-        db=db,
-        user_id=current_user.id,
-        status=status
-    )
+    **보관 태스크:**
+    - 오래된 완료 태스크와 보관된 프로젝트의 태스크는 주기적으로 보관 테이블로 옮겨져 기본 목록에서 빠집니다
+    - include_archived=true: 보관 태스크도 같은 정렬로 포함 (`archived` 필드로 구분, 읽기 전용)
+      - 검색어가 있어도 관련도 정렬 없이 기본 정렬
+
+    **필드 선택:**
+    - fields: 필요한 필드만 (예: `fields=title,status,priority`)
+      - 선택한 컬럼만 DB에서 읽음 (description 등 큰 컬럼 제외 가능)
     
-    return PaginatedResponse.create(
-        items=tasks,
-        total=total,
-        skip=skip,
-        limit=limit
-    )
+    **조건부 요청:**
+    - 응답의 `ETag`를 `If-None-Match`로 보내면, 내용이 같으면 304 (캐시에 있으면 목록 쿼리 실행 안 함)
+    """
+    columns = projection_columns(fields)
+    keys = [column.key for column in columns]
+    if include_archived:
+        keys.append("archived")
+    params = {
+        "skip": skip, "limit": limit, "status": status, "priority": priority,
+        "search": search, "cursor": cursor, "fields": keys, "project_id": project_id,
+        "include_archived": include_archived,
+    }
+
+    async def build():
+        # 태스크 목록 (limit + 1개를 가져와 다음 페이지 존재 여부 판단)
+        # 컬럼 튜플로 가져와 바로 JSON 인코딩 (ORM 객체 생성 / 응답 모델 검증 생략)
+        tasks = await db.run(
+            TaskService.get_multi,
+            user_id=current_user.id,
+            skip=skip,
+            limit=limit + 1,
+            status=status,
+            priority=priority,
+            search=search,
+            cursor=cursor,
+            columns=columns,
+            project_id=project_id,
+            include_archived=include_archived
+        )
+        has_more = len(tasks) > limit
+        tasks = tasks[:limit]
+        # 관련도 순 결과는 정렬 키 커서로 이어갈 수 없음 (중간부터 정렬이 바뀌어 누락/중복)
+        ranked = await db.run(TaskService.orders_by_rank, search, cursor, include_archived)
+
+        # 전체 개수 (필터 적용된) - 커서 모드는 페이지마다 전체 COUNT 하지 않음 (첫 페이지 응답 값 사용)
+        total = None if cursor else await db.run(
+            TaskService.get_count,
+            user_id=current_user.id,
+            status=status,
+            priority=priority,
+            search=search,
+            project_id=project_id,
+            include_archived=include_archived
+        )
+
+        return dumps({
+            "items": rows_to_dicts(tasks, keys),
+            "total": total,
+            "skip": 0 if cursor else skip,
+            "limit": limit,
+            "has_more": has_more,
+            "next_cursor": TaskService.get_cursor(tasks[-1]) if has_more and not ranked else None,
+        })
+
+    return await task_cache.respond(current_user.id, "list", params, build, if_none_match)
 
 
 @router.get(
@@ -108,9 +245,11 @@ def get_tasks(
     response_model=List[TaskResponse],
     summary="오늘 할 일 조회"
 )
-def get_today_tasks(
+async def get_today_tasks(
     current_user: CurrentUser,
-    db: Session = Depends(get_db)
+    db: DB,
+    fields: Optional[str] = Fields,
+    if_none_match: Optional[str] = IfNoneMatch
 ):
     """
     오늘 할 일을 조회합니다.
@@ -123,18 +262,32 @@ def get_today_tasks(
     **정렬:**
     - 높은 우선순위 먼저
     - 같은 우선순위 내에서는 order 순서대로
+    
+    **Note:**
+    - `fields` 로 필요한 필드만 받을 수 있습니다 (목록 API와 동일)
+    - `If-None-Match` 지원 (변경 없으면 304)
     """
-    tasks = TaskService.get_today_tasks(db, current_user.id)
-    return tasks
+    columns = projection_columns(fields)
+
+    async def build():
+        tasks = await db.run(TaskService.get_today_tasks, current_user.id, columns=columns)
+        return dumps(rows_to_dicts(tasks))
+
+    # 날짜가 바뀌면 '오늘' 범위도 바뀜 → 캐시 키/ETag에 포함
+    params = {"date": datetime.now(timezone.utc).date(), "fields": [column.key for column in columns]}
+    return await task_cache.respond(current_user.id, "today", params, build, if_none_match)
 
 
 @router.get(
     "/stats",
+    response_model=TaskStatsResponse,
     summary="태스크 통계"
 )
-def get_task_stats(
+async def get_task_stats(
     current_user: CurrentUser,
-    db: Session = Depends(get_db)
+    db: DB,
+    project_id: Optional[UUID] = Query(None, description="이 프로젝트의 태스크만 집계"),
+    if_none_match: Optional[str] = IfNoneMatch
 ):
     """
     태스크 통계를 조회합니다.
@@ -144,24 +297,55 @@ def get_task_stats(
     - 상태별 개수
     - 우선순위별 개수
     - 오늘 할 일 개수
+    - 마감일이 지난 미완료 태스크 개수
+
+    **프로젝트별:**
+    - project_id 를 주면 그 프로젝트의 태스크만 집계
+    - 사이드바용 미완료/완료 개수만 필요하면 `/api/projects` 의 open_count, done_count 사용
+
+    **Note:**
+    - 집계 쿼리 1번으로 계산합니다 (태스크 행을 불러오지 않음)
+    - 결과는 캐시되며 태스크가 변경되면 무효화됩니다
+    - `If-None-Match` 지원 (변경 없으면 304)
     """
-    total = TaskService.get_count(db, current_user.id)
-    todo = TaskService.get_count(db, current_user.id, TaskStatus.TODO)
-    doing = TaskService.get_count(db, current_user.id, TaskStatus.DOING)
-    done = TaskService.get_count(db, current_user.id, TaskStatus.DONE)
-
-    today_tasks = TaskService.get_today_tasks(db, current_user.id)
-
-    return {
-        "total": total,
-        "by_status": {
-            "todo": todo,
-            "doing": doing,
-            "done": done
-        },
-        "today_count": len(today_tasks),
-        "completion_rate": round((done / total * 100) if total > 0 else 0, 1)
-    }
+    async def build():
+        stats = await db.run(TaskService.get_stats, current_user.id, project_id=project_id)
+        return TaskStatsResponse(**stats).model_dump_json()
+
+    # 마감 지남(overdue)은 시간이 흐르면 바뀜 → 분 단위로 캐시 키/ETag 갱신
+    params = {"minute": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M"), "project_id": project_id}
+    return await task_cache.respond(current_user.id, "stats", params, build, if_none_match)
+
+
+@router.get(
+    "/changes",
+    response_model=TaskChangesResponse,
+    summary="변경분 동기화"
+)
+async def get_task_changes(
+    current_user: CurrentUser,
+    db: DB,
+    since: Optional[str] = Query(None, description="이전 응답의 watermark (없으면 처음부터 전체)"),
+    limit: int = Query(500, ge=1, le=1000, description="한 번에 가져올 최대 변경 수")
+):
+    """
+    마지막 동기화 이후 바뀐 태스크만 조회합니다 (오프라인 클라이언트용).
+    
+    **응답:**
+    - changed: 생성/수정된 태스크 → 로컬에 upsert
+    - deleted: 삭제된 태스크 id → 로컬에서 삭제
+    - watermark: 다음 요청의 `since` 로 그대로 전달
+    - has_more: True면 바로 이어서 요청
+    
+    **Note:**
+    - 최근 몇 초 안의 변경은 다음 동기화에서 한 번 더 올 수 있습니다 (upsert라 무해)
+    - 오래된 watermark(삭제 기록 보관 기간 초과)는 410 → 전체 목록을 다시 받고 `since` 없이 시작
+    
+    **예시:**
+    - `/api/tasks/changes` - 처음 (전체)
+    - `/api/tasks/changes?since={watermark}` - 이후 변경분만
+    """
+    return await db.run(TaskService.get_changes, current_user.id, since=since, limit=limit)
 
 
 @router.get(
@@ -169,26 +353,38 @@ def get_task_stats(
     response_model=TaskResponse,
     summary="태스크 상세 조회"
 )
-def get_task(
+async def get_task(
     task_id: UUID,
     current_user: CurrentUser,
-    db: Session = Depends(get_db)
+    db: DB,
+    include_archived: bool = Query(False, description="보관된 태스크도 조회"),
+    if_none_match: Optional[str] = IfNoneMatch
 ):
     """
     특정 태스크의 상세 정보를 조회합니다.
     
     **권한:**
     - 본인이 생성한 태스크만 조회 가능
-    """
-    task = TaskService.get_by_id(db, task_id, current_user.id)
-    
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="태스크를 찾을 수 없습니다"
-        )
     
-    return task
+    **Note:**
+    - include_archived=true 면 보관된 태스크도 조회 (`archived: true`)
+    - `If-None-Match` 지원 (변경 없으면 304)
+    """
+    async def build():
+        task = await db.run(TaskService.get_by_id, task_id, current_user.id)
+        if not task and include_archived:
+            task = await db.run(TaskArchiveService.get_by_id, task_id, current_user.id)
+        
+        if not task:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="태스크를 찾을 수 없습니다"
+            )
+        
+        return TaskResponse.model_validate(task).model_dump_json()
+
+    params = {"id": task_id, "include_archived": include_archived}
+    return await task_cache.respond(current_user.id, "detail", params, build, if_none_match)
 
 
 @router.put(
@@ -196,11 +392,11 @@ def get_task(
     response_model=TaskResponse,
     summary="태스크 수정"
 )
-def update_task(
+async def update_task(
     task_id: UUID,
     task_update: TaskUpdate,
     current_user: CurrentUser,
-    db: Session = Depends(get_db)
+    db: DB
 ):
     """
     태스크를 수정합니다.
@@ -211,6 +407,7 @@ def update_task(
     - status: 상태
     - priority: 우선순위
     - due_date: 마감일
+    - project_id: 프로젝트 (null이면 프로젝트에서 빼기)
     - order: 정렬 순서
     
     **Note:**
@@ -218,7 +415,7 @@ def update_task(
     - null을 보내면 해당 필드를 null로 설정합니다
     """
     # 태스크 조회
-    task = TaskService.get_by_id(db, task_id, current_user.id)
+    task = await db.run(TaskService.get_by_id, task_id, current_user.id, for_update=True)
     
     if not task:
         raise HTTPException(
@@ -227,7 +424,8 @@ def update_task(
         )
     
     # 수정
-    updated_task = TaskService.update(db, task, task_update)
+    updated_task = await db.run(TaskService.update, task, task_update)
+    await _notify(current_user.id, "task.updated", updated_task)
     
     return updated_task
 
@@ -237,11 +435,11 @@ def update_task(
     response_model=TaskResponse,
     summary="태스�� 상태 변경"
 )
-def update_task_status(
+async def update_task_status(
     task_id: UUID,
     status: TaskStatus,
     current_user: CurrentUser,
-    db: Session = Depends(get_db)
+    db: DB
 ):
     """
     태스크의 상태만 변경합니다.
@@ -257,34 +455,79 @@ def update_task_status(
     ```
     """
     # 태스크 조회
-    task = TaskService.get_by_id(db, task_id, current_user.id)
+    task = await db.run(TaskService.get_by_id, task_id, current_user.id, for_update=True)
     
     if not task:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
+            status_code=http_status.HTTP_404_NOT_FOUND,
             detail="태스크를 찾을 수 없습니다"
         )
     
-    # 상태 변경
-    task_update = TaskUpdate(status=status)
-    updated_task = TaskService.update(db, task, task_update)
-    
-    # 완료 처리 시 completed_at 업데이트
+    # 상태 변경 (완료면 completed_at 도 - 트랜잭션 1번)
     if status == TaskStatus.DONE:
-        TaskService.complete(db, updated_task)
+        updated_task = await db.run(TaskService.complete, task)
+    else:
+        updated_task = await db.run(TaskService.update, task, TaskUpdate(status=status))
+    await _notify(current_user.id, "task.status", updated_task)
     
     return updated_task
 
 
+@router.post(
+    "/{task_id}/move",
+    response_model=TaskResponse,
+    summary="태스크 순서 이동"
+)
+async def move_task(
+    task_id: UUID,
+    move_in: TaskMove,
+    current_user: CurrentUser,
+    db: DB,
+    background_tasks: BackgroundTasks
+):
+    """
+    드래그 앤 드롭으로 태스크 위치를 옮깁니다.
+    
+    - **prev_id**: 이동 후 바로 위에 올 태스크
+    - **next_id**: 이동 후 바로 아래에 올 태스크
+    - **status**: 다른 상태 컬럼으로 옮길 때 (선택)
+    
+    **Note:**
+    - 이동한 태스크 1개만 수정합니다 (사이의 태스크 번호를 다시 매기지 않음)
+    - 간격이 좁아지면 응답 후 백그라운드에서 컬럼 순서를 재정렬합니다
+    """
+    task = await db.run(TaskService.get_by_id, task_id, current_user.id, for_update=True)
+    
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="태스크를 찾을 수 없습니다"
+        )
+    
+    moved_task, needs_rebalance = await db.run(
+        TaskService.move,
+        task,
+        prev_id=move_in.prev_id,
+        next_id=move_in.next_id,
+        status=move_in.status
+    )
+    await _notify(current_user.id, "task.moved", moved_task)
+    
+    if needs_rebalance:
+        background_tasks.add_task(_rebalance_in_background, current_user.id, moved_task.status)
+    
+    return moved_task
+
+
 @router.post(
     "/{task_id}/complete",
     response_model=TaskResponse,
     summary="태스크 완료"
 )
-def complete_task(
+async def complete_task(
     task_id: UUID,
     current_user: CurrentUser,
-    db: Session = Depends(get_db)
+    db: DB
 ):
     """
     태스크를 완료 처리합니다.
@@ -297,7 +540,7 @@ def complete_task(
     - 이미 완료된 태스크도 다시 완료 처리 가능 (멱등성)
     """
     # 태스크 조회
-    task = TaskService.get_by_id(db, task_id, current_user.id)
+    task = await db.run(TaskService.get_by_id, task_id, current_user.id, for_update=True)
     
     if not task:
         raise HTTPException(
@@ -306,7 +549,8 @@ def complete_task(
         )
     
     # 완료 처리
-    completed_task = TaskService.complete(db, task)
+    completed_task = await db.run(TaskService.complete, task)
+    await _notify(current_user.id, "task.completed", completed_task)
     
     return completed_task
 
@@ -316,28 +560,60 @@ def complete_task(
     response_model=MessageResponse,
     summary="태스크 삭제"
 )
-def delete_task(
+async def delete_task(
     task_id: UUID,
     current_user: CurrentUser,
-    db: Session = Depends(get_db)
+    db: DB
 ):
     """
-    태스크를 삭제합니다.
+    태스크를 삭제합니다 (Soft Delete).
     
-    **주의:**
-    - 삭제된 태스크는 복구할 수 없습니다 (Hard Delete)
-    - 나중에 Soft Delete로 변경 가능
+    **Note:**
+    - 삭제된 태스크는 목록/조회/통계에서 바로 빠집니다
+    - TASK_PURGE_AFTER_DAYS 일 동안 `POST /api/tasks/{task_id}/restore` 로 되돌릴 수 있고,
+      이후 완전 삭제됩니다
+    - id는 삭제 기록으로 남아 `/api/tasks/changes` 의 deleted 로 전달됩니다
     """
-    # 태스크 조회
-    task = TaskService.get_by_id(db, task_id, current_user.id)
+    # 조회 없이 UPDATE 1번 (없거나 이미 삭제됐으면 404)
+    deleted = await db.run(TaskService.delete, current_user.id, task_id)
     
-    if not task:
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="태스크를 찾을 수 없습니다"
         )
     
-    # 삭제
-    TaskService.delete(db, task)
+    await _notify(current_user.id, "task.deleted", id=str(task_id))
+    
+    return MessageResponse(message="태스크가 삭제되었습니다")
+
+
+@router.post(
+    "/{task_id}/restore",
+    response_model=TaskResponse,
+    summary="태스크 삭제 취소"
+)
+async def restore_task(
+    task_id: UUID,
+    current_user: CurrentUser,
+    db: DB
+):
+    """
+    삭제한 태스크를 되돌립니다 (실행 취소).
+    
+    **Note:**
+    - 삭제 후 TASK_PURGE_AFTER_DAYS 일이 지나 완전 삭제된 태스크는 404
+    - 목록 위치와 프로젝트는 삭제 전 그대로 (그사이 프로젝트가 삭제됐으면 연결 없음)
+    - `/api/tasks/changes` 에는 다시 changed 로 전달됩니다
+    """
+    restored_task = await db.run(TaskService.restore, current_user.id, task_id)
+    
+    if not restored_task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="복구할 태스크를 찾을 수 없습니다"
+        )
+    
+    await _notify(current_user.id, "task.restored", restored_task)
     
-    return MessageResponse(message="태스크가 삭제되었습니다")
\ No newline at end of file
+    return restored_task
\ No newline at end of file
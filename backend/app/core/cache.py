@@ -0,0 +1,304 @@
+# backend/app/core/cache.py
+"""
+유저별 응답 캐시 (Read-through)
+
+- REDIS_URL이 있으면 Redis, 없으면 프로세스 내 LRU + TTL 캐시
+- 키: {prefix}:{user_id}:{version}:{kind}:{params hash}
+- 유저 데이터가 바뀌면 버전만 올림 (invalidate) → 이전 키는 자연히 만료
+- Redis 오류는 캐시 미스로 취급 (요청은 DB로 처리)
+- ETag는 응답 본문의 해시 → 내용이 같을 때만 304 (본문은 캐시 또는 DB에서)
+  버전/쓰기 횟수로 만들면 무효화가 빠진 변경(배치 작업, 다른 워커)에서
+  오래된 내용에 304가 계속 나가므로 본문 기준으로만 비교
+
+주의: 메모리 캐시는 워커 프로세스마다 따로라서, 멀티 워커에서는 다른 워커의
+      무효화가 TTL 동안 반영되지 않습니다 (TTL이 지나면 DB에서 다시 만듦).
+      운영에서는 Redis를 사용하세요.
+"""
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+from uuid import UUID
+
+from fastapi import Response
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "worklog"
+
+
+class CacheStats:
+    """캐시 적중률 지표 (프로세스 단위 누적값)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, str], int] = {}
+
+    def incr(self, kind: str, event: str) -> None:
+        with self._lock:
+            self._counters[(kind, event)] = self._counters.get((kind, event), 0) + 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            counters = dict(self._counters)
+        result: Dict[str, Dict[str, Any]] = {}
+        for (kind, event), value in counters.items():
+            result.setdefault(kind, {})[event] = value
+        for values in result.values():
+            lookups = values.get("hit", 0) + values.get("miss", 0)
+            if lookups:
+                values["hit_rate"] = round(values.get("hit", 0) / lookups, 4)
+        return result
+
+
+class LRUTTLCache:
+    """
+    프로세스 내 LRU + TTL 캐시 (스레드 안전)
+    - 항목마다 TTL 지정 가능
+    - max_entries 초과 시 가장 오래 안 쓴 항목부터 제거
+    """
+
+    def __init__(self, max_entries: int):
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self.max_entries = max_entries
+        self.evictions = 0
+
+    def get(self, key: Any) -> Optional[Any]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Any) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class MemoryBackend:
+    """프로세스 내 LRU + TTL 캐시 (Redis 미설정 시)"""
+    name = "memory"
+
+    def __init__(self, max_entries: int):
+        self._cache = LRUTTLCache(max_entries)
+        self._lock = threading.Lock()
+        self._versions: Dict[str, int] = {}  # 버전은 LRU로 밀려나면 안 됨
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        self._cache.set(key, value, ttl)
+
+    async def get_version(self, key: str) -> int:
+        with self._lock:
+            return self._versions.setdefault(key, time.time_ns())
+
+    async def bump_version(self, key: str) -> None:
+        with self._lock:
+            self._versions[key] = self._versions.get(key, time.time_ns()) + 1
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._cache),
+            "max_entries": self._cache.max_entries,
+            "evictions": self._cache.evictions,
+        }
+
+
+class RedisBackend:
+    """Redis 캐시 (워커 간 공유)"""
+    name = "redis"
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis
+        self._client = redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._client.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        await self._client.set(key, value, ex=ttl)
+
+    async def get_version(self, key: str) -> int:
+        version = await self._client.get(key)
+        if version is None:
+            # 처음이거나 버전 키가 사라졌으면 시각 기반 값으로 시작 → 예전 키와 겹치지 않음
+            await self._client.set(key, time.time_ns(), nx=True)
+            version = await self._client.get(key)
+        return int(version)
+
+    async def ping(self) -> None:
+        """헬스 체크용 (연결은 캐시와 같은 풀 사용)"""
+        await self._client.ping()
+
+    async def bump_version(self, key: str) -> None:
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.set(key, time.time_ns(), nx=True)
+            pipe.incr(key)
+            await pipe.execute()
+
+    def info(self) -> Dict[str, Any]:
+        return {}
+
+
+class UserCache:
+    """
+    유저 단위로 무효화되는 JSON 응답 캐시
+
+    사용법:
+        return await task_cache.respond(user_id, "list", params, build)
+        await task_cache.invalidate(user_id)  # 쓰기 후
+    """
+
+    def __init__(self, namespace: str, ttl: int):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._backend: Union[MemoryBackend, RedisBackend, None] = None
+
+    @property
+    def backend(self) -> Union[MemoryBackend, RedisBackend]:
+        if self._backend is None:
+            if settings.REDIS_URL:
+                self._backend = RedisBackend(settings.REDIS_URL)
+            else:
+                self._backend = MemoryBackend(settings.CACHE_MAX_ENTRIES)
+        return self._backend
+
+    def _version_key(self, user_id: UUID) -> str:
+        return f"{KEY_PREFIX}:{self.namespace}:ver:{user_id}"
+
+    @staticmethod
+    def _params_hash(params: Dict[str, Any]) -> str:
+        raw = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    async def respond(
+        self,
+        user_id: UUID,
+        kind: str,
+        params: Dict[str, Any],
+        build: Callable[[], Awaitable[Union[str, bytes]]],
+        if_none_match: Optional[str] = None,
+    ) -> Response:
+        """
+        캐시에 있으면 그대로, 없으면 build()로 JSON을 만들어 저장 후 응답
+
+        if_none_match가 본문의 ETag와 같으면 본문 없이 304
+        (build()가 404 등으로 실패하면 If-None-Match: * 여도 304 아님)
+        """
+        if not settings.CACHE_ENABLED:
+            return self._respond(await build(), if_none_match, kind)
+
+        key = None
+        try:
+            version = await self.backend.get_version(self._version_key(user_id))
+            key = f"{KEY_PREFIX}:{self.namespace}:{user_id}:{version}:{kind}:{self._params_hash(params)}"
+            cached = await self.backend.get(key)
+        except Exception as e:
+            logger.warning("cache read failed: %s", e)
+            self.stats.incr(kind, "error")
+            cached = None
+
+        if cached is not None:
+            self.stats.incr(kind, "hit")
+            return self._respond(cached, if_none_match, kind)
+
+        self.stats.incr(kind, "miss")
+        body = await build()
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        if key is not None:
+            try:
+                await self.backend.set(key, body, self.ttl)
+            except Exception as e:
+                logger.warning("cache write failed: %s", e)
+                self.stats.incr(kind, "error")
+        return self._respond(body, if_none_match, kind)
+
+    async def invalidate(self, user_id: UUID) -> None:
+        """유저의 캐시 전체 무효화 (버전 증가)"""
+        if not settings.CACHE_ENABLED:
+            return
+        try:
+            await self.backend.bump_version(self._version_key(user_id))
+            self.stats.incr("all", "invalidate")
+        except Exception as e:
+            logger.warning("cache invalidate failed: %s", e)
+            self.stats.incr("all", "error")
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend.name if settings.CACHE_ENABLED else "disabled",
+            "ttl_seconds": self.ttl,
+            **(self.backend.info() if settings.CACHE_ENABLED else {}),
+            "stats": self.stats.snapshot(),
+        }
+
+    def _respond(self, body: Union[str, bytes], if_none_match: Optional[str], kind: str) -> Response:
+        """본문 해시로 ETag → If-None-Match가 맞으면 304, 아니면 본문"""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        etag = '"' + hashlib.sha1(body).hexdigest()[:32] + '"'
+        if if_none_match and _etag_matches(if_none_match, etag):
+            self.stats.incr(kind, "not_modified")
+            return Response(status_code=304, headers=_etag_headers(etag))
+        response = Response(content=body, media_type="application/json")
+        response.headers.update(_etag_headers(etag))
+        return response
+
+
+def _etag_headers(etag: str) -> Dict[str, str]:
+    # 브라우저가 매번 If-None-Match로 재검증하도록 (유저별 응답이라 private)
+    return {
+        "ETag": etag,
+        "Cache-Control": "private, no-cache",
+        "Vary": "Authorization",
+    }
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    If-None-Match 헤더(목록, W/ 접두어, * 허용)가 etag와 맞는지 (약한 비교)
+    * 는 응답할 본문이 있을 때만 호출되므로 리소스가 있을 때만 맞음
+    """
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+# 태스크 목록 / 오늘 할 일 / 통계
+task_cache = UserCache("tasks", ttl=settings.CACHE_TTL_SECONDS)
+# 일일 노트 (월/기간 조회)
+note_cache = UserCache("notes", ttl=settings.CACHE_TTL_SECONDS)
@@ -0,0 +1,140 @@
+# backend/app/core/compression.py
+"""
+응답 압축 미들웨어 (brotli / gzip)
+
+- Accept-Encoding 에 따라 br(brotli 설치 시) > gzip 순으로 선택
+- COMPRESSION_MINIMUM_SIZE 미만 응답, 스트리밍 응답(SSE 등), 이미 인코딩된 응답은 그대로
+- 압축한 응답의 ETag 에는 인코딩 접미사를 붙임 ("abc" → "abc-br")
+  → 표현이 다르면 강한 ETag도 달라야 함. 요청의 If-None-Match 에서는 접미사를 떼고
+    앱에 전달하므로 앱의 304 판단은 그대로 동작
+"""
+import gzip
+from typing import List, Optional, Tuple
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli 미설치 시 gzip만 사용
+    brotli = None
+
+# 이보다 큰 본문은 스레드에서 압축 (이벤트 루프 블로킹 방지)
+_THREAD_MINIMUM_SIZE = 256 * 1024
+
+
+def _accepted_encodings(accept_encoding: str) -> List[str]:
+    """Accept-Encoding → q > 0 인 인코딩 목록"""
+    encodings = []
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if name and q > 0:
+            encodings.append(name)
+    return encodings
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 5):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def _choose(self, headers: Headers) -> Optional[str]:
+        accepted = _accepted_encodings(headers.get("accept-encoding", ""))
+        if brotli is not None and "br" in accepted:
+            return "br"
+        if "gzip" in accepted:
+            return "gzip"
+        return None
+
+    def _compress(self, encoding: str, body: bytes) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self._choose(Headers(scope=scope))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        scope, etag_suffix = _strip_etag_suffixes(scope)
+        start: Optional[Message] = None
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+                if message["status"] == 304 and etag_suffix:
+                    _suffix_etag(MutableHeaders(raw=message["headers"]), etag_suffix)
+                return
+            if message["type"] != "http.response.body" or start is None:
+                await send(message)
+                return
+
+            first, start = start, None
+            headers = MutableHeaders(raw=first["headers"])
+            body = message.get("body", b"")
+            if (
+                message.get("more_body", False)
+                or len(body) < self.minimum_size
+                or "content-encoding" in headers
+                or headers.get("content-type", "").startswith("text/event-stream")
+            ):
+                # 스트리밍 / 작은 응답 / 이미 인코딩됨 → 그대로 (이후 메시지도 그대로 통과)
+                await send(first)
+                await send(message)
+                return
+
+            if len(body) >= _THREAD_MINIMUM_SIZE:
+                compressed = await anyio.to_thread.run_sync(self._compress, encoding, body)
+            else:
+                compressed = self._compress(encoding, body)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            _suffix_etag(headers, f"-{encoding}")
+            await send(first)
+            await send({**message, "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
+
+
+def _suffix_etag(headers: MutableHeaders, suffix: str) -> None:
+    etag = headers.get("etag")
+    if etag and etag.endswith('"'):
+        headers["ETag"] = etag[:-1] + suffix + '"'
+
+
+def _strip_etag_suffixes(scope: Scope) -> Tuple[Scope, str]:
+    """If-None-Match 의 "-br" / "-gzip" 접미사 제거 → (새 scope, 뗀 접미사)"""
+    found = ""
+    raw_headers = []
+    for name, value in scope["headers"]:
+        if name == b"if-none-match":
+            tags = []
+            for tag in value.decode("latin-1").split(","):
+                tag = tag.strip()
+                for suffix in ('-br"', '-gzip"'):
+                    if tag.endswith(suffix):
+                        found = suffix[:-1]
+                        tag = tag[: -len(suffix)] + '"'
+                tags.append(tag)
+            value = ", ".join(tags).encode("latin-1")
+        raw_headers.append((name, value))
+    if not found:
+        return scope, ""
+    return {**scope, "headers": raw_headers}, found
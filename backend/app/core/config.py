@@ -1,4 +1,6 @@
 # app/core/config.py
+from typing import Literal, Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -15,14 +17,98 @@ class Settings(BaseSettings):
     
     # Database (alembic 등에서 필수)
     DATABASE_URL: str
+    # True면 API가 AsyncEngine(asyncpg)으로 DB 접근 (False면 동기 엔진 + 스레드풀)
+    DB_ASYNC: bool = False
+    # 비동기 엔진 URL (비워두면 DATABASE_URL에서 드라이버만 바꿔서 사용)
+    ASYNC_DATABASE_URL: Optional[str] = None
+
+    # DB 커넥션 풀 (워커 프로세스당 값 → 전체 연결 수 = 워커 수 × (SIZE + MAX_OVERFLOW))
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # 풀이 가득 찼을 때 대기 최대 시간 (초)
+    DB_POOL_RECYCLE: int = 1800  # 이 시간(초)보다 오래된 연결은 재생성 (-1: 사용 안 함)
+    # 체크아웃 시 연결 확인 방식
+    # - always: 매 체크아웃마다 ping (왕복 1회 추가)
+    # - idle: DB_POOL_PING_IDLE_SECONDS 이상 쉬었던 연결만 ping
+    # - never: ping 안 함 (끊긴 연결은 첫 쿼리에서 에러 후 폐기)
+    DB_POOL_PRE_PING: Literal["always", "idle", "never"] = "idle"
+    DB_POOL_PING_IDLE_SECONDS: float = 30.0
+
+    # SQL 로그 / 계측
+    DB_ECHO: bool = False  # 모든 SQL을 로그로 출력 (양이 많아 디버깅할 때만)
+    # 이 시간(ms) 이상 걸린 쿼리는 파라미터와 함께 경고 로그 (0: 끔)
+    SLOW_QUERY_MS: float = 200.0
+    SLOW_QUERY_EXPLAIN: bool = True  # 느린 조회 쿼리의 실행 계획(EXPLAIN)도 함께 기록
+    # 응답에 Server-Timing 헤더 (요청별 쿼리 수 / DB 시간 / 전체 처리 시간)
+    SERVER_TIMING_ENABLED: bool = True
+
+    # Redis (비워두면 프로세스 내 캐시 사용, alembic 시 불필요)
+    REDIS_URL: Optional[str] = None
+
+    # 응답 캐시 (태스크 목록 / 오늘 할 일 / 통계)
+    CACHE_ENABLED: bool = True
+    CACHE_TTL_SECONDS: int = 60
+    CACHE_MAX_ENTRIES: int = 10000  # 메모리 캐시 최대 항목 수 (LRU)
+
+    # 델타 동기화 (GET /api/tasks/changes)
+    # 이 시간(초) 안에 바뀐 행은 다음 동기화에서 한 번 더 보냄 → 늦게 커밋된 트랜잭션도 놓치지 않음
+    SYNC_WATERMARK_LAG_SECONDS: float = 5.0
+    # 삭제 기록(tombstone) 보관 기간 - 이보다 오래된 토큰은 410 (전체 다시 받기)
+    SYNC_TOMBSTONE_RETENTION_DAYS: int = 30
+
+    # 태스크 보관 (archive_tasks.py) - 완료 후 이 일수가 지난 태스크와 보관된 프로젝트의 태스크를
+    # tasks_archive 로 옮김 → 일반 조회는 작업 중인 태스크만 읽음
+    TASK_ARCHIVE_AFTER_DAYS: int = 90
+    TASK_ARCHIVE_BATCH_SIZE: int = 1000  # 트랜잭션 1번에 옮길 태스크 수
 
-    # Redis (기본값: 로컬, alembic 시 불필요)
-    REDIS_URL: str = "redis://localhost:6379"
+    # 태스크 삭제 (Soft Delete) - 삭제 후 이 일수 동안 복구(POST /api/tasks/{id}/restore) 가능,
+    # 지나면 purge_tasks.py 가 배치로 완전 삭제 (트래픽이 적은 시간에 cron 실행)
+    TASK_PURGE_AFTER_DAYS: int = 7
+    TASK_PURGE_BATCH_SIZE: int = 1000  # 트랜잭션 1번에 완전 삭제할 태스크 / 삭제 기록 수
+
+    # 일일 노트 기간 조회 최대 일수 (캘린더 한 화면 = 최대 6주, 연간 뷰는 요약 모드로)
+    DAILY_NOTE_RANGE_MAX_DAYS: int = 366
+    # 부분 수정(PATCH) 패치가 이만큼 쌓이면 응답 후 본문에 합침 (읽을 때 적용할 패치 수 상한)
+    DAILY_NOTE_COMPACT_PATCHES: int = 50
+
+    # 실시간 이벤트 (SSE, GET /api/events) - REDIS_URL이 있으면 워커 간 pub/sub
+    EVENTS_HEARTBEAT_SECONDS: float = 15.0  # 이벤트가 없을 때 연결 유지용 주석 전송 주기
+    EVENTS_BUFFER_SIZE: int = 100  # 연결당 밀린 이벤트 최대 개수 (넘으면 resync)
+
+    # 응답 압축 (Accept-Encoding: br > gzip, brotli 패키지가 없으면 gzip만)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024  # 이보다 작은 응답은 압축하지 않음 (bytes)
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5  # 동적 응답용 (높을수록 CPU 많이 씀)
+
+    # Prometheus 지표 (GET /metrics)
+    METRICS_ENABLED: bool = True
+    # 멀티 워커(uvicorn --workers)일 때 워커들이 함께 쓸 디렉터리 (비워두면 단일 프로세스 모드)
+    PROMETHEUS_MULTIPROC_DIR: Optional[str] = None
+    METRICS_GAUGE_REFRESH_SECONDS: float = 5.0  # DB 풀 / 캐시 게이지 갱신 주기 (스크랩 시에는 항상 갱신)
+
+    # 헬스 체크 (GET /health/ready)
+    HEALTH_CACHE_SECONDS: float = 5.0  # 점검 결과 재사용 시간 (프로브가 많아도 DB 부하는 워커당 이 주기에 1회)
+    HEALTH_CHECK_TIMEOUT_SECONDS: float = 2.0  # 점검 항목별 최대 대기 시간
+    HEALTH_POOL_SATURATION_WARN: float = 0.9  # 풀 사용률이 이 이상이면 warn (준비 상태는 유지)
+    HEALTH_REQUIRE_MIGRATIONS: bool = True  # DB 스키마가 alembic head가 아니면 준비 안 됨(503)
 
     # Security (기본값: 개발용, 운영에서는 반드시 .env에 설정)
     SECRET_KEY: str = "dev-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+
+    # 비밀번호 해싱 (bcrypt)
+    BCRYPT_ROUNDS: int = 12  # 바꾸면 기존 유저는 다음 로그인 때 새 cost로 재해싱
+    PASSWORD_HASH_EXECUTOR: Literal["thread", "process"] = "thread"  # bcrypt는 GIL을 풀어서 thread로도 코어 수만큼 병렬
+    PASSWORD_HASH_WORKERS: Optional[int] = None  # 비워두면 CPU 코어 수
+    PASSWORD_HASH_MAX_PENDING: int = 64  # 실행 중 + 대기 작업 상한 (넘으면 503)
+
+    # 인증 캐시 (검증된 토큰 → claims, user_id → 유저 스냅샷)
+    AUTH_CACHE_ENABLED: bool = True
+    AUTH_CACHE_MAX_ENTRIES: int = 10000
+    # 유저 스냅샷 최대 보관 시간 (초) - 다른 워커의 비활성화/수정이 반영되기까지 최대 지연
+    AUTH_USER_CACHE_TTL_SECONDS: int = 60
     
     # CORS (프론트엔드 연결)
     BACKEND_CORS_ORIGINS: list[str] = [
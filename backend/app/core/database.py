@@ -1,13 +1,138 @@
 # app/core/database.py
-from sqlalchemy import create_engine
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, TypeVar
+
+from sqlalchemy import create_engine, event
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from starlette.concurrency import run_in_threadpool
+
+from app.core.query_stats import install_query_hooks
 
 # Base는 맨 위에 정의 (alembic 등에서 settings 없이 import 가능)
 Base = declarative_base()
 
 _engine = None
 _SessionLocal = None
+_async_engine = None
+_AsyncSessionLocal = None
+
+# 동기 드라이버 → 비동기 드라이버
+_ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+T = TypeVar("T")
+
+
+class PoolMetrics:
+    """커넥션 풀 체크아웃 지표 (프로세스 단위 누적값)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.exhausted = 0  # 풀 + overflow가 모두 사용 중이라 대기해야 했던 횟수
+        self.timeouts = 0  # DB_POOL_TIMEOUT 초과로 실패한 횟수
+
+    def record_checkout(self, wait_seconds: float, exhausted: bool) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_seconds_total += wait_seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+            if exhausted:
+                self.exhausted += 1
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.exhausted += 1
+            self.timeouts += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_avg": round(self.wait_seconds_total / self.checkouts, 6) if self.checkouts else 0.0,
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+                "exhausted": self.exhausted,
+                "timeouts": self.timeouts,
+            }
+
+
+_pool_metrics = {"sync": PoolMetrics(), "async": PoolMetrics()}
+
+
+class _InstrumentedPoolMixin:
+    """체크아웃 대기 시간 / 고갈 횟수를 PoolMetrics에 기록"""
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        exhausted = (
+            self._max_overflow > -1
+            and self.overflow() >= self._max_overflow
+            and self.checkedin() == 0
+        )
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except sa_exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.record_checkout(time.perf_counter() - start, exhausted)
+        return conn
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    metrics = _pool_metrics["sync"]
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    metrics = _pool_metrics["async"]
+
+
+def _engine_options(settings, poolclass) -> Dict[str, Any]:
+    """풀 설정 (동기/비동기 엔진 공통)"""
+    return {
+        "poolclass": poolclass,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING == "always",
+        "echo": settings.DB_ECHO,
+    }
+
+
+def _install_idle_ping(engine, idle_seconds: float) -> None:
+    """
+    DB_POOL_PRE_PING=idle
+    일정 시간 이상 풀에서 쉬고 있던 연결만 체크아웃 시 ping
+    → 바쁜 연결은 왕복 없이 바로 사용, 오래 쉰 연결만 끊김 확인
+    """
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        checked_in_at = connection_record.info.get("checked_in_at")
+        if checked_in_at is None or time.monotonic() - checked_in_at < idle_seconds:
+            return
+        try:
+            alive = engine.dialect.do_ping(dbapi_connection)
+        except Exception:
+            alive = False
+        if not alive:
+            # 풀이 이 연결을 버리고 새 연결로 재시도
+            raise sa_exc.DisconnectionError()
 
 
 def _get_engine():
@@ -16,9 +141,11 @@ def _get_engine():
         from app.core.config import settings
         _engine = create_engine(
             settings.DATABASE_URL,
-            pool_pre_ping=True,
-            echo=settings.DEBUG,
+            **_engine_options(settings, InstrumentedQueuePool),
         )
+        if settings.DB_POOL_PRE_PING == "idle":
+            _install_idle_ping(_engine, settings.DB_POOL_PING_IDLE_SECONDS)
+        install_query_hooks(_engine, settings.SLOW_QUERY_MS, settings.SLOW_QUERY_EXPLAIN)
     return _engine
 
 
@@ -33,12 +160,76 @@ def _get_session_factory():
     return _SessionLocal
 
 
+def _async_database_url(url: str) -> str:
+    """DATABASE_URL의 드라이버를 비동기 드라이버로 교체 (asyncpg 등)"""
+    parsed = make_url(url)
+    driver = _ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        raise ValueError(f"비동기 드라이버를 지원하지 않는 DB입니다: {parsed.drivername}")
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def _get_async_engine():
+    global _async_engine
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import create_async_engine
+        from app.core.config import settings
+        _async_engine = create_async_engine(
+            settings.ASYNC_DATABASE_URL or _async_database_url(settings.DATABASE_URL),
+            **_engine_options(settings, InstrumentedAsyncQueuePool),
+        )
+        if settings.DB_POOL_PRE_PING == "idle":
+            _install_idle_ping(_async_engine.sync_engine, settings.DB_POOL_PING_IDLE_SECONDS)
+        install_query_hooks(_async_engine.sync_engine, settings.SLOW_QUERY_MS, settings.SLOW_QUERY_EXPLAIN)
+    return _async_engine
+
+
+def _get_async_session_factory():
+    global _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+        _AsyncSessionLocal = async_sessionmaker(
+            autoflush=False,
+            # 커밋 후 속성 접근이 이벤트 루프에서 지연 로딩(IO)을 일으키지 않도록
+            expire_on_commit=False,
+            bind=_get_async_engine(),
+        )
+    return _AsyncSessionLocal
+
+
+def get_pool_status() -> Dict[str, Dict[str, Any]]:
+    """
+    생성된 엔진별 풀 상태 + 누적 지표
+    - checked_out: 사용 중인 연결 수
+    - overflow: pool_size를 넘어 추가로 연 연결 수
+    """
+    engines = {"sync": _engine, "async": _async_engine.sync_engine if _async_engine else None}
+    status = {}
+    for name, engine in engines.items():
+        if engine is None:
+            continue
+        pool = engine.pool
+        status[name] = {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": pool._max_overflow,
+            **_pool_metrics[name].snapshot(),
+        }
+    return status
+
+
 def __getattr__(name: str):
     """하위 호환: engine / SessionLocal 접근 시 지연 생성"""
     if name == "engine":
         return _get_engine()
     if name == "SessionLocal":
         return _get_session_factory()
+    if name == "async_engine":
+        return _get_async_engine()
+    if name == "AsyncSessionLocal":
+        return _get_async_session_factory()
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
@@ -51,4 +242,67 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def get_async_db():
+    """
+    비동기 버전 get_db
+    각 요청마다 새로운 AsyncSession 제공 (asyncpg)
+    """
+    async with _get_async_session_factory()() as db:
+        yield db
+
+
+class SessionRunner:
+    """
+    서비스 함수(동기 Session 기반)를 비동기 핸들러에서 실행
+
+    - 동기 모드: 스레드풀에서 실행 (기존 def 핸들러와 동일한 방식)
+    - 비동기 모드: AsyncSession.run_sync → 이벤트 루프에서 greenlet으로 실행,
+      IO는 asyncpg가 await → 요청당 스레드를 점유하지 않음
+
+    서비스 코드는 두 모드에서 그대로 공유됩니다.
+    """
+
+    def __init__(self, session: Any, is_async: bool):
+        self.session = session
+        self.is_async = is_async
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """fn(session, *args, **kwargs) 실행"""
+        if self.is_async:
+            return await self.session.run_sync(fn, *args, **kwargs)
+        return await run_in_threadpool(fn, self.session, *args, **kwargs)
+
+    async def release(self) -> None:
+        """연결을 풀에 반환 (SSE 등 오래 열린 응답 전에 호출 - 이후 run 시 다시 체크아웃)"""
+        if self.is_async:
+            await self.session.close()
+        else:
+            await run_in_threadpool(self.session.close)
+
+
+@asynccontextmanager
+async def open_session_runner():
+    """
+    settings.DB_ASYNC에 따라 동기/비동기 세션을 열어 SessionRunner로 제공
+    요청 밖(응답 후 백그라운드 작업)에서도 핸들러와 같은 엔진/풀을 쓰도록 여기서 엶
+    """
+    from app.core.config import settings
+    if settings.DB_ASYNC:
+        async with _get_async_session_factory()() as db:
+            yield SessionRunner(db, is_async=True)
+        return
+
+    db: Session = _get_session_factory()()
+    try:
+        yield SessionRunner(db, is_async=False)
+    finally:
+        await run_in_threadpool(db.close)
+
+
+async def get_session_runner():
+    """FastAPI dependency로 사용 (open_session_runner)"""
+    async with open_session_runner() as runner:
+        yield runner
@@ -0,0 +1,202 @@
+# backend/app/core/events.py
+"""
+유저별 실시간 이벤트 브로커 (SSE 용)
+
+- 구독: 연결마다 크기 제한 큐 1개 (EVENTS_BUFFER_SIZE)
+  → 느린 클라이언트는 밀린 이벤트를 버리고 resync 이벤트 1개만 받음 (다시 조회하도록)
+- 발행: REDIS_URL이 있으면 Redis pub/sub 으로 모든 워커에 전달,
+        없으면 프로세스 내에서 바로 전달 (단일 노드)
+- Redis 구독 연결은 워커당 1개, 이 워커에 연결된 유저 채널만 구독
+- 메시지는 발행 시 SSE 형식으로 한 번만 직렬화 → 구독자 수만큼 복사하지 않음
+"""
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Set
+from uuid import UUID
+
+from app.core.cache import task_cache
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "worklog:events:"
+
+# 버퍼가 넘쳤을 때 보내는 이벤트 → 클라이언트는 /api/tasks/changes 로 다시 동기화
+RESYNC_MESSAGE = "event: resync\ndata: {}\n\n"
+
+
+def format_sse(event_type: str, data: Dict[str, Any]) -> str:
+    """SSE 메시지 1개 (event + data)"""
+    return f"event: {event_type}\ndata: {json.dumps(data, separators=(',', ':'), default=str)}\n\n"
+
+
+class Subscription:
+    """SSE 연결 1개의 이벤트 버퍼"""
+
+    def __init__(self, maxsize: int):
+        self.queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=maxsize)
+        self.overflows = 0
+
+    def push(self, message: str) -> bool:
+        """버퍼에 추가 (가득 찼으면 비우고 resync 1개만 남김) → 정상 추가 여부"""
+        try:
+            self.queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            self.overflows += 1
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC_MESSAGE)
+            return False
+
+    async def get(self, timeout: float) -> Optional[str]:
+        """다음 메시지 (timeout 동안 없으면 None → heartbeat)"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class EventBroker:
+    """
+    유저 단위 이벤트 발행/구독
+
+    사용법:
+        await event_broker.publish(user_id, "task.created", {...})
+        async with event_broker.subscribe(user_id) as subscription:
+            message = await subscription.get(timeout)
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[Subscription]] = defaultdict(set)
+        self._lock = asyncio.Lock()
+        self._redis = None
+        self._pubsub = None
+        self._reader: Optional[asyncio.Task] = None
+        self._has_channels = asyncio.Event()
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+
+    @property
+    def backend(self) -> str:
+        return "redis" if settings.REDIS_URL else "memory"
+
+    def _client(self):
+        if self._redis is None:
+            import redis.asyncio as redis
+            self._redis = redis.Redis.from_url(settings.REDIS_URL, socket_connect_timeout=0.5)
+        return self._redis
+
+    async def publish(self, user_id: UUID, event_type: str, data: Dict[str, Any]) -> None:
+        """이벤트 발행 (실패해도 요청은 성공 처리 - 로그만 남김)"""
+        message = format_sse(event_type, data)
+        self.published += 1
+        if settings.REDIS_URL:
+            try:
+                await self._client().publish(f"{CHANNEL_PREFIX}{user_id}", message)
+                return
+            except Exception as e:
+                # Redis 장애 시 최소한 같은 워커의 연결에는 전달
+                logger.warning("event publish failed: %s", e)
+        self._dispatch(str(user_id), message)
+
+    def _dispatch(self, user_key: str, message: str) -> None:
+        for subscription in tuple(self._subscribers.get(user_key, ())):
+            if subscription.push(message):
+                self.delivered += 1
+            else:
+                self.dropped += 1
+
+    @asynccontextmanager
+    async def subscribe(self, user_id: UUID) -> AsyncIterator[Subscription]:
+        """연결 1개 구독 (블록을 벗어나면 해제)"""
+        user_key = str(user_id)
+        subscription = Subscription(settings.EVENTS_BUFFER_SIZE)
+        async with self._lock:
+            first = not self._subscribers[user_key]
+            self._subscribers[user_key].add(subscription)
+            if first and settings.REDIS_URL:
+                await self._redis_subscribe(user_key)
+        try:
+            yield subscription
+        finally:
+            async with self._lock:
+                self._subscribers[user_key].discard(subscription)
+                if not self._subscribers[user_key]:
+                    del self._subscribers[user_key]
+                    if settings.REDIS_URL:
+                        await self._redis_unsubscribe(user_key)
+
+    async def _redis_subscribe(self, user_key: str) -> None:
+        try:
+            if self._pubsub is None:
+                self._pubsub = self._client().pubsub(ignore_subscribe_messages=True)
+            await self._pubsub.subscribe(f"{CHANNEL_PREFIX}{user_key}")
+            self._has_channels.set()
+            if self._reader is None or self._reader.done():
+                self._reader = asyncio.create_task(self._read_redis())
+        except Exception as e:
+            logger.warning("event subscribe failed: %s", e)
+
+    async def _redis_unsubscribe(self, user_key: str) -> None:
+        try:
+            await self._pubsub.unsubscribe(f"{CHANNEL_PREFIX}{user_key}")
+        except Exception as e:
+            logger.warning("event unsubscribe failed: %s", e)
+
+    async def _read_redis(self) -> None:
+        """Redis 메시지 → 이 워커의 구독자에게 전달 (워커당 태스크 1개)"""
+        while True:
+            try:
+                if not self._pubsub.subscribed:
+                    self._has_channels.clear()
+                    if not self._pubsub.subscribed:  # clear 전에 구독이 생겼을 수 있음
+                        await self._has_channels.wait()
+                    continue
+                message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if message is None or message["type"] != "message":
+                    continue
+                channel = message["channel"].decode("utf-8")
+                self._dispatch(channel[len(CHANNEL_PREFIX):], message["data"].decode("utf-8"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 연결 끊김 등 - redis-py가 다시 연결하면서 채널을 재구독함
+                logger.warning("event reader error: %s", e)
+                await asyncio.sleep(1.0)
+
+    async def shutdown(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+        if self._redis is not None:
+            await self._redis.aclose()
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "users": len(self._subscribers),
+            "connections": sum(len(subscriptions) for subscriptions in self._subscribers.values()),
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+        }
+
+
+# 태스크 변경 알림
+event_broker = EventBroker()
+
+
+async def notify_users(user_ids: Iterable[UUID], event_type: str, data: Optional[Dict[str, Any]] = None) -> None:
+    """
+    요청 밖(배치 스크립트)에서 태스크/프로젝트가 바뀐 유저마다: 캐시 무효화 + 이벤트 발행
+    REDIS_URL이 있어야 API 워커에 전달됨 (없으면 이 프로세스 안에서만 - API 캐시는 TTL 후 갱신)
+    """
+    for user_id in user_ids:
+        await task_cache.invalidate(user_id)
+        await event_broker.publish(user_id, event_type, data or {})
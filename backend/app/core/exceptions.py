@@ -0,0 +1,132 @@
+# backend/app/core/exceptions.py
+"""
+커스텀 예외
+- 라우터에서 raise 하면 FastAPI가 그대로 HTTP 응답으로 변환
+"""
+from typing import Optional
+
+from fastapi import HTTPException, status
+
+
+class UserAlreadyExistsException(HTTPException):
+    """이미 존재하는 유저 (이메일/유저명 중복)"""
+
+    def __init__(self, detail: str = "이미 존재하는 유저입니다"):
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+class InvalidCredentialsException(HTTPException):
+    """이메일 또는 비밀번호 불일치"""
+
+    def __init__(self, detail: str = "이메일 또는 비밀번호가 올바르지 않습니다"):
+        super().__init__(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=detail,
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+class CredentialsException(HTTPException):
+    """토큰 검증 실패"""
+
+    def __init__(self, detail: str = "인증 정보를 확인할 수 없습니다"):
+        super().__init__(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=detail,
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+class InactiveUserException(HTTPException):
+    """비활성화된 유저"""
+
+    def __init__(self, detail: str = "비활성화된 유저입니다"):
+        super().__init__(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+
+
+class InvalidCursorException(HTTPException):
+    """잘못된 페이지네이션 커서"""
+
+    def __init__(self, detail: str = "유효하지 않은 커서입니다"):
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+class ServiceBusyException(HTTPException):
+    """일시적 과부하 (잠시 후 재시도)"""
+
+    def __init__(self, detail: str = "요청이 많아 잠시 후 다시 시도해주세요", retry_after: int = 1):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+class InvalidFieldsException(HTTPException):
+    """fields 파라미터에 없는 필드"""
+
+    def __init__(self, detail: str = "알 수 없는 필드입니다"):
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+class TaskNotFoundException(HTTPException):
+    """태스크 없음 (또는 본인 태스크 아님)"""
+
+    def __init__(self, detail: str = "태스크를 찾을 수 없습니다"):
+        super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+
+
+class InvalidTaskMoveException(HTTPException):
+    """잘못된 태스크 이동 요청"""
+
+    def __init__(self, detail: str = "이동 위치가 올바르지 않습니다"):
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+class SyncTokenExpiredException(HTTPException):
+    """삭제 기록 보관 기간이 지난 동기화 토큰 → 전체 목록을 다시 받아야 함"""
+
+    def __init__(self, detail: str = "동기화 토큰이 만료되었습니다. 전체 목록을 다시 받아주세요"):
+        super().__init__(status_code=status.HTTP_410_GONE, detail=detail)
+
+
+class DailyNoteNotFoundException(HTTPException):
+    """해당 날짜의 노트 없음"""
+
+    def __init__(self, detail: str = "해당 날짜의 노트가 없습니다"):
+        super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+
+
+class InvalidDateRangeException(HTTPException):
+    """잘못된 조회 기간 (시작 > 끝, 너무 긴 기간, 형식 오류)"""
+
+    def __init__(self, detail: str = "조회 기간이 올바르지 않습니다"):
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+class StaleRevisionException(HTTPException):
+    """부분 수정의 base_revision 이 현재 노트 revision 과 다름 → 최신 노트를 받아 다시 적용"""
+
+    def __init__(self, current_revision: Optional[int] = None):
+        headers = None
+        if current_revision is not None:
+            headers = {"X-Note-Revision": str(current_revision)}
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="노트가 다른 곳에서 수정되었습니다. 최신 내용을 받아 다시 적용해주세요",
+            headers=headers,
+        )
+
+
+class InvalidPatchException(HTTPException):
+    """본문 범위를 벗어난 부분 수정 ops"""
+
+    def __init__(self, detail: str = "부분 수정 내용이 올바르지 않습니다"):
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+class ProjectNotFoundException(HTTPException):
+    """프로젝트 없음 (다른 유저의 프로젝트 포함)"""
+
+    def __init__(self, detail: str = "프로젝트를 찾을 수 없습니다"):
+        super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
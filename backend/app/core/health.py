@@ -0,0 +1,173 @@
+# backend/app/core/health.py
+"""
+헬스 체크 (GET /health/live, /health/ready)
+
+- live: 프로세스가 응답하는지만 (의존성 확인 없음 → DB 장애로 재시작 루프에 빠지지 않음)
+- ready: 트래픽을 받아도 되는지
+  - database: 연결 + 쿼리 가능 (풀과 별개의 연결 → 풀이 가득 차도 DB 상태는 따로 판단)
+  - migrations: DB의 alembic 버전이 코드의 head 와 같은지
+  - redis: REDIS_URL 이 있을 때 PING
+  - db_pool: 풀 사용률 (HEALTH_POOL_SATURATION_WARN 이상이면 warn - 준비 상태는 유지)
+
+결과는 워커마다 HEALTH_CACHE_SECONDS 동안 재사용하고, 동시에 들어온 프로브는
+진행 중인 점검 하나를 같이 기다림 → 파드/프로브 수가 늘어도 DB 부하는 워커당 주기 1회
+각 점검은 HEALTH_CHECK_TIMEOUT_SECONDS 안에 끝나지 않으면 fail (워커를 붙잡지 않음)
+"""
+import asyncio
+import logging
+import math
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import NullPool
+from starlette.concurrency import run_in_threadpool
+
+from app.core.cache import task_cache
+from app.core.config import settings
+from app.core.database import get_pool_status
+
+logger = logging.getLogger(__name__)
+
+_ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+OK, WARN, FAIL, SKIPPED = "ok", "warn", "fail", "skipped"
+
+
+def _alembic_heads() -> Optional[set]:
+    """코드(alembic/versions)의 head 리비전 (alembic 미설치 / 설정 없음이면 None)"""
+    try:
+        from alembic.config import Config
+        from alembic.script import ScriptDirectory
+    except ImportError:
+        return None
+    if not _ALEMBIC_INI.exists():
+        return None
+    return set(ScriptDirectory.from_config(Config(str(_ALEMBIC_INI))).get_heads())
+
+
+class HealthChecker:
+    def __init__(self):
+        self._engine = None
+        self._heads: Optional[set] = None
+        self._heads_loaded = False
+        self._result: Optional[Dict[str, Any]] = None
+        self._checked_at = 0.0
+        self._inflight: Optional[asyncio.Task] = None
+
+    def _probe_engine(self):
+        """프로브 전용 엔진 (NullPool: 점검마다 연결을 열고 닫음, 앱 풀을 차지하지 않음)"""
+        if self._engine is None:
+            url = make_url(settings.DATABASE_URL)
+            connect_args = {}
+            if url.get_backend_name() == "postgresql":
+                # 연결 자체가 멈춰도 스레드가 오래 묶이지 않도록 (libpq는 최소 2초)
+                connect_args["connect_timeout"] = max(2, math.ceil(settings.HEALTH_CHECK_TIMEOUT_SECONDS))
+            self._engine = create_engine(url, poolclass=NullPool, connect_args=connect_args)
+        return self._engine
+
+    def _query_database(self) -> Optional[str]:
+        """연결 확인 후 현재 alembic 버전 (테이블이 없으면 None)"""
+        with self._probe_engine().connect() as conn:
+            conn.execute(text("SELECT 1"))
+            try:
+                return conn.execute(text("SELECT version_num FROM alembic_version")).scalar()
+            except Exception:
+                return None
+
+    async def _timed(self, coro) -> Dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            value = await asyncio.wait_for(coro, settings.HEALTH_CHECK_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            return {"status": FAIL, "error": f"timeout ({settings.HEALTH_CHECK_TIMEOUT_SECONDS}s)"}
+        except Exception as e:
+            return {"status": FAIL, "error": str(e).splitlines()[0][:200]}
+        return {"status": OK, "latency_ms": round((time.perf_counter() - start) * 1000, 2), "value": value}
+
+    async def _check_migrations(self, database: Dict[str, Any]) -> Dict[str, Any]:
+        if database["status"] != OK:
+            return {"status": SKIPPED, "reason": "database unavailable"}
+        if not self._heads_loaded:
+            self._heads = await run_in_threadpool(_alembic_heads)
+            self._heads_loaded = True
+        current = database.get("value")
+        if self._heads is None:
+            return {"status": SKIPPED, "reason": "alembic not available", "current": current}
+        head = ",".join(sorted(self._heads))
+        if current in self._heads:
+            return {"status": OK, "current": current, "head": head}
+        return {
+            "status": FAIL if settings.HEALTH_REQUIRE_MIGRATIONS else WARN,
+            "current": current,
+            "head": head,
+            "reason": "alembic upgrade head 필요" if current else "alembic_version 없음",
+        }
+
+    @staticmethod
+    def _check_pool() -> Dict[str, Any]:
+        engines = {}
+        worst = 0.0
+        for name, status in get_pool_status().items():
+            capacity = status["size"] + max(status["max_overflow"], 0)
+            saturation = status["checked_out"] / capacity if capacity else 0.0
+            worst = max(worst, saturation)
+            engines[name] = {
+                "checked_out": status["checked_out"],
+                "capacity": capacity,
+                "saturation": round(saturation, 3),
+                "timeouts": status["timeouts"],
+            }
+        return {
+            "status": WARN if worst >= settings.HEALTH_POOL_SATURATION_WARN else OK,
+            "engines": engines,
+        }
+
+    async def _run_checks(self) -> Dict[str, Any]:
+        if settings.REDIS_URL:
+            database, redis = await asyncio.gather(
+                self._timed(run_in_threadpool(self._query_database)),
+                self._timed(task_cache.backend.ping()),
+            )
+            redis.pop("value", None)
+        else:
+            database = await self._timed(run_in_threadpool(self._query_database))
+            redis = {"status": SKIPPED, "reason": "REDIS_URL not set"}
+
+        checks = {
+            "database": database,
+            "migrations": await self._check_migrations(database),
+            "redis": redis,
+            "db_pool": self._check_pool(),
+        }
+        database.pop("value", None)
+        return {
+            "status": FAIL if any(check["status"] == FAIL for check in checks.values()) else OK,
+            "checked_at": datetime.now(timezone.utc).isoformat(),
+            "checks": checks,
+        }
+
+    async def readiness(self) -> Dict[str, Any]:
+        """
+        준비 상태 (캐시된 결과가 있으면 그대로)
+        {"status": "ok" | "fail", "checked_at", "cached", "checks": {...}}
+        """
+        if self._result is not None and time.monotonic() - self._checked_at < settings.HEALTH_CACHE_SECONDS:
+            return {**self._result, "cached": True}
+
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.create_task(self._run_checks())
+        # shield: 프로브 요청이 끊겨도 진행 중인 점검은 다른 프로브를 위해 계속
+        result = await asyncio.shield(self._inflight)
+        if self._inflight is not None and self._inflight.done():
+            self._result = result
+            self._checked_at = time.monotonic()
+        if result["status"] == FAIL:
+            logger.warning("readiness check failed: %s", result["checks"])
+        return {**result, "cached": False}
+
+
+health_checker = HealthChecker()
@@ -0,0 +1,183 @@
+# backend/app/core/metrics.py
+"""
+Prometheus 지표 (GET /metrics)
+
+- MetricsMiddleware: 요청 수 / 처리 중인 요청 수 / 지연 히스토그램
+  - 라벨은 실제 경로가 아니라 라우트 템플릿 (/api/tasks/{task_id}) → 라벨 개수가 라우트 수로 고정
+  - 매칭되는 라우트가 없으면(404 스캔 등) route="unmatched"
+- register_gauge: DB 풀 / 캐시 / SSE 등 상태값을 게이지로 연결
+  (콜백은 스크랩 시, 그리고 요청 처리 중 METRICS_GAUGE_REFRESH_SECONDS 마다 호출)
+- 멀티 워커: PROMETHEUS_MULTIPROC_DIR 를 설정하면 워커별 값을 파일(mmap)로 공유하고
+  /metrics 는 어느 워커가 받든 전체 합계를 응답
+  → 디렉터리는 워커들이 뜨기 전에 비워두세요 (이전 실행의 값이 남음)
+"""
+import logging
+import os
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+# prometheus_client는 import 시점에 멀티프로세스 모드를 결정 → 먼저 환경 변수 설정
+if settings.PROMETHEUS_MULTIPROC_DIR:
+    os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", settings.PROMETHEUS_MULTIPROC_DIR)
+
+from prometheus_client import (  # noqa: E402
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+logger = logging.getLogger(__name__)
+
+MULTIPROCESS = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+# API 응답 시간 분포에 맞춘 버킷 (초) - 버킷 수가 곧 라우트당 시계열 수
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 이 외의 메서드는 "other" (임의 메서드로 라벨이 늘어나는 것 방지)
+_METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+
+REQUESTS = Counter(
+    "http_requests_total",
+    "처리한 HTTP 요청 수",
+    ["method", "route", "status"],
+)
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간 (응답 본문 전송 완료까지)",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "처리 중인 HTTP 요청 수 (SSE 등 열린 스트림 포함)",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+GaugeCallback = Callable[[], Iterable[Tuple[Sequence[str], float]]]
+_gauge_sources: List[Tuple[Gauge, GaugeCallback]] = []
+_last_refresh = 0.0
+
+
+def register_gauge(
+    name: str,
+    documentation: str,
+    labelnames: Sequence[str],
+    collect: GaugeCallback,
+) -> None:
+    """
+    상태값 게이지 등록
+    collect() → [(라벨 값 튜플, 값), ...]  (워커가 여럿이면 워커별 값의 합으로 노출)
+    """
+    gauge = Gauge(name, documentation, labelnames, multiprocess_mode="livesum")
+    _gauge_sources.append((gauge, collect))
+
+
+def refresh_gauges(force: bool = False) -> None:
+    """등록된 게이지 값 갱신 (force가 아니면 METRICS_GAUGE_REFRESH_SECONDS 간격으로만)"""
+    global _last_refresh
+    now = time.monotonic()
+    if not force and now - _last_refresh < settings.METRICS_GAUGE_REFRESH_SECONDS:
+        return
+    _last_refresh = now
+    for gauge, collect in _gauge_sources:
+        try:
+            for labels, value in collect():
+                (gauge.labels(*labels) if labels else gauge).set(value)
+        except Exception as e:
+            logger.warning("gauge %s collect failed: %s", gauge._name, e)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """/metrics 응답 (본문, Content-Type)"""
+    refresh_gauges(force=True)
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """워커 종료 시 호출 - 이 워커의 live 게이지 값을 합계에서 제외"""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
+
+
+def _route_template(scope: Scope) -> str:
+    """
+    요청 경로 → 라우트 템플릿 (/api/tasks/3fa8... → /api/tasks/{task_id})
+    include_router 로 붙은 라우트는 route.path 에 prefix가 없을 수 있어서,
+    실제 경로에서 경로 파라미터 값인 구간만 {이름} 으로 바꿈
+    """
+    if scope.get("route") is None:
+        return "unmatched"
+    path = scope.get("root_path", "") + scope["path"]
+    params = scope.get("path_params")
+    if not params:
+        return path
+    names = {str(value).lower(): name for name, value in params.items()}
+    return "/".join(
+        "{" + names[segment.lower()] + "}" if segment.lower() in names else segment
+        for segment in path.split("/")
+    )
+
+
+class MetricsMiddleware:
+    """
+    요청 수 / 처리 중 / 지연 기록
+    라우팅 후 scope["route"] 에서 템플릿을 읽으므로 scope를 새로 만드는 미들웨어보다 안쪽에 등록
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        # (method, route, status) → 라벨이 붙은 지표 (labels() 조회 반복 방지)
+        self._children: Dict[Tuple[str, str, int], Tuple[Counter, Histogram]] = {}
+        self._in_progress: Dict[str, Gauge] = {}
+
+    def _observe(self, method: str, route: str, status: int, elapsed: float) -> None:
+        key = (method, route, status)
+        children = self._children.get(key)
+        if children is None:
+            children = (
+                REQUESTS.labels(method, route, str(status)),
+                REQUEST_DURATION.labels(method, route),
+            )
+            self._children[key] = children
+        children[0].inc()
+        children[1].observe(elapsed)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"] if scope["method"] in _METHODS else "other"
+        in_progress = self._in_progress.get(method)
+        if in_progress is None:
+            in_progress = self._in_progress[method] = IN_PROGRESS.labels(method)
+        status: Optional[int] = None
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            in_progress.dec()
+            self._observe(method, _route_template(scope), status or 500, elapsed)
+            refresh_gauges()
@@ -0,0 +1,29 @@
+# backend/app/core/pagination.py
+"""
+커서(Keyset) 페이지네이션 유틸
+- 마지막 행의 정렬 키를 base64(JSON)로 인코딩한 불투명 문자열
+- 클라이언트는 내용을 해석하지 않고 그대로 다음 요청에 전달
+"""
+import base64
+import json
+from typing import Any, List
+
+from app.core.exceptions import InvalidCursorException
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """정렬 키 → 커서 문자열"""
+    raw = json.dumps(values, separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """커서 문자열 → 정렬 키 (형식이 맞지 않으면 400)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError):
+        raise InvalidCursorException()
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorException()
+    return values
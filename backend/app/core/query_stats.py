@@ -0,0 +1,194 @@
+# backend/app/core/query_stats.py
+"""
+요청별 SQL 쿼리 수 / DB 시간 측정 + 느린 쿼리 로그
+
+- 엔진 이벤트(before/after_cursor_execute)로 실행마다 시간을 잼
+  → 현재 요청(ContextVar)의 QueryStats에 누적
+  (스레드풀 / AsyncSession greenlet 모두 요청의 context를 그대로 물려받음)
+- QueryStatsMiddleware: 응답 헤더에 Server-Timing 추가
+    Server-Timing: db;dur=3.1;desc="4 queries", app;dur=12.5
+- SLOW_QUERY_MS 이상 걸린 쿼리는 파라미터 + 실행 계획(EXPLAIN)과 함께 경고 로그
+- count_queries / assert_max_queries: 테스트·점검 스크립트에서 쿼리 수 상한 확인 (N+1 방지)
+"""
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, List, Optional
+
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger("app.sql.slow")
+
+# 로그에 남길 파라미터 값 최대 길이 (긴 본문 등은 잘라냄)
+_PARAM_MAX_LENGTH = 200
+# 이름에 이 단어가 들어간 파라미터는 값을 가림
+_SECRET_PARAMS = ("password", "token", "secret")
+# 실행 계획을 볼 쿼리 (EXPLAIN은 실행하지 않으므로 DML도 안전하지만 조회만 대상)
+_EXPLAINABLE = ("SELECT", "WITH")
+
+
+class QueryStats:
+    """
+    한 요청(또는 측정 구간)에서 실행된 쿼리 수와 DB 시간
+    측정 구간이 겹치면 바깥 구간(parent)에도 함께 누적
+    """
+
+    def __init__(self, record_statements: bool = False, parent: Optional["QueryStats"] = None):
+        self.count = 0
+        self.duration = 0.0  # 초
+        self.statements: Optional[List[str]] = [] if record_statements else None
+        self.parent = parent
+
+    def add(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.duration += elapsed
+        if self.statements is not None:
+            self.statements.append(statement)
+        if self.parent is not None:
+            self.parent.add(statement, elapsed)
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current.get()
+
+
+def _format_parameters(parameters: Any) -> str:
+    if isinstance(parameters, dict):
+        items = parameters.items()
+    elif isinstance(parameters, (list, tuple)):
+        items = enumerate(parameters)
+    else:
+        return repr(parameters)
+    formatted = []
+    for key, value in items:
+        if isinstance(key, str) and any(word in key.lower() for word in _SECRET_PARAMS):
+            formatted.append(f"{key}=***")
+            continue
+        text = repr(value)
+        if len(text) > _PARAM_MAX_LENGTH:
+            text = text[:_PARAM_MAX_LENGTH] + "...'"
+        formatted.append(f"{key}={text}")
+    return ", ".join(formatted)
+
+
+def _explain(conn, statement: str, parameters: Any) -> str:
+    """
+    같은 연결에서 실행 계획 조회 (DBAPI 커서 직접 사용 → 이벤트 재진입 없음)
+    PostgreSQL은 EXPLAIN 실패가 트랜잭션을 망가뜨리지 않도록 SAVEPOINT 안에서 실행
+    """
+    dbapi_cursor = conn.connection.cursor()
+    try:
+        if conn.dialect.name == "postgresql":
+            dbapi_cursor.execute("SAVEPOINT slow_query_explain")
+            try:
+                dbapi_cursor.execute(f"EXPLAIN {statement}", parameters)
+                lines = [row[0] for row in dbapi_cursor.fetchall()]
+            except Exception:
+                dbapi_cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+                raise
+            dbapi_cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+        else:
+            dbapi_cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            lines = [str(row[-1]) for row in dbapi_cursor.fetchall()]
+    finally:
+        dbapi_cursor.close()
+    return "\n".join(lines)
+
+
+def install_query_hooks(engine, slow_query_ms: float = 0, explain: bool = True) -> None:
+    """
+    엔진에 쿼리 측정 이벤트 등록 (동기 엔진 / AsyncEngine.sync_engine)
+    slow_query_ms <= 0 이면 느린 쿼리 로그 끔
+    """
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        stats = _current.get()
+        if stats is not None:
+            stats.add(statement, elapsed)
+        if slow_query_ms <= 0 or elapsed * 1000 < slow_query_ms:
+            return
+
+        plan = None
+        if explain and not executemany and statement.lstrip().upper().startswith(_EXPLAINABLE):
+            try:
+                plan = _explain(conn, statement, parameters)
+            except Exception as e:
+                plan = f"(EXPLAIN 실패: {e})"
+        logger.warning(
+            "느린 쿼리 %.1fms\n%s\n파라미터: %s%s",
+            elapsed * 1000,
+            statement,
+            "(executemany)" if executemany else _format_parameters(parameters),
+            f"\n실행 계획:\n{plan}" if plan else "",
+        )
+
+
+@contextmanager
+def count_queries(record_statements: bool = True) -> Iterator[QueryStats]:
+    """
+    블록 안에서 실행된 쿼리 수 측정
+
+    with count_queries() as stats:
+        client.get("/api/tasks")
+    print(stats.count, stats.statements)
+    """
+    stats = QueryStats(record_statements=record_statements, parent=_current.get())
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def assert_max_queries(limit: int, label: str = "") -> Iterator[QueryStats]:
+    """블록 안의 쿼리 수가 limit을 넘으면 AssertionError (실행된 SQL 목록 포함)"""
+    with count_queries() as stats:
+        yield stats
+    if stats.count > limit:
+        statements = "\n".join(f"  {i}. {sql}" for i, sql in enumerate(stats.statements or [], 1))
+        raise AssertionError(
+            f"{label + ': ' if label else ''}쿼리 {stats.count}개 실행 (최대 {limit}개)\n{statements}"
+        )
+
+
+class QueryStatsMiddleware:
+    """요청마다 QueryStats를 열고, 응답 시작 시 Server-Timing 헤더 추가"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(parent=_current.get())
+        token = _current.set(stats)
+        start = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries", '
+                    f"app;dur={(time.perf_counter() - start) * 1000:.1f}",
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
@@ -0,0 +1,139 @@
+# backend/app/core/security.py
+"""
+보안 유틸
+- 비밀번호 해싱 (bcrypt, 요청 핸들러에서는 전용 워커 풀에서 실행)
+- JWT 생성/검증 (검증 결과는 토큰 만료 시각까지 캐시)
+"""
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, Union
+
+import bcrypt
+from jose import jwt, JWTError
+
+from app.core.cache import LRUTTLCache
+from app.core.config import settings
+from app.core.exceptions import ServiceBusyException
+
+# bcrypt가 받는 비밀번호 최대 길이 (바이트, bcrypt>=4.1 은 넘으면 ValueError)
+PASSWORD_MAX_BYTES = 72
+
+# 검증된 토큰 → claims
+_token_cache = LRUTTLCache(settings.AUTH_CACHE_MAX_ENTRIES)
+
+
+def get_password_hash(password: str, rounds: Optional[int] = None) -> str:
+    """비밀번호 해싱 (rounds: bcrypt cost, 기본값 settings.BCRYPT_ROUNDS)"""
+    salt = bcrypt.gensalt(rounds=rounds or settings.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증"""
+    try:
+        return bcrypt.checkpw(
+            plain_password.encode("utf-8"),
+            hashed_password.encode("utf-8"),
+        )
+    except ValueError:
+        return False
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """저장된 해시의 cost가 현재 설정(BCRYPT_ROUNDS)과 다른지"""
+    try:
+        return int(hashed_password.split("$")[2]) != settings.BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
+
+
+class PasswordHasher:
+    """
+    비밀번호 해싱 전용 워커 풀
+    - 해싱은 일부러 느린 CPU 작업 → 이벤트 루프/기본 스레드풀과 분리
+    - 실행 중 + 대기 작업이 max_pending을 넘으면 바로 503 (큐가 무한히 쌓이지 않게)
+    """
+
+    def __init__(self):
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            workers = settings.PASSWORD_HASH_WORKERS or os.cpu_count() or 1
+            if settings.PASSWORD_HASH_EXECUTOR == "process":
+                self._executor = ProcessPoolExecutor(max_workers=workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="password-hash"
+                )
+        return self._executor
+
+    async def _submit(self, fn, *args):
+        with self._lock:
+            if self._pending >= settings.PASSWORD_HASH_MAX_PENDING:
+                raise ServiceBusyException()
+            self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, fn, *args)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(get_password_hash, password, settings.BCRYPT_ROUNDS)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit(verify_password, plain_password, hashed_password)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher()
+
+
+def create_access_token(
+    subject: Union[str, Any],
+    expires_delta: Optional[timedelta] = None,
+) -> str:
+    """JWT 액세스 토큰 생성 (sub = user id)"""
+    if expires_delta is None:
+        expires_delta = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    expire = datetime.now(timezone.utc) + expires_delta
+    to_encode = {"exp": expire, "sub": str(subject)}
+    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
+
+def decode_access_token(token: str) -> Optional[dict]:
+    """JWT 디코딩 (실패 시 None)"""
+    try:
+        return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except JWTError:
+        return None
+
+
+def decode_access_token_cached(token: str) -> Optional[dict]:
+    """
+    decode_access_token + 캐시
+    - 검증에 성공한 토큰만 exp까지 보관 (만료된 claims는 반환되지 않음)
+    - 실패한 토큰은 캐시하지 않음
+    """
+    if not settings.AUTH_CACHE_ENABLED:
+        return decode_access_token(token)
+
+    payload = _token_cache.get(token)
+    if payload is None:
+        payload = decode_access_token(token)
+        if payload is not None:
+            _token_cache.set(token, payload, payload.get("exp", 0) - time.time())
+    return payload
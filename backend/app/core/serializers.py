@@ -0,0 +1,33 @@
+# backend/app/core/serializers.py
+"""
+빠른 JSON 직렬화 (orjson)
+
+- DB에서 읽은 컬럼 튜플은 이미 스키마 타입과 같음 → Pydantic 검증 없이 바로 인코딩
+- UUID / datetime / Enum(값) 은 orjson이 직접 처리
+  (asyncpg의 UUID는 uuid.UUID 하위 클래스라 orjson이 못 알아봄 → default에서 문자열로)
+- UTC 시각은 Pydantic과 같은 형식('Z')으로 출력 → 기존 응답과 동일한 JSON
+"""
+from typing import Any, Iterable, List, Optional, Sequence
+from uuid import UUID
+
+import orjson
+
+_OPTIONS = orjson.OPT_UTC_Z
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, UUID):
+        return str(obj)
+    raise TypeError
+
+
+def dumps(obj: Any) -> bytes:
+    """dict / list → JSON bytes"""
+    return orjson.dumps(obj, default=_default, option=_OPTIONS)
+
+
+def rows_to_dicts(rows: Iterable[Any], keys: Optional[Sequence[str]] = None) -> List[dict]:
+    """SQLAlchemy Row 목록 → dict 목록 (컬럼 이름이 키, keys를 주면 그 컬럼만)"""
+    if keys is None:
+        return [row._asdict() for row in rows]
+    return [{key: row._mapping[key] for key in keys} for row in rows]
@@ -1,14 +1,36 @@
 # app/main.py
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
+from app.core.compression import CompressionMiddleware
+from app.core.cache import note_cache, task_cache
+from app.core.database import get_pool_status
+from app.core.events import event_broker
+from app.core.health import health_checker
+from app.core.metrics import MetricsMiddleware, mark_process_dead, register_gauge, render_metrics
+from app.core.query_stats import QueryStatsMiddleware
+from app.core.security import password_hasher
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 시작/종료 시 리소스 관리"""
+    yield
+    await event_broker.shutdown()
+    password_hasher.shutdown()
+    mark_process_dead()
+
 
 # 앱을 먼저 생성 (api_router 로드 실패해도 서버는 기동)
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     debug=settings.DEBUG,
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -17,8 +39,24 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Server-Timing", "X-Note-Revision"],
 )
 
+# 라우트 템플릿을 읽어야 하므로 scope를 새로 만드는 압축 미들웨어보다 안쪽
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+if settings.SERVER_TIMING_ENABLED:
+    app.add_middleware(QueryStatsMiddleware)
+
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
+
 
 @app.get("/")
 def read_root():
@@ -30,11 +68,92 @@ def read_root():
 
 
 @app.get("/health")
+@app.get("/health/live")
 def health_check():
-    """서버 상태 확인 (나중에 DB, Redis 연결도 체크)"""
+    """
+    Liveness - 프로세스가 응답하는지만 확인 (DB/Redis는 보지 않음)
+    의존성 장애 때 재시작되지 않도록 liveness 프로브에는 이쪽을 사용
+    """
     return {"status": "healthy"}
 
 
+@app.get("/health/ready")
+async def readiness_check():
+    """
+    Readiness - DB 연결, 마이그레이션(alembic head), Redis, 커넥션 풀 사용률
+    - 하나라도 fail이면 503 (로드밸런서에서 제외)
+    - 결과는 HEALTH_CACHE_SECONDS 동안 재사용 (cached: true)
+    """
+    result = await health_checker.readiness()
+    return JSONResponse(result, status_code=200 if result["status"] == "ok" else 503)
+
+
+def _pool_connections():
+    for engine, status in get_pool_status().items():
+        yield (engine, "checked_out"), status["checked_out"]
+        yield (engine, "idle"), status["checked_in"]
+        yield (engine, "overflow"), status["overflow"]
+
+
+def _pool_waits():
+    for engine, status in get_pool_status().items():
+        yield (engine, "exhausted"), status["exhausted"]
+        yield (engine, "timeout"), status["timeouts"]
+
+
+def _cache_events():
+    for cache in (task_cache, note_cache):
+        for kind, values in cache.stats.snapshot().items():
+            for event, value in values.items():
+                if event != "hit_rate":
+                    yield (cache.namespace, kind, event), value
+
+
+register_gauge(
+    "worklog_db_pool_connections", "DB 커넥션 풀 연결 수", ["engine", "state"], _pool_connections
+)
+register_gauge(
+    "worklog_db_pool_waits", "풀 고갈로 대기 / 타임아웃된 누적 횟수", ["engine", "kind"], _pool_waits
+)
+register_gauge(
+    "worklog_cache_events", "응답 캐시 누적 이벤트 (hit / miss / not_modified / invalidate / error)",
+    ["cache", "kind", "event"], _cache_events
+)
+register_gauge(
+    "worklog_sse_connections", "열린 실시간 이벤트(SSE) 연결 수", [],
+    lambda: [((), event_broker.info()["connections"])]
+)
+
+
+@app.get("/metrics", include_in_schema=False)
+def prometheus_metrics():
+    """Prometheus 지표 (요청 수 / 지연 히스토그램 / DB 풀 / 캐시 / SSE)"""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
+@app.get("/metrics/db-pool")
+def db_pool_metrics():
+    """
+    DB 커넥션 풀 지표 (워커 프로세스 단위)
+    - 사용 중/대기 연결 수, overflow
+    - 체크아웃 대기 시간 (평균/최대), 고갈/타임아웃 횟수
+    """
+    return get_pool_status()
+
+
+@app.get("/metrics/cache")
+def cache_metrics():
+    """응답 캐시 지표 (종류별 hit/miss/hit_rate, 무효화 횟수) - 일일 노트 캐시는 notes 아래"""
+    return {**task_cache.info(), "notes": note_cache.info()}
+
+
+@app.get("/metrics/events")
+def events_metrics():
+    """실시간 이벤트 지표 (현재 연결 수, 발행/전달/버퍼 초과로 버린 수)"""
+    return event_broker.info()
+
+
 # API 라우터는 나중에 로드 (schemas/services 등 미구현 시에도 서버는 동작)
 try:
     from app.api import api_router
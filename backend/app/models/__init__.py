@@ -1,8 +1,8 @@
 # backend/app/models/__init__.py
 from app.core.database import Base
 from app.models.users import User
-from app.models.task import Task, TaskStatus, TaskPriority
-from app.models.daily_note import DailyNote
+from app.models.task import Task, TaskArchive, TaskStatus, TaskPriority, TaskTombstone
+from app.models.daily_note import DailyNote, DailyNotePatch
 from app.models.project import Project
 
 # 모두 export
@@ -12,6 +12,9 @@ __all__ = [
     "Task",
     "TaskStatus",
     "TaskPriority",
+    "TaskTombstone",
+    "TaskArchive",
     "DailyNote",
+    "DailyNotePatch",
     "Project",
 ]
\ No newline at end of file
@@ -1,5 +1,5 @@
 # backend/app/models/daily_note.py
-from sqlalchemy import Column, String, Text, Date, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, String, Text, Date, DateTime, ForeignKey, Integer, JSON, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -19,6 +19,12 @@ class DailyNote(Base):
     content = Column(Text, nullable=True)  # 마크다운 내용
     mood = Column(String(20), nullable=True)  # 'great' | 'good' | 'okay' | 'bad'
 
+    # 부분 수정(PATCH) - 본문 변경마다 revision 증가, 변경분은 daily_note_patches 에 쌓임
+    # content 는 content_revision 까지 반영된 본문 (이후 패치는 읽을 때 적용, 주기적으로 합침)
+    revision = Column(Integer, nullable=False, default=0, server_default="0")
+    content_revision = Column(Integer, nullable=False, default=0, server_default="0")
+    content_length = Column(Integer, nullable=False, default=0, server_default="0")  # 최신 본문 글자 수 (패치 범위 검증용)
+
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -32,3 +38,19 @@ class DailyNote(Base):
 
     def __repr__(self):
         return f"<DailyNote {self.date}>"
+
+
+class DailyNotePatch(Base):
+    """
+    일일 노트 본문 변경분 (revision 1개 = 패치 1개)
+    ops: [[위치, 지울 글자 수, 넣을 문자열], ...] - 이전 revision 본문 기준, 순서대로 적용
+    """
+    __tablename__ = "daily_note_patches"
+
+    note_id = Column(UUID(as_uuid=True), ForeignKey("daily_notes.id", ondelete="CASCADE"), primary_key=True)
+    revision = Column(Integer, primary_key=True)
+    ops = Column(JSON, nullable=False)  # 다시 읽을 때 순서대로 적용만 함 → JSONB 변환 비용 없이 그대로 저장
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<DailyNotePatch {self.note_id}@{self.revision}>"
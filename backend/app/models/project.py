@@ -1,8 +1,8 @@
 # backend/app/models/project.py
-from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, Index, Integer
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 import uuid
 
 from app.core.database import Base
@@ -21,11 +21,27 @@ class Project(Base):
 
     archived = Column(Boolean, default=False)
 
+    # 태스크 개수 (비정규화) - 태스크 생성/상태 변경/완료/삭제와 같은 트랜잭션에서 증감
+    # → 사이드바 개수를 tasks GROUP BY 없이 표시, 어긋나면 repair_project_counts.py 로 재계산
+    open_count = Column(Integer, nullable=False, default=0, server_default="0")  # todo + doing
+    done_count = Column(Integer, nullable=False, default=0, server_default="0")
+
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # Relationships
     user = relationship("User", backref="projects")
 
+    __table_args__ = (
+        Index("ix_projects_user_created", "user_id", "created_at"),
+        # 보관 작업이 보관된 프로젝트만 찾을 때 (대부분의 프로젝트는 보관 전이라 작음)
+        Index(
+            "ix_projects_archived",
+            "id",
+            postgresql_where=text("archived IS TRUE"),
+            sqlite_where=text("archived IS 1"),
+        ),
+    )
+
     def __repr__(self):
         return f"<Project {self.name}>"
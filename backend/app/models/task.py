@@ -1,5 +1,5 @@
 # backend/app/models/task.py
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Integer, Enum as SQLEnum
+from sqlalchemy import BigInteger, Column, String, Text, DateTime, ForeignKey, Index, Enum as SQLEnum, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -29,6 +29,8 @@ class Task(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    # 프로젝트가 삭제되면 태스크는 남기고 연결만 해제
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="SET NULL"), nullable=True)
 
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
@@ -39,13 +41,126 @@ class Task(Base):
     due_date = Column(DateTime(timezone=True), nullable=True)
     completed_at = Column(DateTime(timezone=True), nullable=True)
 
-    order = Column(Integer, default=0)  # 정렬 순서
+    # 정렬 순서 (간격을 두고 매김 → 이동 시 이웃 사이 중간값으로 1행만 수정)
+    order = Column(BigInteger, nullable=False, default=0)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # 생성 시에도 채움 → 델타 동기화 워터마크로 사용
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    # 삭제 시각 (Soft Delete) - TASK_PURGE_AFTER_DAYS 동안 복구 가능, 이후 purge_tasks.py 가 완전 삭제
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
 
     # Relationships
     user = relationship("User", backref="tasks")
 
+    # 인덱스 (실제 조회 패턴 기준)
+    # - 조회용 인덱스는 삭제된 태스크(deleted_at)를 담지 않는 부분 인덱스
+    #   → 조회 쿼리는 항상 deleted_at IS NULL 조건 포함
+    # - 목록/커서: user_id + (status, order, created_at, id) 정렬 키
+    # - 오늘 할 일/마감 지난 개수: 미완료 태스크만 담는 부분 인덱스
+    # - 델타 동기화: user_id + (updated_at, id) 범위 스캔
+    # - 프로젝트별 목록: project_id + 목록 정렬 키 (FK 정리 / 개수 재계산도 이 인덱스 사용)
+    # - 보관 대상 찾기: 완료 태스크만 담는 completed_at 부분 인덱스
+    # - 완전 삭제 대상 찾기: 삭제된 태스크만 담는 deleted_at 부분 인덱스
+    # - 검색: search_vector (tsvector GENERATED 컬럼 + GIN) 는 PostgreSQL 전용이라
+    #   모델에 매핑하지 않고 마이그레이션에서만 생성
+    __table_args__ = (
+        Index(
+            "ix_tasks_user_status_order",
+            "user_id", "status", "order", "created_at", "id",
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_tasks_user_due_open",
+            "user_id",
+            "due_date",
+            postgresql_where=text("status != 'DONE' AND deleted_at IS NULL"),
+            sqlite_where=text("status != 'DONE' AND deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_tasks_user_updated",
+            "user_id", "updated_at", "id",
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+        Index("ix_tasks_project_status_order", "project_id", "status", "order", "created_at", "id"),
+        Index(
+            "ix_tasks_done_completed",
+            "completed_at",
+            postgresql_where=text("status = 'DONE' AND deleted_at IS NULL"),
+            sqlite_where=text("status = 'DONE' AND deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_tasks_deleted",
+            "deleted_at",
+            postgresql_where=text("deleted_at IS NOT NULL"),
+            sqlite_where=text("deleted_at IS NOT NULL"),
+        ),
+    )
+
     def __repr__(self):
         return f"<Task {self.title}>"
+
+
+class TaskTombstone(Base):
+    """
+    삭제된 태스크 기록 (델타 동기화용)
+    - 태스크를 지울 때 id만 남김 → 클라이언트가 로컬에서도 지우도록
+    - SYNC_TOMBSTONE_RETENTION_DAYS 지난 기록은 purge_tasks.py 가 정리
+    """
+    __tablename__ = "task_tombstones"
+
+    task_id = Column(UUID(as_uuid=True), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    deleted_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("ix_task_tombstones_user_deleted", "user_id", "deleted_at", "task_id"),
+        # 보관 기간 지난 기록 정리 (purge_tasks.py)
+        Index("ix_task_tombstones_deleted", "deleted_at"),
+    )
+
+    def __repr__(self):
+        return f"<TaskTombstone {self.task_id}>"
+
+
+class TaskArchive(Base):
+    """
+    보관된 태스크 (오래된 완료 태스크 / 보관된 프로젝트의 태스크)
+    - tasks 와 같은 컬럼 + archived_at, archive_tasks.py 가 배치로 옮김
+    - 목록/오늘 할 일/통계 등 일반 조회는 tasks 만 읽음 → 보관 태스크가 늘어도 느려지지 않음
+    - GET /api/tasks?include_archived=true 로만 함께 조회 (읽기 전용)
+    """
+    __tablename__ = "tasks_archive"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="SET NULL"), nullable=True)
+
+    title = Column(String(255), nullable=False)
+    description = Column(Text, nullable=True)
+
+    status = Column(SQLEnum(TaskStatus), nullable=False)
+    priority = Column(SQLEnum(TaskPriority), nullable=False)
+
+    due_date = Column(DateTime(timezone=True), nullable=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    order = Column(BigInteger, nullable=False, default=0)
+
+    created_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True))
+    archived_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    # 응답(TaskResponse.archived) 용
+    archived = True
+
+    __table_args__ = (
+        # include_archived 목록: tasks 와 같은 정렬 키
+        Index("ix_tasks_archive_user_status_order", "user_id", "status", "order", "created_at", "id"),
+        # 프로젝트 보관 해제 시 복원 / 프로젝트 삭제 시 연결 해제
+        Index("ix_tasks_archive_project", "project_id"),
+    )
+
+    def __repr__(self):
+        return f"<TaskArchive {self.title}>"
@@ -0,0 +1,53 @@
+# backend/app/schemas/common.py
+"""
+공통 스키마
+- 페이지네이션
+- 메시지 응답
+"""
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+
+class PaginationParams(BaseModel):
+    """페이지네이션 파라미터"""
+    skip: int = Field(0, ge=0)
+    limit: int = Field(20, ge=1, le=100)
+
+
+class PaginatedResponse(BaseModel, Generic[T]):
+    """페이지네이션 응답"""
+    items: List[T]
+    total: Optional[int]  # 전체 개수 (커서 모드에서는 COUNT 생략 → null)
+    skip: int
+    limit: int
+    has_more: bool
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 null)
+
+    @classmethod
+    def create(
+        cls,
+        items: List[T],
+        total: int,
+        skip: int,
+        limit: int,
+        has_more: Optional[bool] = None,
+        next_cursor: Optional[str] = None,
+    ):
+        if has_more is None:
+            has_more = skip + len(items) < total
+        return cls(
+            items=items,
+            total=total,
+            skip=skip,
+            limit=limit,
+            has_more=has_more,
+            next_cursor=next_cursor,
+        )
+
+
+class MessageResponse(BaseModel):
+    """단순 메시지 응답"""
+    message: str
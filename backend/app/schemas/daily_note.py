@@ -0,0 +1,63 @@
+# backend/app/schemas/daily_note.py
+"""
+일일 노트 관련 스키마
+"""
+from datetime import date, datetime
+from typing import List, Literal, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+Mood = Literal["great", "good", "okay", "bad"]
+
+
+class DailyNoteUpsert(BaseModel):
+    """
+    일일 노트 저장 요청 (날짜별 upsert)
+    - 보내지 않은 필드는 기존 값 유지, null을 보내면 비움
+    """
+    content: Optional[str] = None  # 마크다운
+    mood: Optional[Mood] = None
+
+
+class DailyNoteSummary(BaseModel):
+    """캘린더용 요약 (본문 제외)"""
+    date: date
+    mood: Optional[Mood] = None
+
+
+class DailyNoteResponse(DailyNoteSummary):
+    """일일 노트 응답"""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    user_id: UUID
+    content: Optional[str] = None
+    revision: int = 0  # 본문이 바뀔 때마다 증가 (부분 수정의 base_revision)
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+
+class DailyNotePatchOp(BaseModel):
+    """
+    본문 부분 수정 1건: pos 위치에서 delete 글자를 지우고 insert 를 넣음
+    - 위치/길이는 유니코드 문자(code point) 단위 (JS 문자열 인덱스와 다름 - 이모지 등 주의)
+    - 여러 건이면 앞의 수정이 적용된 본문 기준으로 차례대로 적용
+    """
+    pos: int = Field(..., ge=0)
+    delete: int = Field(0, ge=0)
+    insert: str = ""
+
+
+class DailyNotePatch(BaseModel):
+    """일일 노트 부분 수정 요청"""
+    base_revision: int = Field(..., ge=0)  # 수정을 만든 기준 본문의 revision (새 노트는 0)
+    ops: List[DailyNotePatchOp] = Field(..., min_length=1, max_length=1000)
+
+
+class DailyNotePatchResponse(BaseModel):
+    """부분 수정 결과 (본문은 돌려주지 않음)"""
+    date: date
+    revision: int
+    content_length: int  # 적용 후 본문 길이 (문자 수) - 클라이언트 본문과 비교용
+    updated_at: Optional[datetime] = None
@@ -0,0 +1,54 @@
+# backend/app/schemas/project.py
+"""
+프로젝트 관련 스키마
+"""
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
+
+HEX_COLOR = r"^#[0-9a-fA-F]{6}$"
+
+
+class ProjectBase(BaseModel):
+    name: str = Field(..., min_length=1, max_length=100)
+    description: Optional[str] = None
+    color: str = Field("#6366f1", pattern=HEX_COLOR)
+
+
+class ProjectCreate(ProjectBase):
+    """프로젝트 생성 요청"""
+    pass
+
+
+class ProjectUpdate(BaseModel):
+    """프로젝트 수정 요청 (Partial Update)"""
+    name: Optional[str] = Field(None, min_length=1, max_length=100)
+    description: Optional[str] = None
+    color: Optional[str] = Field(None, pattern=HEX_COLOR)
+    archived: Optional[bool] = None
+
+    @field_validator("name", "color", "archived")
+    @classmethod
+    def check_not_null(cls, v, info: ValidationInfo):
+        # 보내지 않으면 그대로, null 은 거절 (저장되면 응답 검증이 깨져 이후 조회도 500)
+        if v is None:
+            raise ValueError(f"{info.field_name}는 null일 수 없습니다")
+        return v
+
+
+class ProjectResponse(ProjectBase):
+    """
+    프로젝트 응답
+    - open_count: 미완료(todo + doing) 태스크 수, done_count: 완료 태스크 수
+    """
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    user_id: UUID
+    archived: bool = False
+    open_count: int = 0
+    done_count: int = 0
+    created_at: datetime
+    updated_at: Optional[datetime] = None
@@ -0,0 +1,144 @@
+# backend/app/schemas/task.py
+"""
+태스크 관련 스키마
+"""
+from datetime import datetime
+from typing import Dict, List, Literal, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator, model_validator
+
+from app.models.task import TaskStatus, TaskPriority
+
+
+class TaskBase(BaseModel):
+    title: str = Field(..., min_length=1, max_length=255)
+    description: Optional[str] = None
+    status: TaskStatus = TaskStatus.TODO
+    priority: TaskPriority = TaskPriority.MEDIUM
+    due_date: Optional[datetime] = None
+    project_id: Optional[UUID] = None
+
+
+class TaskCreate(TaskBase):
+    """태스크 생성 요청"""
+    pass
+
+
+class TaskUpdate(BaseModel):
+    """태스크 수정 요청 (Partial Update)"""
+    title: Optional[str] = Field(None, min_length=1, max_length=255)
+    description: Optional[str] = None
+    status: Optional[TaskStatus] = None
+    priority: Optional[TaskPriority] = None
+    due_date: Optional[datetime] = None
+    project_id: Optional[UUID] = None  # null을 보내면 프로젝트에서 빼기
+    order: Optional[int] = None
+
+    @field_validator("title", "status", "priority", "order")
+    @classmethod
+    def check_not_null(cls, v, info: ValidationInfo):
+        # 보내지 않으면 그대로, null 은 거절 (NOT NULL 컬럼 - order 는 커서 정렬 키)
+        if v is None:
+            raise ValueError(f"{info.field_name}는 null일 수 없습니다")
+        return v
+
+
+class TaskResponse(TaskBase):
+    """태스크 응답"""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    user_id: UUID
+    completed_at: Optional[datetime] = None
+    order: int = 0
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    archived: bool = False  # 보관된 태스크 (include_archived 로 조회했을 때만 True, 읽기 전용)
+
+
+class TaskMove(BaseModel):
+    """
+    태스크 이동 (드래그 앤 드롭)
+    - prev_id: 이동 후 바로 위에 올 태스크
+    - next_id: 이동 후 바로 아래에 올 태스크
+    - 둘 중 하나만 보내도 됨, 둘 다 없으면 맨 아래로
+    - status: 다른 상태 컬럼으로 옮길 때
+    """
+    prev_id: Optional[UUID] = None
+    next_id: Optional[UUID] = None
+    status: Optional[TaskStatus] = None
+
+
+class TaskChangesResponse(BaseModel):
+    """
+    델타 동기화 응답
+    - changed: 생성/수정된 태스크 (전체 필드)
+    - deleted: 삭제된 태스크 id
+    - watermark: 다음 요청의 since 로 그대로 전달
+    - has_more: True면 바로 다음 watermark로 이어서 요청
+    """
+    changed: List[TaskResponse]
+    deleted: List[UUID]
+    watermark: str
+    has_more: bool
+
+
+class TaskStatsResponse(BaseModel):
+    """태스크 통계 응답"""
+    total: int
+    by_status: Dict[str, int]
+    by_priority: Dict[str, int]
+    today_count: int
+    overdue_count: int
+    completion_rate: float
+
+
+class TaskBulkOperation(BaseModel):
+    """
+    일괄 처리 작업 1건
+    - create: task 필수
+    - update: id, changes 필수
+    - status: id, status 필수
+    - complete / delete: id 필수
+    """
+    op: Literal["create", "update", "status", "complete", "delete"]
+    id: Optional[UUID] = None
+    task: Optional[TaskCreate] = None
+    changes: Optional[TaskUpdate] = None
+    status: Optional[TaskStatus] = None
+
+    @model_validator(mode="after")
+    def check_fields(self):
+        if self.op == "create":
+            if self.task is None:
+                raise ValueError("create 작업에는 task가 필요합니다")
+            return self
+        if self.id is None:
+            raise ValueError(f"{self.op} 작업에는 id가 필요합니다")
+        if self.op == "update" and self.changes is None:
+            raise ValueError("update 작업에는 changes가 필요합니다")
+        if self.op == "status" and self.status is None:
+            raise ValueError("status 작업에는 status가 필요합니다")
+        return self
+
+
+class TaskBulkRequest(BaseModel):
+    """일괄 처리 요청"""
+    operations: List[TaskBulkOperation] = Field(..., min_length=1, max_length=500)
+
+
+class TaskBulkResult(BaseModel):
+    """작업별 결과"""
+    index: int
+    op: str
+    id: Optional[UUID] = None
+    ok: bool
+    error: Optional[str] = None
+
+
+class TaskBulkResponse(BaseModel):
+    """일괄 처리 응답"""
+    results: List[TaskBulkResult]
+    succeeded: int
+    failed: int
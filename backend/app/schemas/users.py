@@ -0,0 +1,48 @@
+# backend/app/schemas/users.py
+"""
+유저 관련 스키마
+"""
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
+
+from app.core.security import PASSWORD_MAX_BYTES
+
+
+class UserBase(BaseModel):
+    email: EmailStr
+    username: str = Field(..., min_length=2, max_length=50)
+    full_name: Optional[str] = None
+
+
+class UserCreate(UserBase):
+    """회원가입 요청"""
+    password: str = Field(..., min_length=8)
+
+    @field_validator("password")
+    @classmethod
+    def check_password_bytes(cls, v: str) -> str:
+        # 한글 등은 글자당 여러 바이트 → 글자 수가 아니라 UTF-8 바이트 수로 검사
+        if len(v.encode("utf-8")) > PASSWORD_MAX_BYTES:
+            raise ValueError(f"비밀번호는 최대 {PASSWORD_MAX_BYTES}바이트까지 가능합니다")
+        return v
+
+
+class UserResponse(UserBase):
+    """유저 응답 (비밀번호 제외)"""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    avatar_url: Optional[str] = None
+    is_active: bool
+    is_superuser: bool
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+
+class Token(BaseModel):
+    """로그인 응답"""
+    access_token: str
+    token_type: str = "bearer"
@@ -0,0 +1,168 @@
+# backend/app/services/archive_service.py
+"""
+태스크 보관 (tasks → tasks_archive)
+
+- 대상: 완료 후 TASK_ARCHIVE_AFTER_DAYS 가 지난 태스크 + 보관된(archived) 프로젝트의 태스크
+- archive_batch 1번 = 트랜잭션 1번: 대상 limit개 잠금 → INSERT ... SELECT → DELETE
+  (PostgreSQL은 SKIP LOCKED: 사용자가 수정 중인 행은 건너뛰고 다음 배치에서)
+- 삭제된(deleted_at) 태스크는 옮기지 않음 → purge_tasks.py 가 완전 삭제
+- 보관된 태스크는 작업 중 목록에서 빠진 것으로 취급
+  - 프로젝트 개수(open_count / done_count)에서 빠짐
+  - 삭제 기록(tombstone)을 남김 → 델타 동기화 클라이언트도 로컬 목록에서 제거
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import delete, func, insert, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.project import Project
+from app.models.task import Task, TaskArchive, TaskStatus, TaskTombstone
+from app.services.project_service import CountDeltas, add_count, apply_count_deltas
+from app.services.task_service import NOT_DELETED, skip_locked
+
+# tasks / tasks_archive 공통 컬럼
+ARCHIVE_COLUMNS = (
+    "id", "user_id", "project_id", "title", "description", "status", "priority",
+    "due_date", "completed_at", "order", "created_at", "updated_at",
+)
+
+
+def _cutoff(older_than_days: Optional[int]) -> datetime:
+    days = settings.TASK_ARCHIVE_AFTER_DAYS if older_than_days is None else older_than_days
+    return datetime.now(timezone.utc) - timedelta(days=days)
+
+
+def _candidates(db: Session, cutoff: datetime, limit: int) -> List[tuple]:
+    """보관할 태스크 (id, user_id, project_id, status, 이유) 최대 limit개"""
+    columns = (Task.id, Task.user_id, Task.project_id, Task.status)
+    # 오래된 완료 태스크 - ix_tasks_done_completed 부분 인덱스
+    rows = [
+        (*row, "done")
+        for row in db.execute(skip_locked(db, (
+            select(*columns)
+            .where(Task.status == TaskStatus.DONE, NOT_DELETED, Task.completed_at < cutoff)
+            .order_by(Task.completed_at)
+            .limit(limit)
+        )))
+    ]
+    if len(rows) < limit:
+        # 보관된 프로젝트의 태스크 - ix_tasks_project_status_order
+        query = (
+            select(*columns)
+            .where(
+                Task.project_id.in_(select(Project.id).where(Project.archived.is_(True))),
+                NOT_DELETED,
+            )
+            .limit(limit - len(rows))
+        )
+        if rows:
+            query = query.where(Task.id.not_in([row[0] for row in rows]))
+        rows += [(*row, "project") for row in db.execute(skip_locked(db, query))]
+    return rows
+
+
+class TaskArchiveService:
+    """태스크 보관 / 복원 / 보관 태스크 조회"""
+
+    @staticmethod
+    def archive_batch(
+        db: Session,
+        older_than_days: Optional[int] = None,
+        limit: Optional[int] = None,
+        dry_run: bool = False,
+    ) -> Dict[str, int]:
+        """
+        보관 대상 태스크를 최대 limit개 옮김 (트랜잭션 1번)
+
+        Returns: {"moved": 옮긴 수, "done": 오래된 완료 태스크 수, "project": 보관 프로젝트 태스크 수,
+                  "user_ids": 태스크가 옮겨진 유저 (캐시 무효화 / 이벤트 발행용)}
+        → moved 가 limit 보다 작으면 더 옮길 태스크 없음
+        """
+        limit = limit or settings.TASK_ARCHIVE_BATCH_SIZE
+        rows = _candidates(db, _cutoff(older_than_days), limit)
+        result = {
+            "moved": len(rows),
+            "done": sum(1 for row in rows if row[4] == "done"),
+            "project": sum(1 for row in rows if row[4] == "project"),
+            "user_ids": list(dict.fromkeys(row[1] for row in rows)),
+        }
+        if not rows or dry_run:
+            db.rollback()
+            return result
+
+        ids = [row[0] for row in rows]
+        db.execute(
+            insert(TaskArchive).from_select(
+                ARCHIVE_COLUMNS,
+                select(*(getattr(Task, name) for name in ARCHIVE_COLUMNS)).where(Task.id.in_(ids)),
+            )
+        )
+        # 보관 → 복원 → 다시 보관된 태스크는 이전 기록이 남아 있을 수 있음
+        db.execute(delete(TaskTombstone).where(TaskTombstone.task_id.in_(ids)))
+        db.execute(insert(TaskTombstone), [{"task_id": row[0], "user_id": row[1]} for row in rows])
+        db.execute(delete(Task).where(Task.id.in_(ids)).execution_options(synchronize_session=False))
+
+        deltas_by_user: Dict[UUID, CountDeltas] = {}
+        for task_id, user_id, project_id, status, _ in rows:
+            add_count(deltas_by_user.setdefault(user_id, {}), project_id, status, -1)
+        for user_id, deltas in deltas_by_user.items():
+            apply_count_deltas(db, user_id, deltas)
+        db.commit()
+        return result
+
+    @staticmethod
+    def restore_project(
+        db: Session,
+        user_id: UUID,
+        project_id: UUID,
+        older_than_days: Optional[int] = None,
+    ) -> int:
+        """
+        프로젝트 보관 해제 시 그 프로젝트의 보관 태스크를 tasks 로 되돌림 → 되돌린 수
+        (완료 후 보관 기간이 지난 태스크는 그대로 보관)
+        """
+        cutoff = _cutoff(older_than_days)
+        rows = db.execute(
+            select(TaskArchive.id, TaskArchive.status).where(
+                TaskArchive.user_id == user_id,
+                TaskArchive.project_id == project_id,
+                or_(
+                    TaskArchive.status != TaskStatus.DONE,
+                    TaskArchive.completed_at.is_(None),
+                    TaskArchive.completed_at >= cutoff,
+                ),
+            )
+        ).all()
+        if not rows:
+            db.rollback()
+            return 0
+
+        ids = [row.id for row in rows]
+        # updated_at 을 지금으로 → 델타 동기화에서 다시 생성된 것으로 전달
+        db.execute(
+            insert(Task).from_select(
+                ARCHIVE_COLUMNS,
+                select(
+                    *(getattr(TaskArchive, name) for name in ARCHIVE_COLUMNS if name != "updated_at"),
+                    func.now(),
+                ).where(TaskArchive.id.in_(ids)),
+            )
+        )
+        db.execute(delete(TaskArchive).where(TaskArchive.id.in_(ids)))
+        db.execute(delete(TaskTombstone).where(TaskTombstone.task_id.in_(ids)))
+        deltas: CountDeltas = {}
+        for row in rows:
+            add_count(deltas, project_id, row.status, 1)
+        apply_count_deltas(db, user_id, deltas)
+        db.commit()
+        return len(rows)
+
+    @staticmethod
+    def get_by_id(db: Session, task_id: UUID, user_id: UUID) -> Optional[TaskArchive]:
+        """본인의 보관 태스크 조회"""
+        return db.scalar(
+            select(TaskArchive).where(TaskArchive.id == task_id, TaskArchive.user_id == user_id)
+        )
@@ -0,0 +1,319 @@
+# backend/app/services/daily_note_service.py
+"""
+일일 노트 비즈니스 로직
+
+본문 부분 수정 (PATCH)
+- 저장마다 변경분(ops)만 daily_note_patches 에 1행 추가 + 노트의 revision 증가
+  → 큰 본문(content)을 다시 쓰지 않음 (PostgreSQL은 바뀌지 않은 TOAST 값을 그대로 재사용)
+- 읽을 때 content(content_revision 까지 반영) 에 revision 까지의 패치를 순서대로 적용
+  (노트와 패치는 따로 읽으므로, 그 사이 compact 가 커밋돼 패치가 모자라면 노트를 다시 읽음)
+- 쌓인 패치가 DAILY_NOTE_COMPACT_PATCHES 개 이상이면 compact 로 본문에 합치고 패치 삭제
+"""
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID, uuid4
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.core.exceptions import (
+    DailyNoteNotFoundException,
+    InvalidPatchException,
+    StaleRevisionException,
+)
+from app.core.serializers import rows_to_dicts
+from app.models.daily_note import DailyNote, DailyNotePatch
+from app.schemas.daily_note import DailyNotePatchOp, DailyNoteUpsert
+
+# DailyNoteResponse 필드에 해당하는 컬럼 - 범위 조회 시 컬럼 튜플로 가져옴
+NOTE_RESPONSE_COLUMNS = (
+    DailyNote.id,
+    DailyNote.user_id,
+    DailyNote.date,
+    DailyNote.content,
+    DailyNote.mood,
+    DailyNote.revision,
+    DailyNote.created_at,
+    DailyNote.updated_at,
+)
+# 캘린더 요약 - 본문(content)은 읽지 않음
+NOTE_SUMMARY_COLUMNS = (DailyNote.date, DailyNote.mood)
+
+
+def _insert(db: Session):
+    """ON CONFLICT 를 지원하는 방언별 INSERT"""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(DailyNote)
+    return sqlite.insert(DailyNote)
+
+
+def _on_conflict(db: Session) -> dict:
+    if db.get_bind().dialect.name == "postgresql":
+        return {"constraint": "unique_user_date"}
+    return {"index_elements": [DailyNote.user_id, DailyNote.date]}
+
+
+def apply_ops(text: str, ops: Sequence[Sequence[Any]]) -> str:
+    """[[위치, 지울 글자 수, 넣을 문자열], ...] 를 순서대로 적용"""
+    for pos, delete_count, inserted in ops:
+        text = text[:pos] + inserted + text[pos + delete_count:]
+    return text
+
+
+def _validate_ops(ops: List[DailyNotePatchOp], length: int) -> int:
+    """ops 가 본문 범위 안인지 확인 (본문을 읽지 않고 길이만으로) → 적용 후 길이"""
+    for index, op in enumerate(ops):
+        if op.pos > length or op.pos + op.delete > length:
+            raise InvalidPatchException(
+                f"ops[{index}] 범위가 본문 길이({length})를 벗어납니다 (pos={op.pos}, delete={op.delete})"
+            )
+        length += len(op.insert) - op.delete
+    return length
+
+
+def _pending_patches(db: Session, notes: Dict[UUID, tuple]) -> Dict[UUID, List[list]]:
+    """
+    {note_id: (content_revision, revision)} → 그 사이(content_revision < r <= revision) 패치 ops 목록
+    (revision 순, 쿼리 1번 - 노트를 읽은 뒤 추가된 패치는 제외)
+    """
+    rows = db.execute(
+        select(DailyNotePatch.note_id, DailyNotePatch.revision, DailyNotePatch.ops)
+        .where(DailyNotePatch.note_id.in_(notes))
+        .order_by(DailyNotePatch.note_id, DailyNotePatch.revision)
+    )
+    pending: Dict[UUID, List[list]] = {}
+    for note_id, revision, ops in rows:
+        content_revision, note_revision = notes[note_id]
+        if content_revision < revision <= note_revision:
+            pending.setdefault(note_id, []).append(ops)
+    return pending
+
+
+# 패치가 모자랄 때(읽는 도중 compact) 노트를 다시 읽는 최대 횟수
+_MATERIALIZE_ATTEMPTS = 3
+
+
+def _materialize(db: Session, notes: List[dict]) -> None:
+    """
+    content 에 아직 합치지 않은 패치 적용 (dict 목록, content_revision 키는 제거)
+
+    노트를 읽은 뒤 compact 가 커밋되면 패치가 이미 지워져 있음
+    → 패치 수가 revision - content_revision 과 다르면 그 노트만 다시 읽어서 재시도
+      (PostgreSQL은 FOR SHARE 로 다시 읽음 → 이 트랜잭션 동안 compact / PATCH 대기)
+    """
+    stale = [note for note in notes if note["revision"] > note["content_revision"]]
+    for _ in range(_MATERIALIZE_ATTEMPTS):
+        if not stale:
+            break
+        pending = _pending_patches(db, {note["id"]: (note["content_revision"], note["revision"]) for note in stale})
+        retry = []
+        for note in stale:
+            patches = pending.get(note["id"], [])
+            if len(patches) != note["revision"] - note["content_revision"]:
+                retry.append(note)
+                continue
+            for ops in patches:
+                note["content"] = apply_ops(note["content"] or "", ops)
+        if retry:
+            keys = list(retry[0])
+            rows = db.execute(
+                select(*(getattr(DailyNote, key) for key in keys))
+                .where(DailyNote.id.in_([note["id"] for note in retry]))
+                .with_for_update(read=True)
+            ).all()
+            fresh = {row.id: row for row in rows}
+            # 다시 읽는 사이 삭제된 노트는 읽은 내용 그대로 (패치 없이)
+            retry = [note for note in retry if note["id"] in fresh]
+            for note in retry:
+                note.update(zip(keys, fresh[note["id"]]))
+            retry = [note for note in retry if note["revision"] > note["content_revision"]]
+        stale = retry
+    else:
+        if stale:
+            raise RuntimeError("일일 노트를 읽는 동안 패치가 계속 합쳐져 일관된 본문을 만들지 못했습니다")
+    for note in notes:
+        note.pop("content_revision")
+
+
+class DailyNoteService:
+    """일일 노트 조회 + 날짜별 upsert + 부분 수정"""
+
+    @staticmethod
+    def get_by_date(db: Session, user_id: UUID, note_date: date) -> Optional[dict]:
+        notes = DailyNoteService.get_range(db, user_id, note_date, note_date)
+        return notes[0] if notes else None
+
+    @staticmethod
+    def get_range(
+        db: Session,
+        user_id: UUID,
+        start: date,
+        end: date,
+        columns: Sequence = NOTE_RESPONSE_COLUMNS,
+    ) -> List[dict]:
+        """
+        start ~ end (포함) 노트를 날짜순으로 - unique_user_date (user_id, date) 인덱스 범위 스캔 1번
+        (합치지 않은 패치가 있는 노트가 있으면 패치 조회 1번 추가)
+        NOTE_SUMMARY_COLUMNS 를 주면 본문 없이
+        """
+        with_content = DailyNote.content in columns
+        if with_content:
+            columns = (*columns, DailyNote.content_revision)
+        rows = db.execute(
+            select(*columns)
+            .where(DailyNote.user_id == user_id, DailyNote.date >= start, DailyNote.date <= end)
+            .order_by(DailyNote.date)
+        ).all()
+        notes = rows_to_dicts(rows)
+        if with_content:
+            _materialize(db, notes)
+        return notes
+
+    @staticmethod
+    def upsert(db: Session, user_id: UUID, note_date: date, note_in: DailyNoteUpsert) -> DailyNote:
+        """
+        날짜별 노트 저장 - INSERT ... ON CONFLICT (unique_user_date) DO UPDATE 1번
+        - 같은 요청을 여러 번 보내도 결과가 같음 (동시 요청도 중복 행/500 없음)
+        - 보내지 않은 필드는 기존 값 유지
+        - content 를 보내면 전체 교체: revision 증가, 쌓인 패치는 버림
+        """
+        values = note_in.model_dump(exclude_unset=True)
+        stmt = _insert(db)
+        update_values = {key: stmt.excluded[key] for key in values}
+        if "content" in values:
+            values["content_length"] = len(values["content"] or "")
+            table = DailyNote.__table__
+            update_values.update(
+                content_length=stmt.excluded.content_length,
+                revision=table.c.revision + 1,
+                content_revision=table.c.revision + 1,
+            )
+        stmt = stmt.values(id=uuid4(), user_id=user_id, date=note_date, **values).on_conflict_do_update(
+            **_on_conflict(db),
+            # onupdate는 ON CONFLICT 경로에서 동작하지 않음 → updated_at 직접 설정
+            set_={**update_values, "updated_at": func.now()},
+        ).returning(DailyNote)
+        note = db.scalars(stmt, execution_options={"populate_existing": True}).one()
+        # RETURNING 으로 받은 값 그대로 응답 (커밋 후 만료 → 다시 SELECT 방지)
+        db.expunge(note)
+        if "content" in values:
+            db.execute(delete(DailyNotePatch).where(DailyNotePatch.note_id == note.id))
+        elif note.revision > note.content_revision:
+            # 기분만 바꾼 경우 - 응답 본문에 합치지 않은 패치 반영
+            # ON CONFLICT UPDATE 가 노트 행을 잠근 상태 → 그동안 compact / PATCH 없음
+            pending = _pending_patches(db, {note.id: (note.content_revision, note.revision)})
+            for ops in pending.get(note.id, ()):
+                note.content = apply_ops(note.content or "", ops)
+        db.commit()
+        return note
+
+    @staticmethod
+    def patch(
+        db: Session,
+        user_id: UUID,
+        note_date: date,
+        base_revision: int,
+        ops: List[DailyNotePatchOp],
+    ) -> dict:
+        """
+        본문 부분 수정 - base_revision 이 현재 revision 과 다르면 409
+        - 본문을 읽거나 다시 쓰지 않음: 노트 행의 작은 컬럼만 수정 + 패치 1행 추가
+        - 노트가 없고 base_revision 이 0이면 빈 노트로 시작
+        반환: {date, revision, content_length, updated_at, pending_patches}
+        """
+        note = db.execute(
+            select(DailyNote.id, DailyNote.revision, DailyNote.content_length)
+            .where(DailyNote.user_id == user_id, DailyNote.date == note_date)
+        ).one_or_none()
+        if note is None:
+            if base_revision != 0:
+                raise DailyNoteNotFoundException()
+            db.execute(
+                _insert(db)
+                .values(id=uuid4(), user_id=user_id, date=note_date)
+                .on_conflict_do_nothing(**_on_conflict(db))
+            )
+            note = db.execute(
+                select(DailyNote.id, DailyNote.revision, DailyNote.content_length)
+                .where(DailyNote.user_id == user_id, DailyNote.date == note_date)
+            ).one()
+        if note.revision != base_revision:
+            raise StaleRevisionException(note.revision)
+
+        content_length = _validate_ops(ops, note.content_length)
+        # WHERE revision = base → 같은 base 로 동시에 저장하면 하나만 성공
+        updated = db.execute(
+            update(DailyNote)
+            .where(DailyNote.id == note.id, DailyNote.revision == base_revision)
+            .values(revision=base_revision + 1, content_length=content_length, updated_at=func.now())
+            .returning(DailyNote.revision, DailyNote.content_revision, DailyNote.updated_at)
+            .execution_options(synchronize_session=False)
+        ).one_or_none()
+        if updated is None:
+            db.rollback()
+            raise StaleRevisionException()
+        db.execute(
+            insert(DailyNotePatch).values(
+                note_id=note.id,
+                revision=updated.revision,
+                ops=[[op.pos, op.delete, op.insert] for op in ops],
+            )
+        )
+        db.commit()
+        return {
+            "id": note.id,
+            "date": note_date,
+            "revision": updated.revision,
+            "content_length": content_length,
+            "updated_at": updated.updated_at,
+            "pending_patches": updated.revision - updated.content_revision,
+        }
+
+    @staticmethod
+    def compact(db: Session, note_id: UUID) -> int:
+        """
+        쌓인 패치를 본문에 합치고 삭제 (본문 전체 쓰기 1번) → 합친 패치 수
+        노트 행을 잠그고 진행 (그동안 들어온 PATCH 는 잠깐 대기)
+        """
+        note = db.execute(
+            select(DailyNote.content, DailyNote.content_revision, DailyNote.revision)
+            .where(DailyNote.id == note_id)
+            .with_for_update()
+        ).one_or_none()
+        if note is None or note.revision == note.content_revision:
+            db.rollback()
+            return 0
+        pending = _pending_patches(db, {note_id: (note.content_revision, note.revision)}).get(note_id, [])
+        content = note.content or ""
+        for ops in pending:
+            content = apply_ops(content, ops)
+        db.execute(
+            update(DailyNote)
+            .where(DailyNote.id == note_id)
+            .values(content=content, content_revision=note.revision)
+            .execution_options(synchronize_session=False)
+        )
+        db.execute(
+            delete(DailyNotePatch)
+            .where(DailyNotePatch.note_id == note_id, DailyNotePatch.revision <= note.revision)
+        )
+        db.commit()
+        return len(pending)
+
+    @staticmethod
+    def delete(db: Session, user_id: UUID, note_date: date) -> bool:
+        """삭제 (없으면 False)"""
+        # 패치도 함께 (PostgreSQL은 FK CASCADE, SQLite는 FK를 강제하지 않으므로 직접)
+        db.execute(
+            delete(DailyNotePatch).where(
+                DailyNotePatch.note_id.in_(
+                    select(DailyNote.id).where(DailyNote.user_id == user_id, DailyNote.date == note_date)
+                )
+            )
+        )
+        result = db.execute(
+            delete(DailyNote).where(DailyNote.user_id == user_id, DailyNote.date == note_date)
+        )
+        db.commit()
+        return result.rowcount > 0
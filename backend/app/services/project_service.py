@@ -0,0 +1,224 @@
+# backend/app/services/project_service.py
+"""
+프로젝트 비즈니스 로직
+
+태스크 개수 (open_count / done_count)
+- 태스크 쓰기(TaskService)가 바뀐 만큼의 증감을 모아 apply_count_deltas 로 같은 트랜잭션에서 반영
+  → UPDATE projects SET open_count = open_count + :n ... (현재 값을 읽지 않으므로 동시 쓰기도 안전)
+- 증감은 잠근 태스크 행의 상태 기준 (get_by_id(for_update=True), bulk / 보관은 FOR UPDATE,
+  삭제 / 복구는 조건부 UPDATE ... RETURNING) → 같은 태스크를 동시에 바꿔도 한 번만 반영
+- repair_counts 는 직접 SQL 수정 등 예외 상황을 위한 재계산
+"""
+from typing import Dict, Iterable, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.core.exceptions import ProjectNotFoundException
+from app.models.project import Project
+from app.models.task import Task, TaskArchive, TaskStatus
+from app.schemas.project import ProjectCreate, ProjectUpdate
+
+# {project_id: [open 증감, done 증감]}
+CountDeltas = Dict[UUID, List[int]]
+
+
+def add_count(deltas: CountDeltas, project_id: Optional[UUID], status: TaskStatus, sign: int) -> None:
+    """태스크 1개가 프로젝트에 들어오면(sign=1) / 빠지면(sign=-1) 해당 개수 증감"""
+    if project_id is None:
+        return
+    counts = deltas.setdefault(project_id, [0, 0])
+    counts[1 if status == TaskStatus.DONE else 0] += sign
+
+
+def task_count_deltas(before: Optional[tuple], after: Optional[tuple]) -> CountDeltas:
+    """태스크 (project_id, status) 변경 전/후 → 개수 증감 (생성이면 before, 삭제면 after가 None)"""
+    deltas: CountDeltas = {}
+    if before is not None:
+        add_count(deltas, *before, -1)
+    if after is not None:
+        add_count(deltas, *after, 1)
+    return deltas
+
+
+def apply_count_deltas(
+    db: Session,
+    user_id: UUID,
+    deltas: CountDeltas,
+    required: Iterable[UUID] = (),
+) -> None:
+    """
+    개수 증감 반영 (바뀐 프로젝트마다 UPDATE 1번, 커밋은 호출한 쪽에서)
+    - 본인 프로젝트만 수정: required 에 있는 프로젝트가 없으면 롤백 후 404
+      (태스크를 새로 넣는 프로젝트의 소유권 확인을 겸함)
+    - 프로젝트 id 순서로 잠금 → 여러 프로젝트를 바꾸는 트랜잭션끼리 교착 방지
+    """
+    required = set(required)
+    for project_id in sorted(deltas, key=str):
+        open_delta, done_delta = deltas[project_id]
+        if not open_delta and not done_delta:
+            continue
+        result = db.execute(
+            update(Project)
+            .where(Project.id == project_id, Project.user_id == user_id)
+            # 개수는 파생 값 → updated_at(onupdate)은 그대로
+            .values(
+                open_count=Project.open_count + open_delta,
+                done_count=Project.done_count + done_delta,
+                updated_at=Project.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0 and project_id in required:
+            db.rollback()
+            raise ProjectNotFoundException()
+
+
+def owned_project_ids(db: Session, user_id: UUID, project_ids: Sequence[UUID]) -> set:
+    """project_ids 중 본인 프로젝트 (쿼리 1번, 비어 있으면 쿼리 없음)"""
+    if not project_ids:
+        return set()
+    return set(db.scalars(
+        select(Project.id).where(Project.user_id == user_id, Project.id.in_(project_ids))
+    ))
+
+
+class ProjectService:
+    """프로젝트 CRUD + 태스크 개수 재계산"""
+
+    @staticmethod
+    def create(db: Session, project_in: ProjectCreate, user_id: UUID) -> Project:
+        project = Project(**project_in.model_dump(), user_id=user_id, open_count=0, done_count=0)
+        db.add(project)
+        db.commit()
+        db.refresh(project)
+        return project
+
+    @staticmethod
+    def get_by_id(db: Session, project_id: UUID, user_id: UUID) -> Optional[Project]:
+        """본인 프로젝트만 조회"""
+        return db.scalar(select(Project).where(Project.id == project_id, Project.user_id == user_id))
+
+    @staticmethod
+    def get_multi(db: Session, user_id: UUID, include_archived: bool = False) -> List[Project]:
+        """프로젝트 목록 (만든 순서, 개수 포함 - tasks 테이블은 읽지 않음)"""
+        query = select(Project).where(Project.user_id == user_id)
+        if not include_archived:
+            query = query.where(Project.archived.is_not(True))
+        return list(db.scalars(query.order_by(Project.created_at, Project.id)))
+
+    @staticmethod
+    def update(db: Session, project: Project, project_update: ProjectUpdate) -> Project:
+        """Partial Update (보낸 필드만 반영)"""
+        for field, value in project_update.model_dump(exclude_unset=True).items():
+            setattr(project, field, value)
+        db.commit()
+        db.refresh(project)
+        return project
+
+    @staticmethod
+    def delete(db: Session, project: Project) -> None:
+        """
+        삭제 - 태스크는 남기고 프로젝트 연결만 해제
+        (FK ON DELETE SET NULL 과 같은 동작을 직접 실행 → SQLite 에서도 같고,
+        태스크 updated_at 이 갱신되어 델타 동기화에도 반영됨)
+        """
+        db.execute(
+            update(Task)
+            .where(Task.project_id == project.id)
+            .values(project_id=None)
+            .execution_options(synchronize_session=False)
+        )
+        db.execute(
+            update(TaskArchive)
+            .where(TaskArchive.project_id == project.id)
+            .values(project_id=None)
+            .execution_options(synchronize_session=False)
+        )
+        db.delete(project)
+        db.commit()
+
+    @staticmethod
+    def repair_counts(
+        db: Session,
+        after_id: Optional[UUID] = None,
+        limit: int = 500,
+        user_id: Optional[UUID] = None,
+        dry_run: bool = False,
+    ) -> dict:
+        """
+        프로젝트 limit개(id 순, after_id 다음부터)의 태스크 개수를 다시 세서 어긋난 것만 수정
+
+        - 대상 프로젝트 행을 잠그고(FOR UPDATE) 센 뒤 커밋 → 그동안의 태스크 쓰기는
+          개수 증감에서 잠깐 대기하므로, 세는 도중의 변경도 빠지거나 두 번 반영되지 않음
+        - 개수는 ix_tasks_project_status_order 인덱스로 대상 프로젝트 태스크만 집계 (삭제된 태스크 제외)
+
+        Returns: {"checked": 확인한 프로젝트 수,
+                  "drifted": [{id, user_id, open_count, done_count, expected_open, expected_done}],
+                  "next_after": 다음 배치의 after_id (끝이면 None)}
+        """
+        query = (
+            select(Project.id, Project.user_id, Project.open_count, Project.done_count)
+            .order_by(Project.id)
+            .limit(limit)
+        )
+        if after_id is not None:
+            query = query.where(Project.id > after_id)
+        if user_id is not None:
+            query = query.where(Project.user_id == user_id)
+        projects = db.execute(query.with_for_update()).all()
+        if not projects:
+            db.rollback()
+            return {"checked": 0, "drifted": [], "next_after": None}
+
+        done = Task.status == TaskStatus.DONE
+        actual = {
+            row.project_id: row
+            for row in db.execute(
+                select(
+                    Task.project_id,
+                    func.count(Task.id).filter(~done).label("open"),
+                    func.count(Task.id).filter(done).label("done"),
+                )
+                .where(Task.project_id.in_([project.id for project in projects]), Task.deleted_at.is_(None))
+                .group_by(Task.project_id)
+            )
+        }
+
+        drifted: List[dict] = []
+        for project in projects:
+            counts = actual.get(project.id)
+            expected_open, expected_done = (counts.open, counts.done) if counts else (0, 0)
+            if (project.open_count, project.done_count) != (expected_open, expected_done):
+                drifted.append({
+                    "id": project.id,
+                    "user_id": project.user_id,
+                    "open_count": project.open_count,
+                    "done_count": project.done_count,
+                    "expected_open": expected_open,
+                    "expected_done": expected_done,
+                })
+
+        if drifted and not dry_run:
+            for row in drifted:
+                db.execute(
+                    update(Project)
+                    .where(Project.id == row["id"])
+                    .values(
+                        open_count=row["expected_open"],
+                        done_count=row["expected_done"],
+                        updated_at=Project.updated_at,
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+            db.commit()
+        else:
+            db.rollback()
+
+        return {
+            "checked": len(projects),
+            "drifted": drifted,
+            "next_after": projects[-1].id if len(projects) == limit else None,
+        }
+
@@ -0,0 +1,897 @@
+# backend/app/services/task_service.py
+"""
+태스크 비즈니스 로직
+
+삭제 (Soft Delete)
+- 삭제 = deleted_at 만 채우는 UPDATE 1번 (+ 삭제 기록, 프로젝트 개수)
+- 조회 쿼리는 모두 NOT_DELETED 조건 포함 → 삭제된 행을 담지 않는 부분 인덱스 사용
+- TASK_PURGE_AFTER_DAYS 동안 restore 로 복구 가능, 이후 purge_deleted 가 배치로 완전 삭제
+"""
+import re
+from collections import defaultdict
+from datetime import datetime, time, timedelta, timezone
+from typing import Dict, List, Optional, Sequence
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    delete, false, func, insert, literal_column, or_, select, true, tuple_, union_all, update,
+)
+from sqlalchemy.orm import Query, Session
+
+from app.core.config import settings
+from app.core.exceptions import (
+    InvalidCursorException,
+    InvalidFieldsException,
+    InvalidTaskMoveException,
+    SyncTokenExpiredException,
+    TaskNotFoundException,
+)
+from app.core.pagination import encode_cursor, decode_cursor
+from app.models.task import Task, TaskArchive, TaskStatus, TaskPriority, TaskTombstone
+from app.schemas.task import TaskBulkOperation, TaskCreate, TaskUpdate
+from app.services.project_service import (
+    CountDeltas,
+    add_count,
+    apply_count_deltas,
+    owned_project_ids,
+    task_count_deltas,
+)
+
+
+# 삭제되지 않은 태스크 (조회용 부분 인덱스 조건과 같은 식)
+NOT_DELETED = Task.deleted_at.is_(None)
+
+
+def skip_locked(db: Session, query):
+    """PostgreSQL: 대상 행 잠금 (다른 트랜잭션이 잡고 있는 행은 건너뜀) - 배치 작업용"""
+    if db.get_bind().dialect.name == "postgresql":
+        return query.with_for_update(of=Task, skip_locked=True)
+    return query
+
+
+def _end_of_today() -> datetime:
+    """오늘 23:59:59 (UTC)"""
+    today = datetime.now(timezone.utc).date()
+    return datetime.combine(today, time.max, tzinfo=timezone.utc)
+
+
+def _today_filter():
+    """오늘 할 일 조건: 미완료 + (마감일 <= 오늘 또는 마감일 없음)"""
+    return (
+        Task.status != TaskStatus.DONE,
+        or_(Task.due_date <= _end_of_today(), Task.due_date.is_(None)),
+    )
+
+
+# 목록 정렬 키 (status, order, created_at, id) - 커서에도 같은 순서로 저장
+_LIST_SORT_KEY = (Task.status, Task.order, Task.created_at, Task.id)
+
+# TaskResponse 필드에 해당하는 컬럼 - 목록 조회 시 ORM 객체 대신 컬럼 튜플로 가져옴
+TASK_RESPONSE_COLUMNS = (
+    Task.id,
+    Task.user_id,
+    Task.project_id,
+    Task.title,
+    Task.description,
+    Task.status,
+    Task.priority,
+    Task.due_date,
+    Task.completed_at,
+    Task.order,
+    Task.created_at,
+    Task.updated_at,
+)
+_RESPONSE_COLUMN_BY_NAME = {column.key: column for column in TASK_RESPONSE_COLUMNS}
+
+
+def projection_columns(fields: Optional[str]) -> tuple:
+    """
+    fields 파라미터 ("title,status,priority") → 조회할 응답 컬럼
+    - 비어 있으면 전체, id는 항상 포함, 순서는 TaskResponse 기준
+    - 없는 필드면 400
+    """
+    if not fields:
+        return TASK_RESPONSE_COLUMNS
+    names = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = names - _RESPONSE_COLUMN_BY_NAME.keys()
+    if unknown:
+        raise InvalidFieldsException(
+            f"알 수 없는 필드입니다: {', '.join(sorted(unknown))} "
+            f"(사용 가능: {', '.join(_RESPONSE_COLUMN_BY_NAME)})"
+        )
+    names.add("id")
+    return tuple(column for column in TASK_RESPONSE_COLUMNS if column.key in names)
+
+# 전문 검색 (PostgreSQL)
+# - tasks.search_vector: title + description 의 tsvector (GENERATED 컬럼, GIN 인덱스)
+# - 'simple' 설정: 형태소 분석 없이 공백 단위 토큰 → 한글도 그대로 색인
+_SEARCH_CONFIG = "simple"
+_SEARCH_VECTOR = literal_column("tasks.search_vector")
+_TSQUERY_SPECIAL = re.compile(r"[&|!():*<>'\\\s]+")
+
+
+def _search_tsquery(search: str) -> Optional[str]:
+    """
+    검색어 → tsquery 문자열 (각 토큰 접두어 매칭, AND 결합)
+
+    예: "회의 준비" → "회의:* & 준비:*"  ("회의를", "준비물"도 매칭)
+    """
+    tokens = [t for t in _TSQUERY_SPECIAL.split(search.lower()) if t]
+    if not tokens:
+        return None
+    return " & ".join(f"{token}:*" for token in tokens)
+
+
+def _uses_fulltext(query: Query) -> bool:
+    return query.session.get_bind().dialect.name == "postgresql"
+
+
+def _search_filter(query: Query, search: str):
+    """검색 조건 (PostgreSQL은 GIN 인덱스, 그 외 DB는 부분 문자열 매칭)"""
+    tsquery = _search_tsquery(search)
+    if tsquery and _uses_fulltext(query):
+        return _SEARCH_VECTOR.op("@@")(func.to_tsquery(_SEARCH_CONFIG, tsquery))
+    pattern = f"%{search}%"
+    return or_(Task.title.ilike(pattern), Task.description.ilike(pattern))
+
+
+def _search_rank(search: str):
+    """검색 관련도 (높을수록 먼저)"""
+    tsquery = _search_tsquery(search)
+    return func.ts_rank(_SEARCH_VECTOR, func.to_tsquery(_SEARCH_CONFIG, tsquery))
+
+
+def _filtered_query(
+    query: Query,
+    user_id: UUID,
+    status: Optional[TaskStatus] = None,
+    priority: Optional[TaskPriority] = None,
+    search: Optional[str] = None,
+    project_id: Optional[UUID] = None,
+) -> Query:
+    """목록/개수 조회 공통 필터"""
+    query = query.filter(Task.user_id == user_id, NOT_DELETED)
+    if project_id:
+        query = query.filter(Task.project_id == project_id)
+    if status:
+        query = query.filter(Task.status == status)
+    if priority:
+        query = query.filter(Task.priority == priority)
+    if search:
+        query = query.filter(_search_filter(query, search))
+    return query
+
+
+def _archive_filters(
+    user_id: UUID,
+    status: Optional[TaskStatus] = None,
+    priority: Optional[TaskPriority] = None,
+    search: Optional[str] = None,
+    project_id: Optional[UUID] = None,
+) -> list:
+    """보관 태스크 조건 (_filtered_query 와 같은 필터, 검색은 부분 문자열 매칭 - 전문 검색 인덱스 없음)"""
+    conditions = [TaskArchive.user_id == user_id]
+    if project_id:
+        conditions.append(TaskArchive.project_id == project_id)
+    if status:
+        conditions.append(TaskArchive.status == status)
+    if priority:
+        conditions.append(TaskArchive.priority == priority)
+    if search:
+        pattern = f"%{search}%"
+        conditions.append(or_(TaskArchive.title.ilike(pattern), TaskArchive.description.ilike(pattern)))
+    return conditions
+
+
+def _cursor_values(cursor: str) -> tuple:
+    """커서 → (status, order, created_at, id)"""
+    status, order, created_at, task_id = decode_cursor(cursor, len(_LIST_SORT_KEY))
+    try:
+        return (
+            TaskStatus(status),
+            int(order),
+            datetime.fromisoformat(created_at),
+            UUID(task_id),
+        )
+    except (TypeError, ValueError):
+        raise InvalidCursorException()
+
+
+def _sync_token_values(token: str) -> tuple:
+    """동기화 토큰 → (시각, id 또는 None)"""
+    changed_at, task_id = decode_cursor(token, 2)
+    try:
+        return (
+            _as_utc(datetime.fromisoformat(changed_at)),
+            UUID(task_id) if task_id is not None else None,
+        )
+    except (TypeError, ValueError):
+        raise InvalidCursorException("유효하지 않은 동기화 토큰입니다")
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite 는 timezone 없이 돌려줌 → UTC로 간주
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _changed_after(changed_at_column, id_column, since: Optional[tuple]):
+    """워터마크 이후 조건 - id가 있으면 (시각, id) Keyset, 없으면 시각 이상"""
+    if since is None:
+        return true()
+    changed_at, task_id = since
+    if task_id is None:
+        return changed_at_column >= changed_at
+    return tuple_(changed_at_column, id_column) > tuple_(
+        changed_at, task_id, types=[changed_at_column.type, id_column.type]
+    )
+
+
+def _record_tombstones(db: Session, user_id: UUID, task_ids: List[UUID]) -> None:
+    """삭제 기록 남기기 (보관 기간 지난 기록은 purge_tombstones 가 정리)"""
+    db.execute(insert(TaskTombstone), [{"task_id": task_id, "user_id": user_id} for task_id in task_ids])
+
+
+# order 간격 - 새 태스크는 컬럼 맨 아래 + 간격, 이동은 이웃 사이 중간값
+ORDER_GAP = 1 << 16
+# 이동 후 이웃과의 간격이 이보다 작으면 백그라운드 재정렬 권장
+ORDER_MIN_GAP = 16
+
+
+def _next_order(db: Session, user_id: UUID, status: TaskStatus) -> int:
+    """상태 컬럼 맨 아래 위치 (인덱스 역방향 탐색 1번)"""
+    last = db.scalar(
+        select(func.max(Task.order)).where(Task.user_id == user_id, Task.status == status, NOT_DELETED)
+    )
+    return (last or 0) + ORDER_GAP
+
+
+def _neighbor_order(db: Session, user_id: UUID, status: TaskStatus, order: int, exclude_id: UUID, below: bool):
+    """order 바로 아래(below=True) 또는 위 이웃의 order (없으면 None)"""
+    if below:
+        column = func.min(Task.order)
+        condition = Task.order > order
+    else:
+        column = func.max(Task.order)
+        condition = Task.order < order
+    return db.scalar(
+        select(column).where(
+            Task.user_id == user_id, Task.status == status, NOT_DELETED, Task.id != exclude_id, condition
+        )
+    )
+
+
+class TaskService:
+    """태스크 CRUD + 조회"""
+
+    @staticmethod
+    def create(db: Session, task_in: TaskCreate, user_id: UUID) -> Task:
+        task = Task(**task_in.model_dump(), user_id=user_id)
+        # 프로젝트 개수 증가 (본인 프로젝트가 아니면 404)
+        apply_count_deltas(
+            db, user_id, task_count_deltas(None, (task.project_id, task.status)), required=[task.project_id]
+        )
+        task.order = _next_order(db, user_id, task.status)
+        if task.status == TaskStatus.DONE:
+            task.completed_at = datetime.now(timezone.utc)
+        db.add(task)
+        db.commit()
+        db.refresh(task)
+        return task
+
+    @staticmethod
+    def get_by_id(db: Session, task_id: UUID, user_id: UUID, for_update: bool = False) -> Optional[Task]:
+        """
+        본인 태스크만 조회 (삭제된 태스크 제외)
+        for_update: 수정 경로용 - 커밋까지 행 잠금 (FOR UPDATE)
+        → 같은 태스크를 동시에 바꾸는 요청은 차례로 실행되고, 프로젝트 개수 증감은
+          잠근 뒤 읽은 (project_id, status) 기준이라 두 번 반영되지 않음
+        """
+        query = db.query(Task).filter(Task.id == task_id, Task.user_id == user_id, NOT_DELETED)
+        if for_update:
+            query = query.with_for_update().populate_existing()
+        return query.first()
+
+    @staticmethod
+    def get_multi(
+        db: Session,
+        user_id: UUID,
+        skip: int = 0,
+        limit: int = 20,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        search: Optional[str] = None,
+        cursor: Optional[str] = None,
+        columns: Optional[Sequence] = None,
+        project_id: Optional[UUID] = None,
+        include_archived: bool = False,
+    ) -> List[Task]:
+        """
+        목록 조회 (미완료 먼저, 같은 상태 내에서는 order 순)
+
+        - columns를 주면 Task 객체 대신 해당 컬럼의 Row 튜플 목록
+          (identity map / 속성 추적 없이 가져옴 → 직렬화 전용 경로)
+          커서 계산용 정렬 키 컬럼은 빠져 있으면 추가로 조회
+
+        - cursor가 있으면 Keyset 모드: 정렬 키가 커서보다 큰 행부터 (skip 무시)
+          → OFFSET 스캔 없이 인덱스 탐색으로 시작 위치를 찾음
+        - cursor가 없으면 기존 skip/limit (Offset 모드)
+        - search는 전문 검색 인덱스로 찾고, Offset 모드에서는 관련도 순으로 정렬
+          (커서 모드에서는 정렬 키 순서 유지)
+        - project_id 가 있으면 그 프로젝트 태스크만 (ix_tasks_project_status_order)
+        - include_archived 면 보관 태스크(tasks_archive)도 같은 정렬로 합침
+          (항상 Row 튜플, archived 컬럼 추가, 검색 관련도 정렬 없음)
+        """
+        if include_archived:
+            columns = columns or TASK_RESPONSE_COLUMNS
+        if columns:
+            selected = {column.key for column in columns}
+            columns = [*columns, *(column for column in _LIST_SORT_KEY if column.key not in selected)]
+        query = _filtered_query(
+            db.query(*(columns or (Task,))), user_id, status, priority, search, project_id
+        )
+        order_by = list(_LIST_SORT_KEY)
+
+        if TaskService.orders_by_rank(db, search, cursor, include_archived):
+            order_by.insert(0, _search_rank(search).desc())
+
+        archive_filters = _archive_filters(user_id, status, priority, search, project_id)
+        if cursor:
+            key_types = [column.type for column in _LIST_SORT_KEY]
+            values = _cursor_values(cursor)
+            query = query.filter(tuple_(*_LIST_SORT_KEY) > tuple_(*values, types=key_types))
+            archive_filters.append(
+                tuple_(*(getattr(TaskArchive, column.key) for column in _LIST_SORT_KEY))
+                > tuple_(*values, types=key_types)
+            )
+            skip = 0
+
+        if not include_archived:
+            return query.order_by(*order_by).offset(skip).limit(limit).all()
+
+        # 양쪽을 각자 인덱스 순서로 skip + limit 개까지만 읽고 합쳐서 정렬
+        archive_sort_key = [getattr(TaskArchive, column.key) for column in _LIST_SORT_KEY]
+        live = query.add_columns(false().label("archived")).order_by(*order_by).limit(skip + limit)
+        archived = (
+            select(*(getattr(TaskArchive, column.key) for column in columns), true().label("archived"))
+            .where(*archive_filters)
+            .order_by(*archive_sort_key)
+            .limit(skip + limit)
+        )
+        merged = union_all(live.subquery().select(), archived.subquery().select()).subquery()
+        return db.execute(
+            select(merged)
+            .order_by(*(merged.c[column.key] for column in _LIST_SORT_KEY))
+            .offset(skip)
+            .limit(limit)
+        ).all()
+
+    @staticmethod
+    def orders_by_rank(
+        db: Session,
+        search: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include_archived: bool = False,
+    ) -> bool:
+        """
+        get_multi 가 검색 관련도 순으로 정렬하는지 (PostgreSQL 전문 검색 + Offset 모드)
+        → 이때는 정렬 키 커서로 다음 페이지를 이어갈 수 없음 (next_cursor 없음)
+        """
+        return bool(
+            search and not cursor and not include_archived and _search_tsquery(search)
+            and db.get_bind().dialect.name == "postgresql"
+        )
+
+    @staticmethod
+    def get_cursor(task: Task) -> str:
+        """이 태스크 다음 페이지를 가리키는 커서"""
+        return encode_cursor([
+            task.status.value,
+            task.order or 0,
+            task.created_at.isoformat(),
+            str(task.id),
+        ])
+
+    @staticmethod
+    def get_count(
+        db: Session,
+        user_id: UUID,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        search: Optional[str] = None,
+        project_id: Optional[UUID] = None,
+        include_archived: bool = False,
+    ) -> int:
+        query = _filtered_query(
+            db.query(func.count(Task.id)), user_id, status, priority, search, project_id
+        )
+        count = query.scalar() or 0
+        if include_archived:
+            count += db.scalar(
+                select(func.count(TaskArchive.id))
+                .where(*_archive_filters(user_id, status, priority, search, project_id))
+            ) or 0
+        return count
+
+    @staticmethod
+    def get_today_tasks(db: Session, user_id: UUID, columns: Optional[Sequence] = None) -> List[Task]:
+        """오늘 할 일 (높은 우선순위 먼저, columns는 get_multi와 동일)"""
+        return (
+            db.query(*(columns or (Task,)))
+            .filter(Task.user_id == user_id, NOT_DELETED, *_today_filter())
+            .order_by(Task.priority, Task.order)
+            .all()
+        )
+
+    @staticmethod
+    def get_stats(db: Session, user_id: UUID, project_id: Optional[UUID] = None) -> dict:
+        """
+        통계 (집계 쿼리 1번)
+
+        상태별/우선순위별/오늘 할 일/마감 지난 개수를
+        조건부 COUNT로 한 번에 계산 → 행을 메모리로 가져오지 않음
+        project_id 가 있으면 그 프로젝트 태스크만 집계
+        """
+        now = datetime.now(timezone.utc)
+        not_done = Task.status != TaskStatus.DONE
+
+        columns = [func.count(Task.id).label("total")]
+        columns += [
+            func.count(Task.id).filter(Task.status == s).label(f"status_{s.value}")
+            for s in TaskStatus
+        ]
+        columns += [
+            func.count(Task.id).filter(Task.priority == p).label(f"priority_{p.value}")
+            for p in TaskPriority
+        ]
+        columns += [
+            func.count(Task.id).filter(*_today_filter()).label("today"),
+            func.count(Task.id).filter(not_done, Task.due_date < now).label("overdue"),
+        ]
+
+        row = _filtered_query(db.query(*columns), user_id, project_id=project_id).one()
+
+        total = row.total or 0
+        done = row.status_done or 0
+        return {
+            "total": total,
+            "by_status": {s.value: getattr(row, f"status_{s.value}") or 0 for s in TaskStatus},
+            "by_priority": {p.value: getattr(row, f"priority_{p.value}") or 0 for p in TaskPriority},
+            "today_count": row.today or 0,
+            "overdue_count": row.overdue or 0,
+            "completion_rate": round((done / total * 100) if total > 0 else 0, 1),
+        }
+
+    @staticmethod
+    def update(db: Session, task: Task, task_update: TaskUpdate) -> Task:
+        """
+        Partial Update (보낸 필드만 반영, 프로젝트/상태가 바뀌면 프로젝트 개수도)
+        task 는 get_by_id(for_update=True) 로 잠근 것 (개수 증감의 기준 상태)
+        """
+        update_data = task_update.model_dump(exclude_unset=True)
+        before = (task.project_id, task.status)
+        after = (update_data.get("project_id", task.project_id), update_data.get("status", task.status))
+        if after != before:
+            # 태스크를 수정(flush)하기 전에 → 없는 프로젝트면 FK 오류 대신 404
+            apply_count_deltas(
+                db, task.user_id, task_count_deltas(before, after),
+                required=[after[0]] if after[0] != before[0] else (),
+            )
+        for field, value in update_data.items():
+            setattr(task, field, value)
+        db.commit()
+        db.refresh(task)
+        return task
+
+    @staticmethod
+    def complete(db: Session, task: Task) -> Task:
+        """완료 처리 (status=done, completed_at=now) - task 는 get_by_id(for_update=True) 로 잠근 것"""
+        if task.status != TaskStatus.DONE:
+            apply_count_deltas(
+                db, task.user_id,
+                task_count_deltas((task.project_id, task.status), (task.project_id, TaskStatus.DONE)),
+            )
+        task.status = TaskStatus.DONE
+        task.completed_at = datetime.now(timezone.utc)
+        db.commit()
+        db.refresh(task)
+        return task
+
+    @staticmethod
+    def delete(db: Session, user_id: UUID, task_id: UUID) -> bool:
+        """
+        삭제 (Soft Delete) - 행을 지우지 않고 deleted_at 만 채움 → 없으면 False
+        - 먼저 조회하지 않음: UPDATE ... RETURNING 1번으로 소유권 확인 + 개수 증감용 상태
+        - 삭제 기록을 남김 → 델타 동기화의 deleted 로 전달
+        """
+        row = db.execute(
+            update(Task)
+            .where(Task.id == task_id, Task.user_id == user_id, NOT_DELETED)
+            # 삭제된 태스크는 조회/동기화에서 빠짐 → updated_at(onupdate)은 그대로
+            .values(deleted_at=func.now(), updated_at=Task.updated_at)
+            .returning(Task.project_id, Task.status)
+            .execution_options(synchronize_session=False)
+        ).one_or_none()
+        if row is None:
+            db.rollback()
+            return False
+        _record_tombstones(db, user_id, [task_id])
+        apply_count_deltas(db, user_id, task_count_deltas((row.project_id, row.status), None))
+        db.commit()
+        return True
+
+    @staticmethod
+    def restore(db: Session, user_id: UUID, task_id: UUID) -> Optional[Task]:
+        """
+        삭제 취소 - 완전 삭제(purge) 전이면 되돌림 → 복구한 태스크 (없으면 None)
+        - updated_at 을 지금으로 + 삭제 기록 제거 → 델타 동기화에서 다시 생성된 것으로 전달
+        - 목록 위치(order)는 삭제 전 그대로
+        """
+        task = db.scalars(
+            update(Task)
+            .where(Task.id == task_id, Task.user_id == user_id, Task.deleted_at.is_not(None))
+            .values(deleted_at=None, updated_at=func.now())
+            .returning(Task),
+            execution_options={"populate_existing": True},
+        ).one_or_none()
+        if task is None:
+            db.rollback()
+            return None
+        # RETURNING 으로 받은 값 그대로 응답 (커밋 후 만료 → 다시 SELECT 방지)
+        db.expunge(task)
+        db.execute(delete(TaskTombstone).where(TaskTombstone.task_id == task_id))
+        # 삭제된 동안 프로젝트가 삭제됐으면 project_id 는 이미 NULL (ProjectService.delete)
+        apply_count_deltas(db, user_id, task_count_deltas(None, (task.project_id, task.status)))
+        db.commit()
+        return task
+
+    @staticmethod
+    def purge_deleted(
+        db: Session,
+        older_than_days: Optional[int] = None,
+        limit: Optional[int] = None,
+        dry_run: bool = False,
+    ) -> int:
+        """
+        삭제 후 보관 기간이 지난 태스크를 최대 limit개 완전 삭제 (트랜잭션 1번) → 삭제한 수
+        - ix_tasks_deleted 부분 인덱스로 오래된 순, PostgreSQL은 잠긴 행 건너뜀
+        - 프로젝트 개수 / 삭제 기록은 삭제할 때 이미 반영됨
+        """
+        days = settings.TASK_PURGE_AFTER_DAYS if older_than_days is None else older_than_days
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        ids = list(db.scalars(skip_locked(db, (
+            select(Task.id)
+            .where(Task.deleted_at.is_not(None), Task.deleted_at < cutoff)
+            .order_by(Task.deleted_at)
+            .limit(limit or settings.TASK_PURGE_BATCH_SIZE)
+        ))))
+        if ids and not dry_run:
+            db.execute(delete(Task).where(Task.id.in_(ids)).execution_options(synchronize_session=False))
+            db.commit()
+        else:
+            db.rollback()
+        return len(ids)
+
+    @staticmethod
+    def purge_tombstones(db: Session, limit: Optional[int] = None, dry_run: bool = False) -> int:
+        """보관 기간(SYNC_TOMBSTONE_RETENTION_DAYS) 지난 삭제 기록을 최대 limit개 정리 → 정리한 수"""
+        cutoff = datetime.now(timezone.utc) - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+        ids = list(db.scalars(
+            select(TaskTombstone.task_id)
+            .where(TaskTombstone.deleted_at < cutoff)
+            .order_by(TaskTombstone.deleted_at)
+            .limit(limit or settings.TASK_PURGE_BATCH_SIZE)
+        ))
+        if ids and not dry_run:
+            db.execute(delete(TaskTombstone).where(TaskTombstone.task_id.in_(ids)))
+            db.commit()
+        else:
+            db.rollback()
+        return len(ids)
+
+    @staticmethod
+    def get_changes(db: Session, user_id: UUID, since: Optional[str] = None, limit: int = 500) -> dict:
+        """
+        델타 동기화 - since 이후 생성/수정된 태스크 + 삭제된 태스크 id
+
+        - tasks.updated_at / task_tombstones.deleted_at 을 (시각, id) 순으로 합쳐서 limit개
+          → 두 인덱스 범위 스캔 (바뀐 만큼만 읽음)
+        - 새 워터마크는 DB 현재 시각 - SYNC_WATERMARK_LAG_SECONDS 까지만 전진
+          → 그 사이에 늦게 커밋된 변경도 다음 동기화에서 받음 (일부 중복 전송은 허용)
+        - since가 삭제 기록 보관 기간보다 오래됐으면 410
+
+        Returns: {"changed": [Task], "deleted": [UUID], "watermark": str, "has_more": bool}
+        """
+        db_now = _as_utc(db.scalar(select(func.now())))
+        since_values = _sync_token_values(since) if since else None
+        if since_values and since_values[0] < db_now - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS):
+            raise SyncTokenExpiredException()
+
+        changes = union_all(
+            select(Task.id.label("id"), Task.updated_at.label("changed_at"), false().label("deleted"))
+            .where(Task.user_id == user_id, NOT_DELETED, _changed_after(Task.updated_at, Task.id, since_values)),
+            select(TaskTombstone.task_id, TaskTombstone.deleted_at, true())
+            .where(
+                TaskTombstone.user_id == user_id,
+                _changed_after(TaskTombstone.deleted_at, TaskTombstone.task_id, since_values),
+            ),
+        ).subquery()
+        rows = db.execute(
+            select(changes).order_by(changes.c.changed_at, changes.c.id).limit(limit + 1)
+        ).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        changed_ids = [row.id for row in rows if not row.deleted]
+        tasks = (
+            {task.id: task for task in db.query(Task).filter(Task.id.in_(changed_ids), NOT_DELETED)}
+            if changed_ids else {}
+        )
+
+        # 다음 워터마크
+        cutoff = db_now - timedelta(seconds=settings.SYNC_WATERMARK_LAG_SECONDS)
+        last = (_as_utc(rows[-1].changed_at), rows[-1].id) if rows else None
+        if has_more and last[0] < cutoff:
+            watermark = last  # cutoff 이전은 이미 커밋 확정 → 정확한 Keyset으로 이어감
+        elif since_values is None or cutoff > since_values[0]:
+            watermark = (cutoff, None)
+        else:
+            # 지연 구간 안에서만 바뀌는 중 → 진행을 위해 마지막 행 기준 (없으면 그대로)
+            watermark = last if has_more else since_values
+
+        return {
+            "changed": [tasks[task_id] for task_id in changed_ids if task_id in tasks],
+            "deleted": [row.id for row in rows if row.deleted],
+            "watermark": encode_cursor([
+                watermark[0].isoformat(),
+                str(watermark[1]) if watermark[1] is not None else None,
+            ]),
+            "has_more": has_more,
+        }
+
+    @staticmethod
+    def bulk(db: Session, user_id: UUID, operations: List[TaskBulkOperation]) -> List[dict]:
+        """
+        일괄 처리 (트랜잭션 1번)
+
+        - 소유권 확인: 대상 id 전체를 쿼리 1번으로 조회 + 커밋까지 잠금 (id 순서 → 교착 방지)
+        - create: 다건 INSERT 1번
+        - update: 기본키 기준 다건 UPDATE
+        - status / complete: 목표 상태별 UPDATE ... WHERE id IN (...) 1번씩
+        - delete: 삭제 기록 다건 INSERT + deleted_at UPDATE ... WHERE id IN (...) 1번 (Soft Delete)
+        - 적용 순서: create → update → status/complete → delete
+        - 프로젝트 개수: 작업 전후 (project_id, status)를 비교해 바뀐 프로젝트마다 UPDATE 1번
+          (지정한 프로젝트가 본인 것이 아니면 해당 작업만 실패)
+
+        Returns: 작업별 결과 (index, op, id, ok, error)
+        """
+        now = datetime.now(timezone.utc)
+        results: List[dict] = []
+
+        target_ids = {operation.id for operation in operations if operation.op != "create"}
+        # 대상 태스크의 현재 (project_id, status) - 프로젝트 개수 증감 계산용 (잠근 뒤 읽은 값)
+        owned: Dict[UUID, tuple] = {}
+        if target_ids:
+            owned = {
+                row.id: (row.project_id, row.status)
+                for row in db.execute(
+                    select(Task.id, Task.project_id, Task.status)
+                    .where(Task.user_id == user_id, Task.id.in_(target_ids), NOT_DELETED)
+                    .order_by(Task.id)
+                    .with_for_update()
+                )
+            }
+        requested_projects = {
+            project_id
+            for operation in operations
+            for project_id in (
+                operation.task.project_id if operation.task else None,
+                operation.changes.project_id if operation.changes else None,
+            )
+            if project_id is not None
+        }
+        projects = owned_project_ids(db, user_id, list(requested_projects))
+
+        creates: List[dict] = []
+        next_orders: Dict[TaskStatus, int] = {}
+        updates: List[dict] = []
+        status_targets: Dict[TaskStatus, List[UUID]] = defaultdict(list)
+        deletes: List[UUID] = []
+        count_deltas: CountDeltas = {}
+
+        for index, operation in enumerate(operations):
+            result = {"index": index, "op": operation.op, "id": operation.id, "ok": True}
+            results.append(result)
+            project_id = None
+            if operation.op == "create":
+                project_id = operation.task.project_id
+            elif operation.op == "update":
+                project_id = operation.changes.project_id
+
+            if project_id is not None and project_id not in projects:
+                result.update(ok=False, error="프로젝트를 찾을 수 없습니다")
+            elif operation.op == "create":
+                row = {**operation.task.model_dump(), "id": uuid4(), "user_id": user_id}
+                if row["status"] not in next_orders:
+                    next_orders[row["status"]] = _next_order(db, user_id, row["status"])
+                row["order"] = next_orders[row["status"]]
+                next_orders[row["status"]] += ORDER_GAP
+                if row["status"] == TaskStatus.DONE:
+                    row["completed_at"] = now
+                creates.append(row)
+                add_count(count_deltas, row["project_id"], row["status"], 1)
+                result["id"] = row["id"]
+            elif operation.id not in owned:
+                result.update(ok=False, error="태스크를 찾을 수 없습니다")
+            elif operation.op == "update":
+                changes = operation.changes.model_dump(exclude_unset=True)
+                if changes:
+                    updates.append({"id": operation.id, **changes})
+            elif operation.op == "status":
+                status_targets[operation.status].append(operation.id)
+            elif operation.op == "complete":
+                status_targets[TaskStatus.DONE].append(operation.id)
+            else:
+                deletes.append(operation.id)
+
+        # 적용 순서대로 최종 (project_id, status)를 계산해서 작업 전과 비교
+        final = dict(owned)
+        for row in updates:
+            project_id, status = final[row["id"]]
+            final[row["id"]] = (row.get("project_id", project_id), row.get("status", status))
+        for status, ids in status_targets.items():
+            for task_id in ids:
+                final[task_id] = (final[task_id][0], status)
+        for task_id in deletes:
+            final[task_id] = None
+        for task_id, before in owned.items():
+            if final[task_id] != before:
+                for project_id, (open_delta, done_delta) in task_count_deltas(before, final[task_id]).items():
+                    counts = count_deltas.setdefault(project_id, [0, 0])
+                    counts[0] += open_delta
+                    counts[1] += done_delta
+
+        try:
+            if creates:
+                db.execute(insert(Task), creates)
+            if updates:
+                db.execute(update(Task), updates)
+            for status, ids in status_targets.items():
+                values = {"status": status}
+                if status == TaskStatus.DONE:
+                    values["completed_at"] = now
+                db.execute(
+                    update(Task)
+                    .where(Task.user_id == user_id, Task.id.in_(ids))
+                    .values(**values)
+                    .execution_options(synchronize_session=False)
+                )
+            if deletes:
+                _record_tombstones(db, user_id, list(dict.fromkeys(deletes)))
+                db.execute(
+                    update(Task)
+                    .where(Task.user_id == user_id, Task.id.in_(deletes))
+                    .values(deleted_at=now, updated_at=Task.updated_at)
+                    .execution_options(synchronize_session=False)
+                )
+            apply_count_deltas(db, user_id, count_deltas)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        return results
+
+    @staticmethod
+    def move(
+        db: Session,
+        task: Task,
+        prev_id: Optional[UUID] = None,
+        next_id: Optional[UUID] = None,
+        status: Optional[TaskStatus] = None,
+    ) -> tuple:
+        """
+        드래그 앤 드롭 이동 - 이동한 태스크 1행만 수정
+
+        이웃 사이의 중간값을 order로 사용하고, 간격이 다 떨어졌을 때만
+        해당 상태 컬럼을 재정렬(rebalance)한 뒤 다시 계산합니다.
+
+        task 는 get_by_id(for_update=True) 로 잠근 것 (상태 변경 시 개수 증감 기준)
+
+        Returns: (task, 재정렬 권장 여부) - 이웃과의 간격이 ORDER_MIN_GAP 미만이면 True
+        """
+        status = status or task.status
+        if task.id in (prev_id, next_id):
+            raise InvalidTaskMoveException()
+
+        neighbor_ids = [i for i in (prev_id, next_id) if i is not None]
+        neighbors = {}
+        if neighbor_ids:
+            neighbors = {
+                row.id: row
+                for row in db.execute(
+                    select(Task.id, Task.order, Task.status).where(
+                        Task.user_id == task.user_id, Task.id.in_(neighbor_ids), NOT_DELETED
+                    )
+                )
+            }
+            if len(neighbors) != len(neighbor_ids):
+                raise TaskNotFoundException()
+            if any(row.status != status for row in neighbors.values()):
+                raise InvalidTaskMoveException("이웃 태스크와 상태가 다릅니다")
+
+        def _bounds():
+            prev_order = neighbors[prev_id].order if prev_id else None
+            next_order = neighbors[next_id].order if next_id else None
+            # 한쪽만 주어졌으면 반대쪽 실제 이웃을 조회
+            if prev_id and not next_id:
+                next_order = _neighbor_order(db, task.user_id, status, prev_order, task.id, below=True)
+            elif next_id and not prev_id:
+                prev_order = _neighbor_order(db, task.user_id, status, next_order, task.id, below=False)
+            return prev_order, next_order
+
+        if not neighbor_ids:
+            new_order = _next_order(db, task.user_id, status)
+            prev_order, next_order = new_order - ORDER_GAP, None
+        else:
+            prev_order, next_order = _bounds()
+            if prev_order is not None and next_order is not None and 0 <= next_order - prev_order < 2:
+                # 간격 소진 → 이 컬럼만 재정렬 후 다시 계산 (드묾)
+                TaskService.rebalance(db, task.user_id, status, commit=False)
+                neighbors = {
+                    row.id: row
+                    for row in db.execute(
+                        select(Task.id, Task.order, Task.status).where(Task.id.in_(neighbor_ids))
+                    )
+                }
+                prev_order, next_order = _bounds()
+
+            if prev_order is not None and next_order is not None and prev_order >= next_order:
+                raise InvalidTaskMoveException("prev_id 태스크가 next_id 태스크보다 위에 있어야 합니다")
+
+            if prev_order is None:
+                new_order = next_order - ORDER_GAP
+            elif next_order is None:
+                new_order = prev_order + ORDER_GAP
+            else:
+                new_order = (prev_order + next_order) // 2
+
+        gaps = [abs(new_order - o) for o in (prev_order, next_order) if o is not None]
+        needs_rebalance = bool(gaps) and min(gaps) < ORDER_MIN_GAP
+
+        if status != task.status:
+            apply_count_deltas(
+                db, task.user_id, task_count_deltas((task.project_id, task.status), (task.project_id, status))
+            )
+            task.status = status
+            if status == TaskStatus.DONE:
+                task.completed_at = datetime.now(timezone.utc)
+        task.order = new_order
+        db.commit()
+        db.refresh(task)
+        return task, needs_rebalance
+
+    @staticmethod
+    def rebalance(db: Session, user_id: UUID, status: TaskStatus, commit: bool = True) -> None:
+        """
+        상태 컬럼의 order를 ORDER_GAP 간격으로 다시 매김 (UPDATE 1번)
+        현재 순서(order, created_at, id)는 그대로 유지
+        """
+        ranked = (
+            select(
+                Task.id.label("id"),
+                (
+                    func.row_number().over(order_by=(Task.order, Task.created_at, Task.id))
+                    * ORDER_GAP
+                ).label("new_order"),
+            )
+            .where(Task.user_id == user_id, Task.status == status, NOT_DELETED)
+            .subquery()
+        )
+        db.execute(
+            update(Task)
+            .where(Task.id == ranked.c.id)
+            .values(order=ranked.c.new_order)
+            .execution_options(synchronize_session=False)
+        )
+        if commit:
+            db.commit()
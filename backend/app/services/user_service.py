@@ -0,0 +1,112 @@
+# backend/app/services/user_service.py
+"""
+유저 비즈니스 로직
+"""
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUTTLCache
+from app.core.config import settings
+from app.core.security import get_password_hash, verify_password
+from app.models.users import User
+from app.schemas.users import UserCreate
+
+# user_id → 유저 컬럼 값 (인증 시 DB 조회 생략용)
+_user_cache = LRUTTLCache(settings.AUTH_CACHE_MAX_ENTRIES)
+
+
+class UserService:
+    """유저 CRUD"""
+
+    @staticmethod
+    def get_by_id(db: Session, user_id: UUID) -> Optional[User]:
+        return db.query(User).filter(User.id == user_id).first()
+
+    @staticmethod
+    def get_cached(user_id: UUID) -> Optional[User]:
+        """
+        캐시된 유저 스냅샷 (없으면 None)
+        - 세션에 붙지 않은 읽기 전용 User 객체를 매번 새로 만들어 반환
+        """
+        if not settings.AUTH_CACHE_ENABLED:
+            return None
+        values = _user_cache.get(user_id)
+        if values is None:
+            return None
+        return User(**values)
+
+    @staticmethod
+    def cache_snapshot(user: User, ttl: float) -> None:
+        """유저 스냅샷 저장 (ttl은 AUTH_USER_CACHE_TTL_SECONDS 이하로 제한)"""
+        if not settings.AUTH_CACHE_ENABLED:
+            return
+        values = {column.key: getattr(user, column.key) for column in User.__table__.columns}
+        _user_cache.set(user.id, values, min(ttl, settings.AUTH_USER_CACHE_TTL_SECONDS))
+
+    @staticmethod
+    def invalidate_cache(user_id: UUID) -> None:
+        """유저 정보가 바뀌면 호출 (이 워커의 스냅샷 제거)"""
+        _user_cache.delete(user_id)
+
+    @staticmethod
+    def get_by_email(db: Session, email: str) -> Optional[User]:
+        return db.query(User).filter(User.email == email).first()
+
+    @staticmethod
+    def get_by_username(db: Session, username: str) -> Optional[User]:
+        return db.query(User).filter(User.username == username).first()
+
+    @staticmethod
+    def create(
+        db: Session,
+        user_in: UserCreate,
+        hashed_password: Optional[str] = None,
+    ) -> User:
+        """
+        유저 생성 (비밀번호는 해싱해서 저장)
+        - hashed_password를 넘기면 그대로 사용 (해싱을 DB 세션 밖에서 미리 한 경우)
+        """
+        user = User(
+            email=user_in.email,
+            username=user_in.username,
+            full_name=user_in.full_name,
+            hashed_password=hashed_password or get_password_hash(user_in.password),
+        )
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+        return user
+
+    @staticmethod
+    def authenticate(db: Session, email: str, password: str) -> Optional[User]:
+        """이메일 + 비밀번호 검증 (실패 시 None)"""
+        user = UserService.get_by_email(db, email)
+        if not user:
+            return None
+        if not verify_password(password, user.hashed_password):
+            return None
+        return user
+
+    @staticmethod
+    def deactivate(db: Session, user: User) -> User:
+        """유저 비활성화 (캐시된 스냅샷도 즉시 제거)"""
+        user.is_active = False
+        db.commit()
+        db.refresh(user)
+        UserService.invalidate_cache(user.id)
+        return user
+
+    @staticmethod
+    def update_password_hash(db: Session, user: User, hashed_password: str) -> User:
+        """
+        해시만 교체 (cost 변경 후 재해싱 등)
+        user 는 세션을 닫은 뒤(해싱 중 연결 반환)의 객체일 수 있음 → id 로 UPDATE
+        """
+        db.execute(update(User).where(User.id == user.id).values(hashed_password=hashed_password))
+        db.commit()
+        user.hashed_password = hashed_password
+        UserService.invalidate_cache(user.id)
+        return user
@@ -0,0 +1,84 @@
+# backend/archive_tasks.py
+"""
+태스크 보관 작업 (tasks → tasks_archive)
+
+완료 후 --older-than-days (기본 TASK_ARCHIVE_AFTER_DAYS) 가 지난 태스크와
+보관된 프로젝트의 태스크를 배치로 옮깁니다. 일반 목록/오늘 할 일/통계 쿼리는
+tasks 만 읽으므로 작업 중인 태스크 수만큼만 읽게 됩니다.
+
+- 배치 1번 = 트랜잭션 1번 (--batch-size 개), 배치 사이 --sleep 초 쉬기
+  → 운영 중에 실행해도 잠금/WAL/복제 지연이 한 번에 몰리지 않음
+- PostgreSQL은 수정 중인 행을 건너뛰고(SKIP LOCKED) 다음 실행 때 옮김
+- 배치마다 태스크가 옮겨진 유저의 캐시 무효화 + tasks.archived 이벤트 발행
+  (API 워커에 전달하려면 REDIS_URL 설정 필요)
+- cron 등으로 주기 실행 (예: 매일 새벽), 결과는 JSON으로 출력
+
+사용법:
+  python archive_tasks.py                               # 기본 설정으로 전부
+  python archive_tasks.py --dry-run                     # 대상 수만 (첫 배치)
+  python archive_tasks.py --older-than-days 30 --batch-size 500 --sleep 0.5 --max-batches 100
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.events import event_broker, notify_users
+from app.services.archive_service import TaskArchiveService
+
+
+async def run(args) -> dict:
+    db = SessionLocal()
+    totals = {"moved": 0, "done": 0, "project": 0}
+    batches = 0
+    try:
+        while True:
+            result = TaskArchiveService.archive_batch(
+                db, older_than_days=args.older_than_days, limit=args.batch_size, dry_run=args.dry_run
+            )
+            batches += 1
+            for key in totals:
+                totals[key] += result[key]
+            if not args.dry_run:
+                await notify_users(result["user_ids"], "tasks.archived")
+            if args.dry_run or result["moved"] < args.batch_size:
+                break
+            if args.max_batches and batches >= args.max_batches:
+                break
+            if args.sleep:
+                await asyncio.sleep(args.sleep)
+    finally:
+        db.close()
+        await event_broker.shutdown()
+    return {"batches": batches, **totals}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="오래된 완료 태스크 / 보관 프로젝트 태스크 보관")
+    parser.add_argument(
+        "--older-than-days", type=int, default=settings.TASK_ARCHIVE_AFTER_DAYS,
+        help="완료 후 이 일수가 지난 태스크를 보관",
+    )
+    parser.add_argument("--batch-size", type=int, default=settings.TASK_ARCHIVE_BATCH_SIZE, help="배치당 태스크 수")
+    parser.add_argument("--sleep", type=float, default=0.2, help="배치 사이 대기 (초)")
+    parser.add_argument("--max-batches", type=int, default=0, help="최대 배치 수 (0이면 끝까지)")
+    parser.add_argument("--dry-run", action="store_true", help="옮기지 않고 첫 배치 대상 수만 출력")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    result = asyncio.run(run(args))
+
+    print(json.dumps({
+        "dry_run": args.dry_run,
+        "older_than_days": args.older_than_days,
+        **result,
+        "elapsed_s": round(time.perf_counter() - start, 3),
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
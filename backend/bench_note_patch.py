@@ -0,0 +1,186 @@
+# backend/bench_note_patch.py
+"""
+일일 노트 저장 벤치마크 (전체 교체 vs 부분 수정)
+
+임시 유저에 큰 마크다운 노트(기본 1MB)를 만들고, 같은 편집 N회를 두 방식으로 저장합니다.
+
+- replace: PUT 방식 - DailyNoteService.upsert 로 본문 전체를 매번 전송/저장
+- patch:   PATCH 방식 - DailyNoteService.patch 로 변경분(ops)만 전송/저장
+           (DAILY_NOTE_COMPACT_PATCHES 마다 compact 도 실행해서 시간에 포함)
+
+방식별 저장 지연(ms), 요청 본문 크기(bytes), PostgreSQL이면 WAL 기록량(bytes)과
+편집 후 노트 조회 지연을 JSON으로 출력합니다. 끝나면 임시 유저와 노트는 삭제됩니다.
+
+사용법:
+  python bench_note_patch.py                    # 1MB 노트, 편집 200회
+  python bench_note_patch.py --size-kb 4096 --edits 500
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import date
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models import DailyNote, User
+from app.schemas.daily_note import DailyNotePatchOp, DailyNoteUpsert
+from app.services.daily_note_service import DailyNoteService, apply_ops
+
+NOTE_DATE = date(2026, 1, 1)
+LINES = [
+    "- [ ] 회의록 정리하고 공유하기",
+    "- [x] 배포 체크리스트 확인",
+    "## 오늘 한 일",
+    "리뷰 코멘트 반영, 테스트 추가, 문서 업데이트 (deploy report)",
+    "",
+]
+
+
+def make_content(size: int, rng: random.Random) -> str:
+    """size 글자 정도의 마크다운"""
+    parts: List[str] = []
+    length = 0
+    while length < size:
+        line = rng.choice(LINES)
+        parts.append(line)
+        length += len(line) + 1
+    return "\n".join(parts)[:size]
+
+
+def make_edits(content: str, count: int, rng: random.Random) -> List[list]:
+    """타이핑 / 지우기 같은 작은 편집 count개 ([pos, delete, insert], 앞 편집이 반영된 본문 기준)"""
+    edits = []
+    length = len(content)
+    for _ in range(count):
+        pos = rng.randrange(length)
+        delete = rng.choice([0, 0, 1, 5])
+        delete = min(delete, length - pos)
+        insert = rng.choice(["가", "완료", " 확인 필요", "", "- [ ] 새 할 일\n"])
+        edits.append([pos, delete, insert])
+        length += len(insert) - delete
+    return edits
+
+
+def wal_lsn(db) -> Optional[str]:
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    return db.execute(text("SELECT pg_current_wal_lsn()")).scalar()
+
+
+def wal_bytes(db, start: Optional[str]) -> Optional[int]:
+    if start is None:
+        return None
+    return int(db.execute(
+        text("SELECT pg_wal_lsn_diff(pg_current_wal_lsn(), :start)"), {"start": start}
+    ).scalar())
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "mean_ms": round(statistics.mean(ordered), 3),
+        "p50_ms": round(ordered[len(ordered) // 2], 3),
+        "p95_ms": round(ordered[max(int(len(ordered) * 0.95) - 1, 0)], 3),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+
+def run(db, user_id: uuid.UUID, content: str, edits: List[list], mode: str) -> Dict[str, object]:
+    DailyNoteService.upsert(db, user_id, NOTE_DATE, DailyNoteUpsert(content=content))
+    revision = DailyNoteService.get_by_date(db, user_id, NOTE_DATE)["revision"]
+    local = content
+    latencies: List[float] = []
+    request_bytes = 0
+    compactions = 0
+
+    start_lsn = wal_lsn(db)
+    for edit in edits:
+        local = apply_ops(local, [edit])
+        start = time.perf_counter()
+        if mode == "replace":
+            body = json.dumps({"content": local}, ensure_ascii=False)
+            DailyNoteService.upsert(db, user_id, NOTE_DATE, DailyNoteUpsert.model_validate_json(body))
+        else:
+            body = json.dumps(
+                {"base_revision": revision, "ops": [dict(zip(("pos", "delete", "insert"), edit))]},
+                ensure_ascii=False,
+            )
+            ops = [DailyNotePatchOp(**op) for op in json.loads(body)["ops"]]
+            result = DailyNoteService.patch(db, user_id, NOTE_DATE, revision, ops)
+            revision = result["revision"]
+            # API는 응답 후 백그라운드로 실행 - 여기서는 같은 스레드에서 실행해서 비용에 포함
+            if result["pending_patches"] >= settings.DAILY_NOTE_COMPACT_PATCHES:
+                DailyNoteService.compact(db, result["id"])
+                compactions += 1
+        latencies.append((time.perf_counter() - start) * 1000)
+        request_bytes += len(body.encode())
+    written = wal_bytes(db, start_lsn)
+
+    start = time.perf_counter()
+    note = DailyNoteService.get_by_date(db, user_id, NOTE_DATE)
+    read_ms = (time.perf_counter() - start) * 1000
+    if note["content"] != local:
+        raise RuntimeError(f"{mode}: 저장된 본문이 로컬 본문과 다릅니다")
+
+    result = {
+        "edits": len(edits),
+        **summarize(latencies),
+        "request_bytes_per_edit": round(request_bytes / len(edits)),
+        "read_after_ms": round(read_ms, 3),
+    }
+    if written is not None:
+        result["wal_bytes_per_edit"] = round(written / len(edits))
+    if mode == "patch":
+        result["compactions"] = compactions
+    DailyNoteService.delete(db, user_id, NOTE_DATE)
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="일일 노트 전체 교체 vs 부분 수정 벤치마크")
+    parser.add_argument("--size-kb", type=int, default=1024, help="노트 크기 (KB, 글자 수 기준)")
+    parser.add_argument("--edits", type=int, default=200, help="방식별 편집(저장) 횟수")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    content = make_content(args.size_kb * 1024, rng)
+    edits = make_edits(content, args.edits, rng)
+
+    db = SessionLocal()
+    user = User(
+        email=f"bench-{uuid.uuid4().hex[:8]}@example.com",
+        username=f"bench-{uuid.uuid4().hex[:8]}",
+        hashed_password="!",
+    )
+    db.add(user)
+    db.commit()
+    user_id = user.id
+    try:
+        result = {
+            "dialect": db.get_bind().dialect.name,
+            "note_chars": len(content),
+            "note_bytes": len(content.encode()),
+            "compact_every": settings.DAILY_NOTE_COMPACT_PATCHES,
+            "replace": run(db, user_id, content, edits, "replace"),
+            "patch": run(db, user_id, content, edits, "patch"),
+        }
+        print(json.dumps(result, indent=2))
+    finally:
+        db.rollback()
+        db.query(DailyNote).filter(DailyNote.user_id == user_id).delete(synchronize_session=False)
+        db.query(User).filter(User.id == user_id).delete(synchronize_session=False)
+        db.commit()
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
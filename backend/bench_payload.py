@@ -0,0 +1,133 @@
+# backend/bench_payload.py
+"""
+태스크 목록 응답 크기 벤치마크 (필드 선택 / 압축)
+
+임시 유저에 설명(description)이 긴 태스크를 만들고 GET /api/tasks 를
+fields × Accept-Encoding 조합으로 호출해 비교합니다.
+
+- wire_bytes: 실제 전송 크기 (Content-Length, 압축 후)
+- json_bytes: 압축 전 JSON 크기
+- db_bytes:   해당 페이지에서 읽은 컬럼 값 크기
+              (PostgreSQL: pg_column_size 합, 그 외: 값 문자열 길이 합 - 근사치)
+
+끝나면 임시 유저와 태스크는 삭제됩니다.
+
+사용법:
+  python bench_payload.py                   # 태스크 500개, 페이지 100개
+  python bench_payload.py --limit 50 --description-size 4000
+"""
+import argparse
+import json
+import random
+import sys
+import time
+import uuid
+from typing import Dict, Optional
+
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+
+from app.core.database import SessionLocal
+from app.main import app
+from app.models import Task, TaskPriority, TaskStatus, User
+from app.services.task_service import ORDER_GAP, projection_columns
+
+FIELD_SETS = {
+    "all": None,
+    "board": "title,status,priority",
+}
+ENCODINGS = ["identity", "gzip", "br"]
+
+
+def seed(db, user_id: uuid.UUID, count: int, description_size: int) -> None:
+    rng = random.Random(7)
+    words = ["회의", "정리", "배포", "리뷰", "문서", "테스트", "버그", "일정", "공유", "확인"]
+    db.bulk_insert_mappings(
+        Task,
+        [
+            {
+                "id": uuid.uuid4(),
+                "user_id": user_id,
+                "title": f"{rng.choice(words)} {rng.choice(words)} {i}",
+                "description": " ".join(
+                    rng.choice(words) for _ in range(rng.randint(description_size // 8, description_size // 3))
+                ),
+                "status": rng.choice(list(TaskStatus)),
+                "priority": rng.choice(list(TaskPriority)),
+                "order": (i + 1) * ORDER_GAP,
+            }
+            for i in range(count)
+        ],
+    )
+    db.commit()
+
+
+def db_bytes(db, user_id: uuid.UUID, fields: Optional[str], limit: int) -> int:
+    """목록 페이지에서 읽는 컬럼 값 크기"""
+    columns = projection_columns(fields)
+    page = (
+        select(*columns)
+        .where(Task.user_id == user_id)
+        .order_by(Task.status, Task.order, Task.created_at, Task.id)
+        .limit(limit)
+        .subquery()
+    )
+    if db.get_bind().dialect.name == "postgresql":
+        size = sum(func.coalesce(func.pg_column_size(column), 0) for column in page.c)
+        return int(db.scalar(select(func.sum(size))) or 0)
+    return sum(
+        len(str(value).encode("utf-8"))
+        for row in db.execute(select(page))
+        for value in row
+        if value is not None
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="태스크 목록 응답 크기 벤치마크")
+    parser.add_argument("--tasks", type=int, default=500, help="시드할 태스크 수")
+    parser.add_argument("--limit", type=int, default=100, help="페이지 크기")
+    parser.add_argument("--description-size", type=int, default=2000, help="설명 최대 길이 (대략, 글자)")
+    args = parser.parse_args()
+
+    client = TestClient(app)
+    email = f"bench-{uuid.uuid4().hex[:8]}@example.com"
+    password = uuid.uuid4().hex
+    client.post("/api/auth/signup", json={"email": email, "username": email.split("@")[0], "password": password})
+    token = client.post("/api/auth/login", data={"username": email, "password": password}).json()["access_token"]
+
+    db = SessionLocal()
+    user = db.query(User).filter(User.email == email).one()
+    try:
+        seed(db, user.id, args.tasks, args.description_size)
+        result: Dict[str, dict] = {"dialect": db.get_bind().dialect.name, "tasks": args.tasks, "limit": args.limit}
+        for name, fields in FIELD_SETS.items():
+            params = {"limit": args.limit, **({"fields": fields} if fields else {})}
+            entry = {"fields": fields or "(all)", "db_bytes": db_bytes(db, user.id, fields, args.limit)}
+            for encoding in ENCODINGS:
+                start = time.perf_counter()
+                response = client.get(
+                    "/api/tasks",
+                    params=params,
+                    headers={"Authorization": f"Bearer {token}", "Accept-Encoding": encoding},
+                )
+                elapsed = (time.perf_counter() - start) * 1000
+                entry["json_bytes"] = len(response.content)
+                entry[encoding] = {
+                    "wire_bytes": int(response.headers["content-length"]),
+                    "content_encoding": response.headers.get("content-encoding", "identity"),
+                    "ms": round(elapsed, 3),
+                }
+            result[name] = entry
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+    finally:
+        db.rollback()
+        db.query(Task).filter(Task.user_id == user.id).delete(synchronize_session=False)
+        db.delete(user)
+        db.commit()
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
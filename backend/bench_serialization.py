@@ -0,0 +1,170 @@
+# backend/bench_serialization.py
+"""
+태스크 목록 직렬화 벤치마크
+
+임시 유저에 태스크를 만들고, 같은 페이지(기본 100개)를 세 방식으로 만들어 비교합니다.
+
+- stdlib:   ORM 객체 → Pydantic 검증 → jsonable_encoder → json.dumps (FastAPI 기본 JSONResponse)
+- pydantic: ORM 객체 → PaginatedResponse[TaskResponse] 검증 → model_dump_json (이전 목록 API)
+- orjson:   컬럼 튜플 → dict → orjson (현재 목록 API)
+
+쿼리 포함 / 직렬화만 각각의 지연(ms)을 JSON으로 출력하고, 세 결과가 같은 JSON인지 확인합니다.
+끝나면 임시 유저와 태스크는 삭제됩니다.
+
+사용법:
+  python bench_serialization.py                     # 태스크 1,000개, 페이지 100개, 200회
+  python bench_serialization.py --page 100 --rounds 500
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+import uuid
+from typing import Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+
+from app.core.database import SessionLocal
+from app.core.serializers import dumps, rows_to_dicts
+from app.models import Task, TaskPriority, TaskStatus, User
+from app.schemas.common import PaginatedResponse
+from app.schemas.task import TaskResponse
+from app.services.task_service import ORDER_GAP, TASK_RESPONSE_COLUMNS, TaskService
+
+
+def seed(db, user_id: uuid.UUID, count: int) -> None:
+    statuses = list(TaskStatus)
+    priorities = list(TaskPriority)
+    db.bulk_insert_mappings(
+        Task,
+        [
+            {
+                "id": uuid.uuid4(),
+                "user_id": user_id,
+                "title": f"벤치마크 태스크 {i}",
+                "description": "회의록 정리 및 후속 작업 공유 " * 8,
+                "status": statuses[i % len(statuses)],
+                "priority": priorities[i % len(priorities)],
+                "order": (i + 1) * ORDER_GAP,
+            }
+            for i in range(count)
+        ],
+    )
+    db.commit()
+
+
+def page_body(items: list, total: int, limit: int) -> dict:
+    return {
+        "items": items,
+        "total": total,
+        "skip": 0,
+        "limit": limit,
+        "has_more": total > limit,
+        "next_cursor": None,
+    }
+
+
+def stdlib_path(db, user_id, limit, total) -> bytes:
+    tasks = TaskService.get_multi(db, user_id, limit=limit)
+    model = PaginatedResponse[TaskResponse].create(items=tasks, total=total, skip=0, limit=limit)
+    return json.dumps(jsonable_encoder(model), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def pydantic_path(db, user_id, limit, total) -> bytes:
+    tasks = TaskService.get_multi(db, user_id, limit=limit)
+    return PaginatedResponse[TaskResponse].create(
+        items=tasks, total=total, skip=0, limit=limit
+    ).model_dump_json().encode("utf-8")
+
+
+def orjson_path(db, user_id, limit, total) -> bytes:
+    rows = TaskService.get_multi(db, user_id, limit=limit, columns=TASK_RESPONSE_COLUMNS)
+    return dumps(page_body(rows_to_dicts(rows), total, limit))
+
+
+def measure(db, fn: Callable, rounds: int, *args) -> List[float]:
+    latencies = []
+    for _ in range(rounds):
+        db.expunge_all()  # 요청마다 새 세션인 것처럼 (identity map 재사용 방지)
+        start = time.perf_counter()
+        fn(*args)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def _timed(fn: Callable) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "mean_ms": round(statistics.mean(ordered), 3),
+        "p50_ms": round(ordered[len(ordered) // 2], 3),
+        "p95_ms": round(ordered[int(len(ordered) * 0.95) - 1], 3),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="태스크 목록 직렬화 벤치마크")
+    parser.add_argument("--tasks", type=int, default=1_000, help="시드할 태스크 수")
+    parser.add_argument("--page", type=int, default=100, help="페이지 크기")
+    parser.add_argument("--rounds", type=int, default=200, help="방식별 반복 횟수")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    user = User(
+        email=f"bench-{uuid.uuid4().hex[:8]}@example.com",
+        username=f"bench-{uuid.uuid4().hex[:8]}",
+        hashed_password="!",
+    )
+    db.add(user)
+    db.commit()
+    try:
+        seed(db, user.id, args.tasks)
+        paths = {"stdlib": stdlib_path, "pydantic": pydantic_path, "orjson": orjson_path}
+
+        # 세 방식의 결과가 같은 JSON인지 확인
+        bodies = {name: json.loads(fn(db, user.id, args.page, args.tasks)) for name, fn in paths.items()}
+        same = all(body == bodies["pydantic"] for body in bodies.values())
+
+        result = {
+            "dialect": db.get_bind().dialect.name,
+            "tasks": args.tasks,
+            "page": args.page,
+            "identical_json": same,
+            "bytes": len(orjson_path(db, user.id, args.page, args.tasks)),
+        }
+        for name, fn in paths.items():
+            result[name] = summarize(measure(db, fn, args.rounds, db, user.id, args.page, args.tasks))
+
+        # 직렬화만 (쿼리 결과는 미리 준비)
+        tasks = TaskService.get_multi(db, user.id, limit=args.page)
+        rows = TaskService.get_multi(db, user.id, limit=args.page, columns=TASK_RESPONSE_COLUMNS)
+        encode_only = {
+            "stdlib": lambda: json.dumps(jsonable_encoder(
+                PaginatedResponse[TaskResponse].create(items=tasks, total=args.tasks, skip=0, limit=args.page)
+            )),
+            "pydantic": lambda: PaginatedResponse[TaskResponse].create(
+                items=tasks, total=args.tasks, skip=0, limit=args.page
+            ).model_dump_json(),
+            "orjson": lambda: dumps(page_body(rows_to_dicts(rows), args.tasks, args.page)),
+        }
+        result["encode_only"] = {
+            name: summarize([_timed(fn) for _ in range(args.rounds)]) for name, fn in encode_only.items()
+        }
+        print(json.dumps(result, indent=2))
+    finally:
+        db.rollback()
+        db.query(Task).filter(Task.user_id == user.id).delete(synchronize_session=False)
+        db.delete(user)
+        db.commit()
+        db.close()
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
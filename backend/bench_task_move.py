@@ -0,0 +1,168 @@
+# backend/bench_task_move.py
+"""
+태스크 이동(드래그 앤 드롭) 벤치마크
+
+임시 유저에 태스크 N개(기본 10,000)를 만들고, 같은 이동을 두 방식으로 비교합니다.
+
+- gap:      TaskService.move (이웃 사이 중간값 → 이동한 1행만 UPDATE)
+- renumber: 예전 방식 (중간에 끼워 넣을 때 뒤쪽 태스크 order를 모두 +1)
+
+각 방식의 지연(ms)과 이동 1회당 SQL 문 수 / 수정된 행 수를 JSON으로 출력합니다.
+끝나면 임시 유저와 태스크는 삭제됩니다.
+
+사용법:
+  python bench_task_move.py                 # 10,000개, 이동 200회
+  python bench_task_move.py --tasks 50000 --moves 500
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+import uuid
+from typing import Dict, List
+
+from sqlalchemy import event, select, update
+
+from app.core.database import SessionLocal
+from app.models import Task, TaskStatus, User
+from app.services.task_service import ORDER_GAP, TaskService
+
+
+def seed(db, user_id: uuid.UUID, count: int) -> List[uuid.UUID]:
+    """간격을 두고 태스크 count개 생성 → 위에서부터의 id 목록"""
+    ids = [uuid.uuid4() for _ in range(count)]
+    db.bulk_insert_mappings(
+        Task,
+        [
+            {
+                "id": task_id,
+                "user_id": user_id,
+                "title": f"bench {i}",
+                "status": TaskStatus.TODO,
+                "order": (i + 1) * ORDER_GAP,
+            }
+            for i, task_id in enumerate(ids)
+        ],
+    )
+    db.commit()
+    return ids
+
+
+class StatementCounter:
+    """엔진에서 실행된 SQL 문 수 / 영향받은 행 수 집계"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.active = False
+        self.statements = 0
+        self.rows = 0
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if not self.active:
+            return
+        self.statements += 1
+        if statement.lstrip().upper().startswith("UPDATE") and cursor.rowcount > 0:
+            self.rows += cursor.rowcount
+
+    def __enter__(self):
+        event.listen(self.engine, "after_cursor_execute", self._after_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "after_cursor_execute", self._after_execute)
+
+
+def renumber_move(db, task: Task, next_task: Task) -> None:
+    """예전 방식: next_task 자리에 끼워 넣고 그 아래를 전부 한 칸씩 밀기"""
+    target = next_task.order
+    db.execute(
+        update(Task)
+        .where(
+            Task.user_id == task.user_id,
+            Task.status == task.status,
+            Task.order >= target,
+            Task.id != task.id,
+        )
+        .values(order=Task.order + 1)
+    )
+    task.order = target
+    db.commit()
+
+
+def summarize(latencies: List[float], counter: StatementCounter, moves: int) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "moves": moves,
+        "mean_ms": round(statistics.mean(ordered), 3),
+        "p50_ms": round(ordered[len(ordered) // 2], 3),
+        "p95_ms": round(ordered[int(len(ordered) * 0.95) - 1], 3),
+        "max_ms": round(ordered[-1], 3),
+        "statements_per_move": round(counter.statements / moves, 2),
+        "rows_updated_per_move": round(counter.rows / moves, 2),
+    }
+
+
+def run(db, ids: List[uuid.UUID], moves: int, mode: str, rng: random.Random) -> Dict[str, float]:
+    user_id = db.get(Task, ids[0]).user_id
+    latencies: List[float] = []
+    with StatementCounter(db.get_bind()) as counter:
+        for _ in range(moves):
+            # 현재 순서 기준으로 태스크 하나를 임의의 두 이웃 사이로 이동
+            order = db.scalars(
+                select(Task.id).where(Task.user_id == user_id).order_by(Task.order, Task.id)
+            ).all()
+            src, dst = rng.sample(range(1, len(order) - 1), 2)
+            task_id, prev_id, next_id = order[src], order[dst - 1], order[dst]
+            if task_id in (prev_id, next_id):
+                continue
+            task = db.get(Task, task_id)
+            next_task = db.get(Task, next_id)
+            counter.active = True  # 준비용 조회는 측정에서 제외
+            start = time.perf_counter()
+            if mode == "gap":
+                TaskService.move(db, task, prev_id=prev_id, next_id=next_id)
+            else:
+                renumber_move(db, task, next_task)
+            latencies.append((time.perf_counter() - start) * 1000)
+            counter.active = False
+            db.expire_all()
+    return summarize(latencies, counter, len(latencies))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="태스크 이동 벤치마크")
+    parser.add_argument("--tasks", type=int, default=10_000, help="시드할 태스크 수")
+    parser.add_argument("--moves", type=int, default=200, help="방식별 이동 횟수")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    user = User(
+        email=f"bench-{uuid.uuid4().hex[:8]}@example.com",
+        username=f"bench-{uuid.uuid4().hex[:8]}",
+        hashed_password="!",
+    )
+    db.add(user)
+    db.commit()
+    try:
+        ids = seed(db, user.id, args.tasks)
+        result = {
+            "dialect": db.get_bind().dialect.name,
+            "tasks": args.tasks,
+            "gap": run(db, ids, args.moves, "gap", random.Random(args.seed)),
+            "renumber": run(db, ids, args.moves, "renumber", random.Random(args.seed)),
+        }
+        print(json.dumps(result, indent=2))
+    finally:
+        db.rollback()
+        db.query(Task).filter(Task.user_id == user.id).delete(synchronize_session=False)
+        db.delete(user)
+        db.commit()
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
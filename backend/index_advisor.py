@@ -0,0 +1,154 @@
+# backend/index_advisor.py
+"""
+인덱스 점검 도구
+
+TaskService / DailyNoteService 조회 메서드를 실제로 호출해서 나가는 SQL을 수집하고,
+각 쿼리에 EXPLAIN을 돌려 태스크/노트 테이블을 Sequential Scan 하는 쿼리를 보고합니다.
+
+- PostgreSQL: enable_seqscan = off 로 실행 → 그래도 Seq Scan이면 쓸 수 있는 인덱스가 없다는 뜻
+- SQLite: EXPLAIN QUERY PLAN 의 "SCAN <table>" 을 Seq Scan으로 간주
+
+사용법:
+  python index_advisor.py              # Seq Scan 발견 시 종료 코드 1 (CI에서 사용)
+  python index_advisor.py --verbose    # 모든 쿼리의 실행 계획 출력
+"""
+import argparse
+import json
+import sys
+import uuid
+from datetime import date, datetime, timezone
+from typing import List, Tuple
+
+from sqlalchemy import event, text
+
+from app.core.database import SessionLocal
+from app.core.pagination import encode_cursor
+from app.models import Task, TaskStatus, TaskPriority
+from app.services.archive_service import TaskArchiveService
+from app.services.daily_note_service import NOTE_SUMMARY_COLUMNS, DailyNoteService
+from app.services.project_service import ProjectService
+from app.services.task_service import TaskService
+
+# Seq Scan이 나오면 안 되는 테이블
+WATCHED_TABLES = {"tasks", "tasks_archive", "task_tombstones", "daily_notes", "projects"}
+
+
+def capture_task_queries(db) -> List[Tuple[str, str, object]]:
+    """TaskService 조회 메서드가 실행하는 (이름, SQL, 파라미터) 목록"""
+    user_id = uuid.uuid4()
+    cursor = TaskService.get_cursor(
+        Task(
+            id=uuid.uuid4(),
+            status=TaskStatus.TODO,
+            order=0,
+            created_at=datetime.now(timezone.utc),
+        )
+    )
+    since = encode_cursor([datetime.now(timezone.utc).isoformat(), str(uuid.uuid4())])
+    calls = [
+        ("get_by_id", lambda: TaskService.get_by_id(db, uuid.uuid4(), user_id)),
+        ("get_multi", lambda: TaskService.get_multi(db, user_id)),
+        ("get_multi(status)", lambda: TaskService.get_multi(db, user_id, status=TaskStatus.TODO)),
+        ("get_multi(priority)", lambda: TaskService.get_multi(db, user_id, priority=TaskPriority.HIGH)),
+        ("get_multi(search)", lambda: TaskService.get_multi(db, user_id, search="회의")),
+        ("get_multi(cursor)", lambda: TaskService.get_multi(db, user_id, cursor=cursor)),
+        ("get_multi(project)", lambda: TaskService.get_multi(db, user_id, project_id=uuid.uuid4())),
+        ("get_multi(include_archived)", lambda: TaskService.get_multi(db, user_id, include_archived=True)),
+        ("get_count", lambda: TaskService.get_count(db, user_id)),
+        ("get_count(include_archived)", lambda: TaskService.get_count(db, user_id, include_archived=True)),
+        ("get_today_tasks", lambda: TaskService.get_today_tasks(db, user_id)),
+        ("get_stats", lambda: TaskService.get_stats(db, user_id)),
+        ("get_stats(project)", lambda: TaskService.get_stats(db, user_id, project_id=uuid.uuid4())),
+        ("get_changes", lambda: TaskService.get_changes(db, user_id, since=since)),
+        ("notes.get_by_date", lambda: DailyNoteService.get_by_date(db, user_id, date(2026, 10, 1))),
+        ("notes.get_range", lambda: DailyNoteService.get_range(db, user_id, date(2026, 10, 1), date(2026, 10, 31))),
+        ("notes.get_range(summary)", lambda: DailyNoteService.get_range(
+            db, user_id, date(2026, 10, 1), date(2026, 10, 31), columns=NOTE_SUMMARY_COLUMNS
+        )),
+        ("projects.get_multi", lambda: ProjectService.get_multi(db, user_id)),
+        ("projects.repair_counts", lambda: ProjectService.repair_counts(db, user_id=user_id, dry_run=True)),
+        ("archive.get_by_id", lambda: TaskArchiveService.get_by_id(db, uuid.uuid4(), user_id)),
+        ("archive.archive_batch", lambda: TaskArchiveService.archive_batch(db, dry_run=True)),
+        ("purge_deleted", lambda: TaskService.purge_deleted(db, dry_run=True)),
+        ("purge_tombstones", lambda: TaskService.purge_tombstones(db, dry_run=True)),
+    ]
+
+    captured = []
+    current = {"name": None}
+
+    def _before_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((current["name"], statement, parameters))
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", _before_execute)
+    try:
+        for name, call in calls:
+            current["name"] = name
+            call()
+    finally:
+        event.remove(engine, "before_cursor_execute", _before_execute)
+        db.rollback()
+    return captured
+
+
+def _walk_pg_plan(node: dict, found: List[str]) -> None:
+    if node.get("Node Type") == "Seq Scan" and node.get("Relation Name") in WATCHED_TABLES:
+        found.append(node["Relation Name"])
+    for child in node.get("Plans", []):
+        _walk_pg_plan(child, found)
+
+
+def explain(db, statement: str, parameters) -> Tuple[List[str], str]:
+    """(Seq Scan 테이블 목록, 사람이 읽을 실행 계획)"""
+    conn = db.connection()
+    if conn.dialect.name == "postgresql":
+        conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        row = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar()
+        plan = row if isinstance(row, list) else json.loads(row)
+        found: List[str] = []
+        _walk_pg_plan(plan[0]["Plan"], found)
+        return found, json.dumps(plan[0]["Plan"], indent=2)
+
+    rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    details = [row[-1] for row in rows]
+    found = [
+        table
+        for detail in details
+        for table in WATCHED_TABLES
+        if detail.startswith(f"SCAN {table}") and "USING" not in detail
+    ]
+    return found, "\n".join(details)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="TaskService 쿼리 인덱스 점검")
+    parser.add_argument("--verbose", action="store_true", help="모든 실행 계획 출력")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    problems = 0
+    try:
+        for name, statement, parameters in capture_task_queries(db):
+            found, plan = explain(db, statement, parameters)
+            if found:
+                problems += 1
+                print(f"❌ {name}: Seq Scan on {', '.join(sorted(set(found)))}")
+            else:
+                print(f"✅ {name}")
+            if found or args.verbose:
+                print(f"   {statement}")
+                print("   " + plan.replace("\n", "\n   "))
+            db.rollback()
+    finally:
+        db.close()
+
+    if problems:
+        print(f"\n⚠️  Seq Scan 쿼리 {problems}개 - 인덱스를 확인하세요 (alembic upgrade head)")
+        return 1
+    print("\n✅ 모든 쿼리가 인덱스를 사용합니다")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
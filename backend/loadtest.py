@@ -0,0 +1,467 @@
+# backend/loadtest.py
+"""
+부하 테스트 / 벤치마크 도구
+
+1) seed: 유저 N명 × 태스크 M개 + 일일 노트를 다건 INSERT로 빠르게 생성
+2) run:  여러 유저로 로그인해서 혼합 워크로드를 동시에 실행하고
+         엔드포인트별 처리량 / 지연 백분위(p50, p90, p95, p99)를 JSON으로 출력
+
+DATABASE_URL 만 바꾸면 SQLite / 로컬 PostgreSQL 모두에서 동작합니다.
+빈 DB 라면 seed 에 --create-schema 를 붙이세요 (alembic 리비전은 테이블이 이미 있다는 전제).
+
+사용법:
+  python loadtest.py seed --users 50 --tasks 200 --notes 30 --reset
+  python loadtest.py seed --create-schema --users 10                 # 빈 DB (예: 새 SQLite 파일)
+  python loadtest.py run --spawn --concurrency 20 --duration 30      # 로컬 서버 띄워서 측정
+  python loadtest.py run --base-url http://127.0.0.1:8000 --output baseline.json
+  python loadtest.py run --mix list=50,today=20,stats=10,create=5,status=10,search=5
+
+워크로드 (--mix, 가중치):
+  list   GET  /api/tasks?limit=20
+  today  GET  /api/tasks/today
+  stats  GET  /api/tasks/stats
+  create POST /api/tasks
+  status PATCH /api/tasks/{id}/status
+  search GET  /api/tasks?search=...
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+LOAD_EMAIL_DOMAIN = "loadtest.local"
+LOAD_PASSWORD = "loadtest1234"
+WORDS = ["회의", "정리", "배포", "리뷰", "문서", "테스트", "버그", "일정", "공유", "확인", "report", "deploy"]
+DEFAULT_MIX = "list=40,today=15,stats=10,create=10,status=15,search=10"
+CHUNK_SIZE = 5000
+# (이전 리비전, 검색 컬럼 리비전) - create_all 로 만든 스키마에 이것만 추가 적용
+SEARCH_VECTOR_REVISION = ("3f9c1a7d2b10", "8b2e4c6a1d37")
+
+
+# ---------------------------------------------------------------------------
+# seed
+# ---------------------------------------------------------------------------
+
+def _chunks(rows: List[dict], size: int = CHUNK_SIZE):
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def _alembic(*command: str) -> None:
+    # alembic/env.py 가 app 모듈을 바꿔 끼우므로 별도 프로세스로 실행
+    subprocess.run(
+        [sys.executable, "-m", "alembic", *command],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        check=True,
+    )
+
+
+def create_schema(db) -> str:
+    """
+    빈 DB에 스키마 생성
+    - alembic_version 이 없으면: 모델로 테이블 생성 → 모델에 없는 객체만 리비전으로 → head 로 stamp
+      (첫 리비전이 인덱스만 추가하므로 빈 DB에 upgrade 만 하면 실패)
+    - 있으면: upgrade head
+    """
+    from sqlalchemy import inspect
+
+    from app.models import Base
+
+    bind = db.get_bind()
+    if inspect(bind).has_table("alembic_version"):
+        _alembic("upgrade", "head")
+        return "upgrade head"
+    Base.metadata.create_all(bind)
+    # tasks.search_vector + GIN (PostgreSQL 전용, 모델에 없음) - IF NOT EXISTS 라 다시 적용해도 안전
+    _alembic("stamp", SEARCH_VECTOR_REVISION[0])
+    _alembic("upgrade", SEARCH_VECTOR_REVISION[1])
+    _alembic("stamp", "head")
+    return "create_all + stamp head"
+
+
+def reset(db) -> int:
+    """이전에 만든 부하 테스트 유저와 데이터 삭제 (참조하는 쪽부터)"""
+    from sqlalchemy import delete, select
+
+    from app.models import DailyNote, DailyNotePatch, Project, Task, TaskArchive, TaskTombstone, User
+
+    user_ids = select(User.id).where(User.email.like(f"%@{LOAD_EMAIL_DOMAIN}"))
+    note_ids = select(DailyNote.id).where(DailyNote.user_id.in_(user_ids))
+    db.execute(delete(DailyNotePatch).where(DailyNotePatch.note_id.in_(note_ids)))
+    for model in (Task, TaskArchive, TaskTombstone, DailyNote, Project):
+        db.execute(delete(model).where(model.user_id.in_(user_ids)))
+    deleted = db.execute(delete(User).where(User.email.like(f"%@{LOAD_EMAIL_DOMAIN}"))).rowcount
+    db.commit()
+    return deleted
+
+
+def seed(db, users: int, tasks: int, notes: int, rng: random.Random) -> Dict[str, float]:
+    """유저 × 태스크 × 노트 생성 (테이블마다 CHUNK_SIZE 단위 다건 INSERT)"""
+    from sqlalchemy import func, insert, select
+
+    from app.core.security import get_password_hash
+    from app.models import DailyNote, Task, TaskPriority, TaskStatus, User
+    from app.services.task_service import ORDER_GAP
+
+    start = time.perf_counter()
+    hashed = get_password_hash(LOAD_PASSWORD)  # 모든 유저가 같은 해시 (bcrypt 1번)
+    offset = db.scalar(
+        select(func.count(User.id)).where(User.email.like(f"%@{LOAD_EMAIL_DOMAIN}"))
+    )
+
+    user_rows = []
+    for i in range(offset, offset + users):
+        user_rows.append({
+            "id": uuid.uuid4(),
+            "email": f"load{i}@{LOAD_EMAIL_DOMAIN}",
+            "username": f"load{i}",
+            "hashed_password": hashed,
+            "is_active": True,
+        })
+    db.execute(insert(User), user_rows)
+
+    now = datetime.now(timezone.utc)
+    statuses = [TaskStatus.TODO] * 5 + [TaskStatus.DOING] * 2 + [TaskStatus.DONE] * 3
+    task_rows = []
+    for user in user_rows:
+        orders = defaultdict(int)
+        for i in range(tasks):
+            status = rng.choice(statuses)
+            orders[status] += ORDER_GAP
+            due_days = rng.choice([None, None, -3, -1, 0, 0, 1, 7, 30])
+            task_rows.append({
+                "id": uuid.uuid4(),
+                "user_id": user["id"],
+                "title": f"{rng.choice(WORDS)} {rng.choice(WORDS)} #{i}",
+                "description": " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 40))) or None,
+                "status": status,
+                "priority": rng.choice(list(TaskPriority)),
+                "due_date": now + timedelta(days=due_days) if due_days is not None else None,
+                "completed_at": now if status == TaskStatus.DONE else None,
+                "order": orders[status],
+                "created_at": now - timedelta(minutes=tasks - i),
+                "updated_at": now - timedelta(minutes=tasks - i),
+            })
+    for chunk in _chunks(task_rows):
+        db.execute(insert(Task), chunk)
+
+    today = date.today()
+    note_rows = [
+        {
+            "id": uuid.uuid4(),
+            "user_id": user["id"],
+            "date": today - timedelta(days=day),
+            "content": "\n".join(f"- {rng.choice(WORDS)} {rng.choice(WORDS)}" for _ in range(rng.randint(3, 20))),
+            "mood": rng.choice(["great", "good", "okay", "bad"]),
+        }
+        for user in user_rows
+        for day in range(notes)
+    ]
+    for chunk in _chunks(note_rows):
+        db.execute(insert(DailyNote), chunk)
+
+    db.commit()
+    elapsed = time.perf_counter() - start
+    return {
+        "users": len(user_rows),
+        "tasks": len(task_rows),
+        "notes": len(note_rows),
+        "seconds": round(elapsed, 2),
+        "rows_per_second": round((len(user_rows) + len(task_rows) + len(note_rows)) / elapsed),
+    }
+
+
+def cmd_seed(args) -> int:
+    from app.core.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        result = {"dialect": db.get_bind().dialect.name}
+        if args.create_schema:
+            result["schema"] = create_schema(db)
+        if args.reset:
+            result["reset_users"] = reset(db)
+        result.update(seed(db, args.users, args.tasks, args.notes, random.Random(args.seed)))
+    finally:
+        db.close()
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# run
+# ---------------------------------------------------------------------------
+
+def parse_mix(mix: str) -> Dict[str, int]:
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in OPERATIONS:
+            raise SystemExit(f"알 수 없는 작업: {name} (사용 가능: {', '.join(OPERATIONS)})")
+        weights[name.strip()] = int(weight or 1)
+    return weights
+
+
+class Recorder:
+    """엔드포인트별 지연 / 상태 코드 수집"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.recording = False
+
+    def add(self, name: str, elapsed_ms: float, status_code: Optional[int], error: Optional[str] = None) -> None:
+        if not self.recording:
+            return
+        self.latencies[name].append(elapsed_ms)
+        if error or (status_code is not None and status_code >= 400):
+            self.errors[name][error or str(status_code)] += 1
+
+    def report(self, duration: float) -> Dict[str, dict]:
+        endpoints = {}
+        for name, values in sorted(self.latencies.items()):
+            endpoints[name] = {
+                "requests": len(values),
+                "errors": dict(self.errors.get(name, {})),
+                "rps": round(len(values) / duration, 2),
+                **percentiles(values),
+            }
+        total = sum(len(values) for values in self.latencies.values())
+        all_values = [value for values in self.latencies.values() for value in values]
+        return {
+            "requests": total,
+            "errors": sum(sum(errors.values()) for errors in self.errors.values()),
+            "rps": round(total / duration, 2),
+            "latency": percentiles(all_values),
+            "endpoints": endpoints,
+        }
+
+
+def percentiles(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def rank(p: float) -> float:
+        return round(ordered[min(len(ordered) - 1, max(0, int(round(p * len(ordered))) - 1))], 3)
+
+    return {
+        "mean_ms": round(statistics.mean(ordered), 3),
+        "p50_ms": rank(0.50),
+        "p90_ms": rank(0.90),
+        "p95_ms": rank(0.95),
+        "p99_ms": rank(0.99),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+
+class VirtualUser:
+    """로그인한 유저 1명 (토큰 + 본인 태스크 id 일부)"""
+
+    def __init__(self, email: str, token: str, task_ids: List[str]):
+        self.email = email
+        self.headers = {"Authorization": f"Bearer {token}"}
+        self.task_ids = task_ids
+
+
+async def op_list(client, user: VirtualUser, rng: random.Random):
+    return await client.get("/api/tasks", params={"limit": 20}, headers=user.headers)
+
+
+async def op_today(client, user: VirtualUser, rng: random.Random):
+    return await client.get("/api/tasks/today", headers=user.headers)
+
+
+async def op_stats(client, user: VirtualUser, rng: random.Random):
+    return await client.get("/api/tasks/stats", headers=user.headers)
+
+
+async def op_create(client, user: VirtualUser, rng: random.Random):
+    response = await client.post(
+        "/api/tasks",
+        json={"title": f"load {rng.choice(WORDS)}", "priority": rng.choice(["high", "medium", "low"])},
+        headers=user.headers,
+    )
+    if response.status_code == 201:
+        user.task_ids.append(response.json()["id"])
+    return response
+
+
+async def op_status(client, user: VirtualUser, rng: random.Random):
+    if not user.task_ids:
+        return await op_create(client, user, rng)
+    return await client.patch(
+        f"/api/tasks/{rng.choice(user.task_ids)}/status",
+        params={"status": rng.choice(["todo", "doing", "done"])},
+        headers=user.headers,
+    )
+
+
+async def op_search(client, user: VirtualUser, rng: random.Random):
+    return await client.get("/api/tasks", params={"search": rng.choice(WORDS), "limit": 20}, headers=user.headers)
+
+
+OPERATIONS = {
+    "list": op_list,
+    "today": op_today,
+    "stats": op_stats,
+    "create": op_create,
+    "status": op_status,
+    "search": op_search,
+}
+
+
+async def login_users(client, count: int, concurrency: int) -> List[VirtualUser]:
+    """부하 테스트 유저 로그인 (bcrypt 때문에 느림 → 측정 전에 미리)"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def login(i: int) -> Optional[VirtualUser]:
+        email = f"load{i}@{LOAD_EMAIL_DOMAIN}"
+        async with semaphore:
+            response = await client.post("/api/auth/login", data={"username": email, "password": LOAD_PASSWORD})
+            if response.status_code != 200:
+                return None
+            token = response.json()["access_token"]
+            tasks = await client.get(
+                "/api/tasks",
+                params={"limit": 100, "fields": "id"},
+                headers={"Authorization": f"Bearer {token}"},
+            )
+            task_ids = [task["id"] for task in tasks.json()["items"]] if tasks.status_code == 200 else []
+            return VirtualUser(email, token, task_ids)
+
+    users = await asyncio.gather(*(login(i) for i in range(count)))
+    return [user for user in users if user is not None]
+
+
+async def run_workload(args) -> Dict[str, dict]:
+    import httpx
+
+    weights = parse_mix(args.mix)
+    names, cumulative = list(weights), list(weights.values())
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        users = await login_users(client, args.users, min(args.concurrency, 8))
+        if not users:
+            raise SystemExit("로그인한 유저가 없습니다. 먼저 `python loadtest.py seed` 를 실행하세요.")
+
+        recorder = Recorder()
+        stop_at = time.monotonic() + args.warmup + args.duration
+
+        async def worker(worker_id: int) -> None:
+            rng = random.Random(args.seed + worker_id)
+            while time.monotonic() < stop_at:
+                user = rng.choice(users)
+                name = rng.choices(names, weights=cumulative)[0]
+                start = time.perf_counter()
+                try:
+                    response = await OPERATIONS[name](client, user, rng)
+                    recorder.add(name, (time.perf_counter() - start) * 1000, response.status_code)
+                except httpx.HTTPError as e:
+                    recorder.add(name, (time.perf_counter() - start) * 1000, None, type(e).__name__)
+
+        async def start_recording() -> None:
+            await asyncio.sleep(args.warmup)
+            recorder.recording = True
+
+        started = time.monotonic()
+        await asyncio.gather(start_recording(), *(worker(i) for i in range(args.concurrency)))
+        measured = time.monotonic() - started - args.warmup
+
+    return {
+        "base_url": args.base_url,
+        "users": len(users),
+        "concurrency": args.concurrency,
+        "duration_seconds": round(measured, 2),
+        "mix": weights,
+        **recorder.report(measured),
+    }
+
+
+def spawn_server(port: int, workers: int) -> subprocess.Popen:
+    """로컬 uvicorn 서버 실행 (현재 환경 변수 / .env 의 DATABASE_URL 사용)"""
+    import httpx
+
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(workers), "--log-level", "warning",
+        ],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env={**os.environ, "DEBUG": "False"},
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1.0).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    process.terminate()
+    raise SystemExit("서버가 30초 안에 뜨지 않았습니다")
+
+
+def cmd_run(args) -> int:
+    server = None
+    if args.spawn:
+        server = spawn_server(args.port, args.workers)
+        args.base_url = f"http://127.0.0.1:{args.port}"
+    try:
+        result = asyncio.run(run_workload(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    output = json.dumps(result, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    print(output)
+    return 1 if result["errors"] else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="WorkLog 부하 테스트")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    seed_parser = sub.add_parser("seed", help="부하 테스트 데이터 생성")
+    seed_parser.add_argument("--users", type=int, default=50, help="유저 수")
+    seed_parser.add_argument("--tasks", type=int, default=200, help="유저당 태스크 수")
+    seed_parser.add_argument("--notes", type=int, default=30, help="유저당 일일 노트 수 (오늘부터 과거로)")
+    seed_parser.add_argument("--reset", action="store_true", help="기존 부하 테스트 데이터 삭제 후 생성")
+    seed_parser.add_argument("--create-schema", action="store_true", help="빈 DB면 테이블 생성 + alembic stamp head")
+    seed_parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    seed_parser.set_defaults(func=cmd_seed)
+
+    run_parser = sub.add_parser("run", help="혼합 워크로드 실행")
+    run_parser.add_argument("--base-url", default="http://127.0.0.1:8000", help="대상 서버")
+    run_parser.add_argument("--spawn", action="store_true", help="로컬 uvicorn 서버를 띄워서 측정")
+    run_parser.add_argument("--port", type=int, default=8765, help="--spawn 시 포트")
+    run_parser.add_argument("--workers", type=int, default=1, help="--spawn 시 uvicorn 워커 수")
+    run_parser.add_argument("--users", type=int, default=50, help="로그인할 유저 수 (seed 한 수 이하)")
+    run_parser.add_argument("--concurrency", type=int, default=20, help="동시 요청 수")
+    run_parser.add_argument("--duration", type=float, default=30.0, help="측정 시간 (초)")
+    run_parser.add_argument("--warmup", type=float, default=3.0, help="측정 전 워밍업 (초)")
+    run_parser.add_argument("--mix", default=DEFAULT_MIX, help="작업별 가중치")
+    run_parser.add_argument("--timeout", type=float, default=30.0, help="요청 타임아웃 (초)")
+    run_parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    run_parser.add_argument("--output", help="결과 JSON 저장 경로")
+    run_parser.set_defaults(func=cmd_run)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
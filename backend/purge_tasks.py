@@ -0,0 +1,82 @@
+# backend/purge_tasks.py
+"""
+삭제된 태스크 완전 삭제 (Soft Delete 정리)
+
+삭제 후 --older-than-days (기본 TASK_PURGE_AFTER_DAYS) 가 지나 더 이상 복구할 수 없는
+태스크와, 보관 기간(SYNC_TOMBSTONE_RETENTION_DAYS)이 지난 삭제 기록을 배치로 지웁니다.
+사용자의 삭제 요청은 deleted_at UPDATE 1번으로 끝나고, 실제 행 삭제는 여기서 몰아서 합니다.
+
+- 배치 1번 = 트랜잭션 1번 (--batch-size 개), 배치 사이 --sleep 초 쉬기
+  → 한 번에 많은 행을 지워 생기는 잠금 / WAL / VACUUM 부하를 나눔
+- PostgreSQL은 수정 중인 행을 건너뛰고(SKIP LOCKED) 다음 실행 때 삭제
+- 트래픽이 적은 시간에 cron 으로 실행 (예: 매일 새벽),
+  --max-seconds 로 그 시간대 안에서 멈추게 할 수 있음. 결과는 JSON으로 출력
+
+사용법:
+  python purge_tasks.py                               # 기본 설정으로 전부
+  python purge_tasks.py --dry-run                     # 대상 수만 (첫 배치)
+  python purge_tasks.py --older-than-days 3 --batch-size 500 --sleep 0.5 --max-seconds 1800
+"""
+import argparse
+import json
+import sys
+import time
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.services.task_service import TaskService
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="삭제된 태스크 / 오래된 삭제 기록 완전 삭제")
+    parser.add_argument(
+        "--older-than-days", type=int, default=settings.TASK_PURGE_AFTER_DAYS,
+        help="삭제 후 이 일수가 지난 태스크를 완전 삭제",
+    )
+    parser.add_argument("--batch-size", type=int, default=settings.TASK_PURGE_BATCH_SIZE, help="배치당 행 수")
+    parser.add_argument("--sleep", type=float, default=0.2, help="배치 사이 대기 (초)")
+    parser.add_argument("--max-seconds", type=float, default=0, help="이 시간(초)이 지나면 멈춤 (0이면 끝까지)")
+    parser.add_argument("--dry-run", action="store_true", help="지우지 않고 첫 배치 대상 수만 출력")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    start = time.perf_counter()
+    totals = {"tasks": 0, "tombstones": 0}
+    batches = 0
+    stopped = False
+    # 태스크 먼저, 다음 삭제 기록 - 둘 다 배치가 덜 차면 끝
+    steps = [
+        ("tasks", lambda: TaskService.purge_deleted(
+            db, older_than_days=args.older_than_days, limit=args.batch_size, dry_run=args.dry_run
+        )),
+        ("tombstones", lambda: TaskService.purge_tombstones(db, limit=args.batch_size, dry_run=args.dry_run)),
+    ]
+    try:
+        for key, purge in steps:
+            while not stopped:
+                purged = purge()
+                batches += 1
+                totals[key] += purged
+                if args.dry_run or purged < args.batch_size:
+                    break
+                if args.max_seconds and time.perf_counter() - start >= args.max_seconds:
+                    stopped = True
+                    break
+                if args.sleep:
+                    time.sleep(args.sleep)
+    finally:
+        db.close()
+
+    print(json.dumps({
+        "dry_run": args.dry_run,
+        "older_than_days": args.older_than_days,
+        "batches": batches,
+        "purged": totals,
+        "stopped_early": stopped,
+        "elapsed_s": round(time.perf_counter() - start, 3),
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
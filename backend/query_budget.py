@@ -0,0 +1,193 @@
+# backend/query_budget.py
+"""
+API별 SQL 쿼리 수 점검 (N+1 회귀 방지)
+
+임시 유저에 태스크를 만들고 주요 API를 호출해서, 응답의 Server-Timing 헤더
+(db;desc="N queries")로 요청당 쿼리 수를 확인합니다.
+
+- 각 API의 쿼리 수가 BUDGETS 상한을 넘으면 실패
+- 목록 API는 페이지 크기(5개 / 100개)를 바꿔도 쿼리 수가 같아야 함 (행마다 쿼리 → N+1)
+- 응답 캐시/인증 캐시는 끄고 측정 (캐시 미스일 때의 쿼리 수)
+
+끝나면 임시 유저와 태스크는 삭제됩니다.
+
+사용법:
+  python query_budget.py              # 상한 초과 시 종료 코드 1 (CI에서 사용)
+  python query_budget.py --verbose    # 각 요청에서 실행된 SQL 출력
+"""
+import argparse
+import re
+import sys
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.query_stats import count_queries
+from app.main import app
+from app.models import DailyNote, DailyNotePatch, Project, Task, TaskArchive, TaskTombstone, User
+
+# API별 최대 쿼리 수 (인증 시 유저 조회 1개 포함)
+BUDGETS: Dict[str, int] = {
+    "GET /api/auth/me": 1,
+    "GET /api/tasks": 3,
+    "GET /api/tasks?search": 3,
+    "GET /api/tasks?cursor": 2,  # 커서 모드는 COUNT 없음
+    "GET /api/tasks/today": 2,
+    "GET /api/tasks/stats": 2,
+    "GET /api/tasks/changes": 4,
+    "GET /api/tasks/{id}": 2,
+    "POST /api/tasks": 4,
+    "PUT /api/tasks/{id}": 4,
+    "PATCH /api/tasks/{id}/status": 4,
+    "POST /api/tasks/{id}/move": 5,
+    "POST /api/tasks/{id}/complete": 4,
+    "POST /api/tasks/bulk": 6,
+    "DELETE /api/tasks/{id}": 3,
+    "POST /api/tasks/{id}/restore": 3,
+    "GET /api/projects": 2,
+    "POST /api/tasks (프로젝트)": 5,
+    "PATCH /api/tasks/{id}/status (프로젝트)": 5,
+    "DELETE /api/tasks/{id} (프로젝트)": 4,
+    "PUT /api/daily-notes/{date}": 2,
+    "GET /api/daily-notes?month": 2,
+    "PATCH /api/daily-notes/{date}": 4,
+    "GET /api/daily-notes/{date} (패치 적용)": 3,
+}
+
+_SERVER_TIMING = re.compile(r'db;dur=[\d.]+;desc="(\d+) queries"')
+
+
+def query_count(response) -> int:
+    """응답의 Server-Timing 헤더에서 쿼리 수"""
+    match = _SERVER_TIMING.search(response.headers.get("server-timing", ""))
+    if match is None:
+        raise RuntimeError("Server-Timing 헤더가 없습니다 (SERVER_TIMING_ENABLED=True 필요)")
+    return int(match.group(1))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="API별 SQL 쿼리 수 점검")
+    parser.add_argument("--tasks", type=int, default=120, help="시드할 태스크 수")
+    parser.add_argument("--verbose", action="store_true", help="요청별 실행 SQL 출력")
+    args = parser.parse_args()
+
+    settings.CACHE_ENABLED = False
+    settings.AUTH_CACHE_ENABLED = False
+
+    # with 블록: 요청마다 이벤트 루프를 새로 만들지 않음 (DB_ASYNC=True 의 asyncpg 풀은 루프에 묶임)
+    with TestClient(app) as client:
+        return check(client, args)
+
+
+def check(client: TestClient, args) -> int:
+    email = f"budget-{uuid.uuid4().hex[:8]}@example.com"
+    password = uuid.uuid4().hex
+    client.post("/api/auth/signup", json={"email": email, "username": email.split("@")[0], "password": password})
+    token = client.post("/api/auth/login", data={"username": email, "password": password}).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    results: List[Tuple[str, int, Optional[int]]] = []
+
+    def call(name: str, method: str, url: str, budget_key: Optional[str] = None, **kwargs):
+        with count_queries() as stats:
+            response = client.request(method, url, headers=headers, **kwargs)
+        if response.status_code >= 400:
+            raise RuntimeError(f"{name}: {response.status_code} {response.text}")
+        count = query_count(response)
+        results.append((name, count, BUDGETS.get(budget_key or name)))
+        if args.verbose:
+            print(f"{name}: {count} queries")
+            for statement in stats.statements or []:
+                print("   " + " ".join(statement.split())[:200])
+        return response, count
+
+    try:
+        for i in range(args.tasks):
+            client.post("/api/tasks", json={"title": f"쿼리 점검 {i}", "description": "회의록 정리"}, headers=headers)
+        task_ids = [item["id"] for item in client.get("/api/tasks", params={"limit": 3, "fields": "id"}, headers=headers).json()["items"]]
+
+        call("GET /api/auth/me", "GET", "/api/auth/me")
+        first_page, small = call("GET /api/tasks (limit=5)", "GET", "/api/tasks", "GET /api/tasks", params={"limit": 5})
+        _, large = call("GET /api/tasks (limit=100)", "GET", "/api/tasks", "GET /api/tasks", params={"limit": 100})
+        call("GET /api/tasks?cursor", "GET", "/api/tasks", params={"cursor": first_page.json()["next_cursor"], "limit": 5})
+        call("GET /api/tasks?search", "GET", "/api/tasks", params={"search": "회의", "limit": 100})
+        call("GET /api/tasks/today", "GET", "/api/tasks/today")
+        call("GET /api/tasks/stats", "GET", "/api/tasks/stats")
+        call("GET /api/tasks/changes", "GET", "/api/tasks/changes")
+        call("GET /api/tasks/{id}", "GET", f"/api/tasks/{task_ids[0]}")
+        call("POST /api/tasks", "POST", "/api/tasks", json={"title": "쿼리 점검 생성"})
+        call("PUT /api/tasks/{id}", "PUT", f"/api/tasks/{task_ids[0]}", json={"title": "쿼리 점검 수정"})
+        call("PATCH /api/tasks/{id}/status", "PATCH", f"/api/tasks/{task_ids[0]}/status", params={"status": "done"})
+        call("POST /api/tasks/{id}/move", "POST", f"/api/tasks/{task_ids[1]}/move", json={"next_id": task_ids[2]})
+        call("POST /api/tasks/{id}/complete", "POST", f"/api/tasks/{task_ids[1]}/complete")
+        call(
+            "POST /api/tasks/bulk", "POST", "/api/tasks/bulk",
+            json={"operations": [
+                {"op": "create", "task": {"title": "일괄 생성"}},
+                {"op": "complete", "id": task_ids[2]},
+                {"op": "update", "id": task_ids[1], "changes": {"title": "일괄 수정"}},
+            ]},
+        )
+        call("DELETE /api/tasks/{id}", "DELETE", f"/api/tasks/{task_ids[2]}")
+        call("POST /api/tasks/{id}/restore", "POST", f"/api/tasks/{task_ids[2]}/restore")
+        # 프로젝트 태스크 - 쓰기마다 프로젝트 개수 UPDATE 1번 추가
+        project_id = client.post("/api/projects", json={"name": "쿼리 점검"}, headers=headers).json()["id"]
+        response, _ = call(
+            "POST /api/tasks (프로젝트)", "POST", "/api/tasks", json={"title": "프로젝트 태스크", "project_id": project_id}
+        )
+        project_task_id = response.json()["id"]
+        call(
+            "PATCH /api/tasks/{id}/status (프로젝트)", "PATCH", f"/api/tasks/{project_task_id}/status",
+            params={"status": "done"},
+        )
+        call("GET /api/projects", "GET", "/api/projects")
+        call("DELETE /api/tasks/{id} (프로젝트)", "DELETE", f"/api/tasks/{project_task_id}")
+        for day in range(1, 28):
+            client.put(f"/api/daily-notes/2026-02-{day:02d}", json={"content": "노트", "mood": "good"}, headers=headers)
+        call("PUT /api/daily-notes/{date}", "PUT", "/api/daily-notes/2026-02-28", json={"mood": "great"})
+        call("GET /api/daily-notes?month", "GET", "/api/daily-notes", params={"month": "2026-02"})
+        call(
+            "PATCH /api/daily-notes/{date}", "PATCH", "/api/daily-notes/2026-02-27",
+            json={"base_revision": 0, "ops": [{"pos": 2, "insert": " 추가"}]},
+        )
+        call("GET /api/daily-notes/{date} (패치 적용)", "GET", "/api/daily-notes/2026-02-27")
+    finally:
+        db = SessionLocal()
+        user = db.query(User).filter(User.email == email).one()
+        # SQLite는 FK CASCADE를 강제하지 않음 → 패치도 직접
+        note_ids = db.query(DailyNote.id).filter(DailyNote.user_id == user.id)
+        db.query(DailyNotePatch).filter(DailyNotePatch.note_id.in_(note_ids.scalar_subquery())).delete(
+            synchronize_session=False
+        )
+        db.query(TaskTombstone).filter(TaskTombstone.user_id == user.id).delete(synchronize_session=False)
+        db.query(Task).filter(Task.user_id == user.id).delete(synchronize_session=False)
+        db.query(TaskArchive).filter(TaskArchive.user_id == user.id).delete(synchronize_session=False)
+        db.query(DailyNote).filter(DailyNote.user_id == user.id).delete(synchronize_session=False)
+        db.query(Project).filter(Project.user_id == user.id).delete(synchronize_session=False)
+        db.delete(user)
+        db.commit()
+        db.close()
+
+    problems = 0
+    for name, count, budget in results:
+        if budget is not None and count > budget:
+            problems += 1
+            print(f"❌ {name}: {count}개 (최대 {budget}개)")
+        else:
+            print(f"✅ {name}: {count}개" + (f" / {budget}" if budget is not None else ""))
+    if large != small:
+        problems += 1
+        print(f"❌ GET /api/tasks: 페이지 크기에 따라 쿼리 수가 늘어남 ({small} → {large}) - N+1 의심")
+
+    if problems:
+        print(f"\n⚠️  쿼리 수 초과 {problems}건 - --verbose 로 실행된 SQL을 확인하세요")
+        return 1
+    print("\n✅ 모든 API가 쿼리 수 상한 이내입니다")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+# backend/repair_project_counts.py
+"""
+프로젝트 태스크 개수 재계산 (정합성 복구)
+
+projects.open_count / done_count 는 태스크 쓰기마다 증감으로 갱신됩니다.
+직접 SQL 로 고친 데이터 등으로 실제 태스크 수와 어긋난 프로젝트를 찾아 고칩니다.
+
+- 프로젝트 id 순으로 --batch-size 개씩: 행 잠금 → tasks 집계 → 어긋난 것만 UPDATE → 커밋
+  (배치마다 짧은 트랜잭션이라 운영 중에 실행해도 됨, --sleep 으로 배치 사이 쉬기)
+- 고친 프로젝트의 유저는 캐시 무효화 + projects.repaired 이벤트 발행 (API 워커에 전달하려면 REDIS_URL)
+- 결과(확인한 프로젝트 수, 고친 프로젝트 목록)를 JSON으로 출력
+- 어긋난 프로젝트가 있으면 종료 코드 1 (--dry-run 으로 주기적 점검에 사용)
+
+사용법:
+  python repair_project_counts.py                     # 전체 고치기
+  python repair_project_counts.py --dry-run           # 확인만
+  python repair_project_counts.py --user test@worklog.com --batch-size 200 --sleep 0.1
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from app.core.database import SessionLocal
+from app.core.events import event_broker, notify_users
+from app.models import User
+from app.services.project_service import ProjectService
+
+
+async def repair(db, args, user_id) -> tuple:
+    """배치 반복 → (확인한 프로젝트 수, 어긋난 프로젝트 목록)"""
+    checked = 0
+    drifted = []
+    after_id = None
+    try:
+        while True:
+            batch = ProjectService.repair_counts(
+                db, after_id=after_id, limit=args.batch_size, user_id=user_id, dry_run=args.dry_run
+            )
+            checked += batch["checked"]
+            drifted.extend(batch["drifted"])
+            if not args.dry_run:
+                await notify_users(
+                    dict.fromkeys(row["user_id"] for row in batch["drifted"]), "projects.repaired"
+                )
+            after_id = batch["next_after"]
+            if after_id is None:
+                break
+            if args.sleep:
+                await asyncio.sleep(args.sleep)
+    finally:
+        await event_broker.shutdown()
+    return checked, drifted
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="프로젝트 태스크 개수 재계산")
+    parser.add_argument("--user", help="이 이메일 유저의 프로젝트만")
+    parser.add_argument("--batch-size", type=int, default=500, help="트랜잭션 1번에 확인할 프로젝트 수")
+    parser.add_argument("--sleep", type=float, default=0.0, help="배치 사이 대기 (초)")
+    parser.add_argument("--dry-run", action="store_true", help="고치지 않고 어긋난 프로젝트만 출력")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        user_id = None
+        if args.user:
+            user = db.query(User).filter(User.email == args.user).first()
+            if user is None:
+                print(f"❌ 유저를 찾을 수 없습니다: {args.user}", file=sys.stderr)
+                return 2
+            user_id = user.id
+
+        start = time.perf_counter()
+        checked, drifted = asyncio.run(repair(db, args, user_id))
+    finally:
+        db.close()
+
+    print(json.dumps({
+        "dry_run": args.dry_run,
+        "checked": checked,
+        "drifted": len(drifted),
+        "projects": [{**row, "id": str(row["id"]), "user_id": str(row["user_id"])} for row in drifted],
+        "elapsed_s": round(time.perf_counter() - start, 3),
+    }, ensure_ascii=False, indent=2))
+    return 1 if drifted and args.dry_run else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
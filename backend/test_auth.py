@@ -5,8 +5,12 @@
 사용법:
   1. 터미널 1: uvicorn main:app --reload --host 0.0.0.0 --port 8080
   2. 터미널 2: python test_auth.py
+
+해싱 중 DB 연결 점유 검사는 서버 없이 앱을 직접 실행합니다 (DATABASE_URL 의 DB 사용).
 """
+import asyncio
 import sys
+import uuid
 
 try:
     import httpx
@@ -75,9 +79,77 @@ def test_me(token: str):
     return False
 
 
+def test_hash_releases_connection():
+    """signup / login 이 bcrypt 해싱을 기다리는 동안 DB 연결을 풀에 반환하는지 (재해싱 저장 포함)"""
+    print("\n📌 해싱 중 DB 연결 점유 (signup / login, 서버 없이)")
+    from fastapi.testclient import TestClient
+
+    from app.core.config import settings
+    from app.core.database import SessionLocal, get_pool_status
+    from app.core.security import password_hasher
+    from app.main import app
+    from app.models import User
+
+    held = []
+
+    def checked_out() -> int:
+        return sum(pool["checked_out"] for pool in get_pool_status().values())
+
+    def record(fn):
+        async def wrapper(*args):
+            held.append((fn.__name__, checked_out()))
+            # 다른 요청이 끼어들 틈을 주고 한 번 더 확인
+            await asyncio.sleep(0.01)
+            held.append((fn.__name__, checked_out()))
+            return await fn(*args)
+        return wrapper
+
+    email = f"pool-{uuid.uuid4().hex[:8]}@worklog.com"
+    rounds = settings.BCRYPT_ROUNDS
+    password_hasher.hash = record(password_hasher.hash)
+    password_hasher.verify = record(password_hasher.verify)
+    try:
+        with TestClient(app) as client:
+            settings.BCRYPT_ROUNDS = 4
+            signup = client.post(
+                "/api/auth/signup",
+                json={"email": email, "username": email.split("@")[0], "password": "test1234"},
+            )
+            # cost 를 바꿔서 로그인 → 재해싱 (해싱 중 연결 반환 뒤 다시 가져와 저장)
+            settings.BCRYPT_ROUNDS = 5
+            login = client.post("/api/auth/login", data={"username": email, "password": "test1234"})
+    finally:
+        settings.BCRYPT_ROUNDS = rounds
+        del password_hasher.hash, password_hasher.verify
+
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.email == email).one_or_none()
+        rehashed = user is not None and user.hashed_password.startswith("$2b$05$")
+        if user is not None:
+            db.delete(user)
+            db.commit()
+    finally:
+        db.close()
+
+    print(f"   signup: {signup.status_code}, login: {login.status_code}, 재해싱 저장: {rehashed}")
+    print(f"   해싱 중 사용 중인 연결: {held}")
+    ok = (
+        signup.status_code == 201
+        and login.status_code == 200
+        and rehashed
+        and len(held) == 6
+        and all(count == 0 for _, count in held)
+    )
+    print("   ✅ 통과" if ok else "   ❌ 실패")
+    return ok
+
+
 if __name__ == "__main__":
     print("🔍 WorkLog 인증 API 테스트")
-    print(f"   BASE_URL = {BASE_URL}")
+    test_hash_releases_connection()
+
+    print(f"\n   BASE_URL = {BASE_URL}")
 
     try:
         # 서버 살아있는지 확인
@@ -0,0 +1,113 @@
+# backend/test_projects.py
+"""
+프로젝트 API 테스트 (서버 실행 중일 때 사용)
+
+사용법:
+  1. 터미널 1: uvicorn main:app --reload --host 0.0.0.0 --port 8080
+  2. 터미널 2: python test_projects.py
+"""
+import sys
+
+try:
+    import httpx
+except ImportError:
+    print("httpx가 필요합니다: pip install httpx")
+    sys.exit(1)
+
+BASE_URL = "http://localhost:8080"
+
+
+def get_token():
+    """로그인해서 토큰 획득"""
+    r = httpx.post(
+        f"{BASE_URL}/api/auth/login",
+        data={"username": "test@worklog.com", "password": "test1234"},
+        timeout=10.0,
+    )
+    if r.status_code != 200:
+        print("⚠️ 로그인 실패. 먼저 test_auth.py로 회원가입 후 실행하세요.")
+        return None
+    return r.json().get("access_token")
+
+
+def test_create_project(token: str):
+    """프로젝트 생성"""
+    print("\n📌 POST /api/projects")
+    r = httpx.post(
+        f"{BASE_URL}/api/projects",
+        json={"name": "테스트 프로젝트", "description": "test_projects.py에서 생성"},
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=10.0,
+    )
+    print(f"   상태: {r.status_code}")
+    if r.status_code in (200, 201):
+        data = r.json()
+        print(f"   id: {data.get('id')}, color: {data.get('color')}")
+        return data.get("id")
+    print(f"   응답: {r.text}")
+    return None
+
+
+def test_update_project_null_fields(token: str, project_id: str):
+    """name / color / archived 에 null 을 보내면 422 (저장되지 않고 이후 조회도 정상)"""
+    print("\n📌 PUT /api/projects/{id} (null 필드)")
+    headers = {"Authorization": f"Bearer {token}"}
+    ok = True
+    for field in ("name", "color", "archived"):
+        r = httpx.put(
+            f"{BASE_URL}/api/projects/{project_id}",
+            json={field: None},
+            headers=headers,
+            timeout=10.0,
+        )
+        print(f"   {field}=null → 상태: {r.status_code}")
+        ok = ok and r.status_code == 422
+
+    for url in (f"{BASE_URL}/api/projects/{project_id}", f"{BASE_URL}/api/projects"):
+        r = httpx.get(url, headers=headers, timeout=10.0)
+        print(f"   GET {url.replace(BASE_URL, '')} → 상태: {r.status_code}")
+        ok = ok and r.status_code == 200
+
+    print("   ✅ 통과" if ok else "   ❌ 실패")
+    return ok
+
+
+def test_delete_project(token: str, project_id: str):
+    """프로젝트 삭제"""
+    print("\n📌 DELETE /api/projects/{id}")
+    r = httpx.delete(
+        f"{BASE_URL}/api/projects/{project_id}",
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=10.0,
+    )
+    print(f"   상태: {r.status_code}")
+    if r.status_code in (200, 204):
+        print("   삭제 완료")
+        return True
+    print(f"   응답: {r.text}")
+    return False
+
+
+if __name__ == "__main__":
+    print("🔍 WorkLog 프로젝트 API 테스트")
+    print(f"   BASE_URL = {BASE_URL}")
+
+    try:
+        r = httpx.get(f"{BASE_URL}/health", timeout=2.0)
+        if r.status_code != 200:
+            print("⚠️ 서버가 응답하지 않습니다. uvicorn main:app --reload --host 0.0.0.0 --port 8080")
+            sys.exit(1)
+    except httpx.ConnectError:
+        print("⚠️ 서버에 연결할 수 없습니다. uvicorn main:app --reload --host 0.0.0.0 --port 8080")
+        sys.exit(1)
+
+    token = get_token()
+    if not token:
+        sys.exit(1)
+
+    project_id = test_create_project(token)
+    if project_id:
+        test_update_project_null_fields(token, project_id)
+        test_delete_project(token, project_id)
+
+    print("\n✅ 테스트 완료")
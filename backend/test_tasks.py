@@ -108,6 +108,38 @@ def test_update_task(token: str, task_id: str):
     return False
 
 
+def test_update_task_null_fields(token: str, task_id: str):
+    """title / status / priority / order 에 null 을 보내면 422 (PUT 과 bulk update 모두, 저장되지 않음)"""
+    print("\n📌 PUT /api/tasks/{id}, POST /api/tasks/bulk (null 필드)")
+    headers = {"Authorization": f"Bearer {token}"}
+    before = httpx.get(f"{BASE_URL}/api/tasks/{task_id}", headers=headers, timeout=10.0).json()
+    ok = True
+    for field in ("title", "status", "priority", "order"):
+        r = httpx.put(
+            f"{BASE_URL}/api/tasks/{task_id}",
+            json={field: None},
+            headers=headers,
+            timeout=10.0,
+        )
+        bulk = httpx.post(
+            f"{BASE_URL}/api/tasks/bulk",
+            json={"operations": [{"op": "update", "id": task_id, "changes": {field: None}}]},
+            headers=headers,
+            timeout=10.0,
+        )
+        print(f"   {field}=null → PUT: {r.status_code}, bulk: {bulk.status_code}")
+        ok = ok and r.status_code == 422 and bulk.status_code == 422
+
+    r = httpx.get(f"{BASE_URL}/api/tasks/{task_id}", headers=headers, timeout=10.0)
+    after = r.json()
+    unchanged = all(after.get(field) == before.get(field) for field in ("title", "status", "priority", "order"))
+    print(f"   GET /api/tasks/{{id}} → 상태: {r.status_code}, 변경 없음: {unchanged}")
+    ok = ok and r.status_code == 200 and unchanged
+
+    print("   ✅ 통과" if ok else "   ❌ 실패")
+    return ok
+
+
 def test_delete_task(token: str, task_id: str):
     """태스크 삭제"""
     print(f"\n📌 DELETE /api/tasks/{{id}}")
@@ -146,6 +178,7 @@ if __name__ == "__main__":
     if task_id:
         test_get_task(token, task_id)
         test_update_task(token, task_id)
+        test_update_task_null_fields(token, task_id)
         test_delete_task(token, task_id)
 
     print("\n✅ 테스트 완료")
@@ -56,7 +56,7 @@ export default function TasksPage() {
         <div>
           <h1 className="text-3xl font-bold text-gray-900">모든 태스크</h1>
           <p className="text-gray-600 mt-1">
-            총 {data?.total || 0}개의 태스크
+            총 {data?.total ?? 0}개의 태스크
           </p>
         </div>
         <CreateTaskDialog />
@@ -143,7 +143,7 @@ export default function TasksPage() {
           />
 
           {/* 페이지네이션 */}
-          {data && data.total > limit && (
+          {data && data.total !== null && data.total > limit && (
             <div className="flex items-center justify-center gap-2 mt-6">
               <Button
                 variant="outline"
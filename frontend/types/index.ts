@@ -17,6 +17,7 @@ export interface User {
 export interface Task {
   id: string;
   user_id: string;
+  project_id: string | null;
   title: string;
   description: string | null;
   status: TaskStatus;
@@ -26,6 +27,7 @@ export interface Task {
   order: number;
   created_at: string;
   updated_at: string | null;
+  archived?: boolean; // include_archived=true 로 조회한 보관 태스크
 }
 
 export interface TaskCreate {
@@ -34,6 +36,7 @@ export interface TaskCreate {
   status?: TaskStatus;
   priority?: TaskPriority;
   due_date?: string | null;
+  project_id?: string | null;
 }
 
 export interface TaskUpdate {
@@ -42,15 +45,90 @@ export interface TaskUpdate {
   status?: TaskStatus;
   priority?: TaskPriority;
   due_date?: string | null;
+  project_id?: string | null; // null이면 프로젝트에서 빼기
   order?: number;
 }
 
+export interface Project {
+  id: string;
+  user_id: string;
+  name: string;
+  description: string | null;
+  color: string; // HEX (#6366f1)
+  archived: boolean;
+  open_count: number; // 미완료 (todo + doing)
+  done_count: number;
+  created_at: string;
+  updated_at: string | null;
+}
+
+export interface ProjectCreate {
+  name: string;
+  description?: string | null;
+  color?: string;
+}
+
+export interface ProjectUpdate {
+  name?: string;
+  description?: string | null;
+  color?: string;
+  archived?: boolean;
+}
+
 export interface PaginatedResponse<T> {
   items: T[];
-  total: number;
+  total: number | null; // 커서 모드(cursor 전달)에서는 null
   skip: number;
   limit: number;
   has_more: boolean;
+  next_cursor: string | null;
+}
+
+export interface TaskChangesResponse {
+  changed: Task[];
+  deleted: string[];
+  watermark: string; // 다음 요청의 since
+  has_more: boolean;
+}
+
+export type Mood = "great" | "good" | "okay" | "bad";
+
+export interface DailyNoteSummary {
+  date: string; // YYYY-MM-DD
+  mood: Mood | null;
+}
+
+export interface DailyNote extends DailyNoteSummary {
+  id: string;
+  user_id: string;
+  content: string | null; // 마크다운
+  revision: number; // 본문이 바뀔 때마다 증가 (부분 수정의 base_revision)
+  created_at: string;
+  updated_at: string | null;
+}
+
+export interface DailyNoteUpsert {
+  content?: string | null;
+  mood?: Mood | null;
+}
+
+// pos 위치에서 delete 글자를 지우고 insert 를 넣음 (유니코드 code point 단위 - JS 인덱스 아님)
+export interface DailyNotePatchOp {
+  pos: number;
+  delete?: number;
+  insert?: string;
+}
+
+export interface DailyNotePatch {
+  base_revision: number;
+  ops: DailyNotePatchOp[];
+}
+
+export interface DailyNotePatchResponse {
+  date: string;
+  revision: number;
+  content_length: number;
+  updated_at: string | null;
 }
 
 export interface LoginRequest {